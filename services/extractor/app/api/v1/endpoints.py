@@ -1,6 +1,8 @@
 # argus/services/extractor/app/api/v1/endpoints.py
 
-from fastapi import APIRouter, Request, HTTPException, Depends  # MODIFIED
+from fastapi import APIRouter, Request, HTTPException, Depends, Query  # MODIFIED
+from fastapi.responses import StreamingResponse
+from starlette.datastructures import State
 from loguru import logger
 from playwright.async_api import (
     async_playwright,
@@ -9,10 +11,26 @@ from playwright.async_api import (
 from pathlib import Path
 from datetime import datetime
 from urllib.parse import urlparse
+import asyncio
 import json
+from typing import Dict, Any, List, Optional, Tuple
 
-from app.api.v1.schemas import ExtractionRequest, ExtractionResponse
+from app.api.v1.schemas import (
+    BatchExtractionRequest,
+    BatchExtractionResult,
+    ExtractionRequest,
+    ExtractionResponse,
+)
 from app.core.analyzer import ProductPageAnalyzer
+from app.core.analysis_pool import (
+    AnalysisPool,
+    AnalysisTimeoutError,
+    PoolSaturatedError,
+    PoolUnavailableError,
+)
+from app.core.metrics import observe_timings
+from app.core.result_cache import ResultCache
+from app.core.wrappers import WrapperStore
 from app.config import settings
 from .security import get_api_key
 
@@ -21,7 +39,9 @@ router = APIRouter(dependencies=[Depends(get_api_key)])
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0.0.0 Safari/537.36"
 
 
-@router.post("/extract", response_model=ExtractionResponse)
+@router.post(
+    "/extract", response_model=ExtractionResponse, response_model_exclude_unset=True
+)
 async def extract_data(request: Request, payload: ExtractionRequest):
     """
     (NEEDS KEY) Extracts structured data from a product page.
@@ -30,11 +50,11 @@ async def extract_data(request: Request, payload: ExtractionRequest):
     - If 'html_content' is null or empty, the 'url' parameter is used to fetch
       the page content via Playwright, which is then analyzed.
     """
-    # Get the analyzer instance that was loaded on startup
-    analyzer: ProductPageAnalyzer = getattr(request.app.state, "analyzer", None)
+    # Get the analysis pool that was started on startup
+    analysis_pool: AnalysisPool = getattr(request.app.state, "analysis_pool", None)
 
-    if not analyzer:
-        logger.error("API: /extract called but analyzer is not available in app.state.")
+    if not analysis_pool:
+        logger.error("API: /extract called but analysis pool is not available in app.state.")
         raise HTTPException(
             status_code=503,  # Service Unavailable
             detail="The analysis service is not ready. The analyzer failed to load on startup.",
@@ -42,6 +62,38 @@ async def extract_data(request: Request, payload: ExtractionRequest):
 
     logger.info(f"API: Received extraction request for URL: {payload.url}")
 
+    extracted_data, timings = await _extract_page(request.app.state, payload)
+
+    # Return the successful response
+    response = ExtractionResponse(data=extracted_data, message="Extraction successful")
+    if payload.include_timings:
+        response.timings = timings
+    if timings.get("skipped_parsers"):
+        response.skipped_parsers = timings["skipped_parsers"]
+    return response
+
+
+async def _extract_page(
+    app_state: State, payload: ExtractionRequest
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Fetches (if needed) and analyzes one page; returns the data and its timings.
+    Identical pages are served from the result cache without a new analysis.
+    Every failure is raised as an HTTPException with the matching status code.
+    """
+    analysis_pool: AnalysisPool = app_state.analysis_pool
+    result_cache: Optional[ResultCache] = getattr(app_state, "result_cache", None)
+    analyzer: Optional[ProductPageAnalyzer] = getattr(app_state, "analyzer", None)
+
+    # Reject unknown fields before doing any work
+    if payload.fields is not None and analyzer is not None:
+        unknown_fields = analyzer.validate_fields(payload.fields)
+        if unknown_fields:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unknown fields requested: {unknown_fields}.",
+            )
+
     html_content = payload.html_content
     # Ensure url is a string for all operations
     url = str(payload.url)
@@ -85,13 +137,37 @@ async def extract_data(request: Request, payload: ExtractionRequest):
         logger.info(f"Using provided html_content for {url}.")
 
     # At this point, html_content is populated either from the payload or Playwright
+    cache_key = None
+    if result_cache is not None and result_cache.enabled:
+        cache_key = result_cache.make_key(
+            html_content, url, payload.use_llm, payload.fields
+        )
+        if result_cache.has_disk_tier:
+            cached = await asyncio.to_thread(result_cache.get, cache_key)
+        else:
+            cached = result_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"API: Serving {url} from the result cache.")
+            extracted_data, timings = cached
+            return extracted_data, {**timings, "cache_hit": True}
+
     try:
-        # Call the analyze method on the shared analyzer instance
-        extracted_data = analyzer.analyze(
+        # Run the analysis in the worker pool, so the event loop stays responsive
+        extracted_data, timings = await analysis_pool.analyze(
             html_content=html_content,
             url=url,
             use_llm=payload.use_llm,  # Pass the flag here
+            fields=payload.fields,
+            time_budget_ms=payload.time_budget_ms,
         )
+        observe_timings(timings)
+
+        # A result with skipped parsers is incomplete, so it is not cached
+        if cache_key is not None and not timings["skipped_parsers"]:
+            if result_cache.has_disk_tier:
+                await asyncio.to_thread(result_cache.put, cache_key, (extracted_data, timings))
+            else:
+                result_cache.put(cache_key, (extracted_data, timings))
 
         # Log extracted data in development mode
         # Check environment setting (adjust 'development' if your setting is different)
@@ -116,9 +192,27 @@ async def extract_data(request: Request, payload: ExtractionRequest):
                 logger.warning(f"Could not save extracted_data to file. Reason: {e}")
         # End save data
 
-        # Return the successful response
-        return ExtractionResponse(data=extracted_data, message="Extraction successful")
+        return extracted_data, {**timings, "cache_hit": False}
 
+    except PoolSaturatedError as e:
+        logger.warning(f"API: Rejected {url}, the analysis pool is saturated: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail="Too many concurrent extractions. Please retry later.",
+            headers={"Retry-After": "1"},
+        )
+    except PoolUnavailableError as e:
+        logger.error(f"API: Analysis pool unavailable for {url}: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="The analysis service is temporarily unavailable.",
+        )
+    except AnalysisTimeoutError as e:
+        logger.error(f"API: {e}")
+        raise HTTPException(
+            status_code=504,
+            detail=f"Timeout: The analysis of {url} took too long.",
+        )
     except Exception as e:
         logger.error(
             f"API: An unexpected error occurred during analysis for {url}: {e}",
@@ -127,3 +221,147 @@ async def extract_data(request: Request, payload: ExtractionRequest):
         raise HTTPException(
             status_code=500, detail="An internal error occurred during analysis."
         )
+
+
+@router.post("/extract/batch")
+async def extract_batch(request: Request, payload: BatchExtractionRequest):
+    """
+    (NEEDS KEY) Extracts structured data from many product pages in one call.
+
+    The pages are analyzed concurrently, using every worker of the analysis pool.
+    The response is a stream of NDJSON lines (one BatchExtractionResult per page),
+    written as soon as each page is done. A failing page produces a line with its
+    status code and error, and does not fail the rest of the batch.
+    """
+    analysis_pool: AnalysisPool = getattr(request.app.state, "analysis_pool", None)
+
+    if not analysis_pool:
+        logger.error(
+            "API: /extract/batch called but analysis pool is not available in app.state."
+        )
+        raise HTTPException(
+            status_code=503,  # Service Unavailable
+            detail="The analysis service is not ready. The analyzer failed to load on startup.",
+        )
+
+    if len(payload.items) > settings.batch.max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"A batch may contain at most {settings.batch.max_items} items, got {len(payload.items)}.",
+        )
+
+    logger.info(f"API: Received batch extraction request with {len(payload.items)} items.")
+
+    # Never submit more pages at once than there are workers, so a batch does not
+    # fill the queue and starve (or trigger 429s for) the other requests.
+    semaphore = asyncio.Semaphore(analysis_pool.workers)
+
+    async def extract_item(index: int, item: ExtractionRequest) -> BatchExtractionResult:
+        async with semaphore:
+            try:
+                data, timings = await _extract_page(request.app.state, item)
+                return BatchExtractionResult(
+                    index=index,
+                    url=str(item.url),
+                    status_code=200,
+                    data=data,
+                    timings=timings if item.include_timings else None,
+                    skipped_parsers=timings.get("skipped_parsers") or None,
+                )
+            except HTTPException as e:
+                return BatchExtractionResult(
+                    index=index,
+                    url=str(item.url),
+                    status_code=e.status_code,
+                    error=str(e.detail),
+                )
+
+    async def stream_results():
+        tasks = [
+            asyncio.create_task(extract_item(index, item))
+            for index, item in enumerate(payload.items)
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                result = await finished
+                yield result.model_dump_json(exclude_none=True) + "\n"
+        finally:
+            # Stop the remaining pages if the client went away
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
+@router.get("/debug/cache", tags=["Debug"])
+async def get_result_cache_stats(request: Request):
+    """(NEEDS KEY) Shows the size and the hit/miss counters of the result cache."""
+    result_cache: Optional[ResultCache] = getattr(request.app.state, "result_cache", None)
+    if result_cache is None:
+        raise HTTPException(status_code=503, detail="The result cache is not available.")
+    return result_cache.describe()
+
+
+@router.get("/debug/plan", tags=["Debug"])
+async def get_execution_plan(
+    request: Request,
+    tier: Optional[str] = None,
+    fields: Optional[List[str]] = Query(default=None),
+):
+    """
+    (NEEDS KEY) Shows the precompiled module execution plan.
+
+    - Without parameters, it returns the plan used for regular requests.
+    - 'tier' and 'fields' select (and compile, if needed) a specific plan.
+    """
+    analyzer: ProductPageAnalyzer = getattr(request.app.state, "analyzer", None)
+    if not analyzer:
+        raise HTTPException(
+            status_code=503,
+            detail="The analysis service is not ready. The analyzer failed to load on startup.",
+        )
+
+    tier = tier or ("pro" if analyzer.is_pro_activated else "free")
+    try:
+        plan = analyzer.execution_plans.get(tier, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"plan": plan.describe(), "compiled_plans": analyzer.execution_plans.describe()}
+
+
+def _get_wrapper_store(request: Request) -> WrapperStore:
+    analyzer: ProductPageAnalyzer = getattr(request.app.state, "analyzer", None)
+    if not analyzer:
+        raise HTTPException(
+            status_code=503,
+            detail="The analysis service is not ready. The analyzer failed to load on startup.",
+        )
+    if analyzer.wrappers is None:
+        raise HTTPException(status_code=404, detail="Wrapper induction is not enabled.")
+    return analyzer.wrappers
+
+
+@router.get("/admin/wrappers", tags=["Admin"])
+async def get_wrappers(request: Request, domain: Optional[str] = None):
+    """
+    (NEEDS KEY) Shows the induced wrappers: per domain the active rules, the
+    candidate rules that are still collecting support, and the hit, validation
+    and drift counters. 'domain' limits the answer to one domain.
+    """
+    wrapper_store = _get_wrapper_store(request)
+    wrappers = await asyncio.to_thread(wrapper_store.describe, domain)
+    if domain is not None and not wrappers:
+        raise HTTPException(status_code=404, detail=f"No wrapper is known for '{domain}'.")
+    return {"wrappers": wrappers}
+
+
+@router.delete("/admin/wrappers", tags=["Admin"])
+async def reset_wrappers(request: Request, domain: Optional[str] = None):
+    """
+    (NEEDS KEY) Forgets the wrapper of 'domain', or of every domain without it.
+    Its pages run the full analysis again until a new wrapper is induced.
+    """
+    wrapper_store = _get_wrapper_store(request)
+    removed = await asyncio.to_thread(wrapper_store.reset, domain)
+    return {"removed": removed}
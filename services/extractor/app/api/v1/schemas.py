@@ -1,7 +1,7 @@
 # app/api/v1/schemas.py
 
 from pydantic import BaseModel, HttpUrl, Field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 class ExtractionRequest(BaseModel):
@@ -13,6 +13,20 @@ class ExtractionRequest(BaseModel):
         default=False,
         description="Enable (true) or disable (false) the LLM parser for specifications. Default: false.",
     )
+    fields: Optional[List[str]] = Field(
+        default=None,
+        min_length=1,
+        description="Only extract these fields (e.g. ['price', 'availability']). Default: all fields.",
+    )
+    time_budget_ms: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Latency budget for this request in milliseconds. Once it runs out, low-priority parsers are skipped. Default: the configured budget.",
+    )
+    include_timings: bool = Field(
+        default=False,
+        description="Add a 'timings' block (module and parser durations) to the response. Default: false.",
+    )
 
 
 class ExtractionResponse(BaseModel):
@@ -23,3 +37,37 @@ class ExtractionResponse(BaseModel):
 
     data: Dict[str, Any]
     message: str
+    timings: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Module and parser durations in milliseconds. Only present when 'include_timings' is true.",
+    )
+    skipped_parsers: Optional[List[str]] = Field(
+        default=None,
+        description="Parsers that were skipped because the time budget ran out. Only present when any were skipped.",
+    )
+
+
+class BatchExtractionRequest(BaseModel):
+    """The request body for the /extract/batch endpoint."""
+
+    items: List[ExtractionRequest] = Field(
+        ...,
+        min_length=1,
+        description="The pages to extract. Each item is handled like an /extract request.",
+    )
+
+
+class BatchExtractionResult(BaseModel):
+    """
+    One line of the /extract/batch NDJSON stream.
+    Lines are written as soon as a page is done, so they can arrive out of order;
+    'index' refers to the position of the item in the request.
+    """
+
+    index: int
+    url: str
+    status_code: int
+    data: Optional[Dict[str, Any]] = None
+    timings: Optional[Dict[str, Any]] = None
+    skipped_parsers: Optional[List[str]] = None
+    error: Optional[str] = None
@@ -5,7 +5,7 @@ import re
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import BaseModel, Field, field_validator
 from pathlib import Path
-from typing import List, Any, Tuple, Dict
+from typing import List, Any, Tuple, Dict, Literal, Optional
 
 # Define the project's root directory
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -61,12 +61,149 @@ class ModelsSettings(BaseModel):
 
 class LanguageSettings(BaseModel):
     default: str
+    # Characters of page text that statistical detection looks at, when the page
+    # declares no language (<html lang>, og:locale or content-language)
+    detection_sample_chars: int = Field(default=2000, ge=100)
+    # How long a detected language is reused for other pages of the same domain
+    domain_cache_ttl_seconds: int = Field(default=3600, ge=0)
+    domain_cache_max_entries: int = Field(default=10000, ge=1)
 
 
 class AuthSettings(BaseModel):
     api_key: str
 
 
+class ExecutionSettings(BaseModel):
+    # "sequential" runs one module at a time, "parallel" runs every
+    # dependency level concurrently in a thread pool.
+    mode: Literal["sequential", "parallel"] = "sequential"
+    max_workers: int = Field(default=8, ge=1)
+
+
+class AnalysisPoolSettings(BaseModel):
+    # Run the analyses in worker processes. When disabled, they run in a
+    # thread pool inside the API process (still off the event loop).
+    enabled: bool = True
+    # Number of workers; empty means one per CPU core
+    workers: Optional[int] = Field(default=None, ge=1)
+    # Requests that may wait for a free worker before new ones get a 429
+    queue_size: int = Field(default=16, ge=0)
+    timeout_seconds: float = Field(default=30.0, gt=0)
+
+
+class ResultCacheSettings(BaseModel):
+    enabled: bool = True
+    # Entries kept in memory (least recently used are evicted first)
+    max_entries: int = Field(default=1024, ge=1)
+    # Optional SQLite tier that survives restarts
+    disk_enabled: bool = False
+    disk_path: str = "cache/results.sqlite3"
+    disk_max_entries: int = Field(default=100_000, ge=1)
+    # Bump to invalidate every cached result by hand
+    version: str = "1"
+    # Regexes for volatile tokens that are removed from the HTML before hashing
+    volatile_patterns: List[str] = Field(default_factory=list)
+
+    @field_validator("volatile_patterns")
+    def valid_regexes(cls, v):
+        for pattern in v:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"'{pattern}' is not a valid regular expression: {e}")
+        return v
+
+
+class TimeBudgetSettings(BaseModel):
+    # Latency budget per analysis in milliseconds; empty means unlimited.
+    # Once it runs out, low-priority parsers (NLP, regex body, fallbacks) are skipped.
+    default_ms: Optional[int] = Field(default=None, gt=0)
+
+
+class AdaptiveParsersSettings(BaseModel):
+    # Learn per domain which parser produces each field and try that parser first
+    enabled: bool = False
+    # Weight kept by older observations on every new one (lower adapts faster)
+    decay: float = Field(default=0.9, gt=0, lt=1)
+    # Reordering only starts after this many (decayed) observations of a field on a domain
+    min_observations: float = Field(default=5.0, gt=0)
+    # ...and only if one parser produced the result on at least this share of them
+    min_confidence: float = Field(default=0.8, gt=0, le=1)
+    # Also leave out parsers that were tried often on the domain but never found anything
+    skip_unproductive: bool = False
+    # Domains that always run the full, fixed parser chain
+    disabled_domains: List[str] = Field(default_factory=list)
+    max_entries: int = Field(default=50000, ge=1)
+    # Persist the statistics in a local SQLite file
+    persist: bool = True
+    path: str = "cache/parser_stats.sqlite3"
+    flush_interval_seconds: float = Field(default=30.0, ge=0)
+
+
+class WrapperSettings(BaseModel):
+    # Induce per-domain extraction rules from full analyses and use them as a fast path
+    enabled: bool = False
+    # A wrapper is activated after the same rules were induced on this many pages in a row
+    min_support: int = Field(default=10, ge=1)
+    # Share of the wrapper hits that also run the full analysis to detect drift
+    drift_sample_rate: float = Field(default=0.05, ge=0, le=1)
+    # A wrapper is dropped after this many pages in a row failed its validation
+    max_validation_failures: int = Field(default=3, ge=1)
+    # Domains that always run the full analysis
+    disabled_domains: List[str] = Field(default_factory=list)
+    max_entries: int = Field(default=10000, ge=1)
+    path: str = "cache/wrappers.sqlite3"
+    # How often a process rereads a domain's wrapper (picks up other workers and resets)
+    refresh_seconds: float = Field(default=10.0, ge=0)
+    flush_interval_seconds: float = Field(default=30.0, ge=0)
+
+
+class HeadOnlySettings(BaseModel):
+    # Extract from the JSON-LD scripts and head meta tags alone, found with a regex
+    # scan of the HTML; the full analysis only runs when a required field is missing
+    enabled: bool = False
+    required_fields: List[str] = Field(
+        default_factory=lambda: ["title", "price", "image", "availability"]
+    )
+
+
+class IngestionSettings(BaseModel):
+    # Pages from this size on (in UTF-8 bytes) are parsed by the streaming builder,
+    # which drops svg, template, style and non-JSON-LD script subtrees while parsing.
+    # Meant for outliers: ordinary product pages stay well below it.
+    enabled: bool = True
+    streaming_threshold_bytes: int = Field(default=10 * 1024 * 1024, ge=0)
+    # Ceilings of a streamed page: the rest of the page is skipped once one is reached
+    max_nodes: int = Field(default=200000, ge=1)
+    max_bytes: int = Field(default=32 * 1024 * 1024, ge=1)
+    chunk_size: int = Field(default=64 * 1024, ge=1024)
+
+
+class DomSettings(BaseModel):
+    # The tree behind the DOM view of the ported parsers: a native lxml.html tree,
+    # or the BeautifulSoup raw DOM. lxml needs cssselect; bs4 is used without it.
+    # bs4 until every module is ported: the unported ones still parse the raw DOM,
+    # so with lxml a full analysis parses the page twice.
+    backend: Literal["lxml", "bs4"] = "bs4"
+
+
+class WarmUpSettings(BaseModel):
+    # Compile all pattern bundles and run a synthetic page through every analyzer
+    # before the service reports ready. The spaCy model is always preloaded.
+    enabled: bool = True
+
+
+class MemoryReportSettings(BaseModel):
+    # Trace allocations with tracemalloc and report the peak and retained bytes
+    # of every analysis. Slows analyses down noticeably; meant for sizing workers.
+    enabled: bool = False
+
+
+class BatchSettings(BaseModel):
+    # The maximum number of pages in one /extract/batch request
+    max_items: int = Field(default=100, ge=1)
+
+
 # The main Settings class
 class Settings(BaseSettings):
     """The main settings model using a custom YAML source."""
@@ -77,6 +214,20 @@ class Settings(BaseSettings):
     models: ModelsSettings
     field_aliases: Dict[str, List[str]] = Field(default_factory=dict)
     language: LanguageSettings
+    execution: ExecutionSettings = Field(default_factory=ExecutionSettings)
+    analysis_pool: AnalysisPoolSettings = Field(default_factory=AnalysisPoolSettings)
+    batch: BatchSettings = Field(default_factory=BatchSettings)
+    result_cache: ResultCacheSettings = Field(default_factory=ResultCacheSettings)
+    time_budget: TimeBudgetSettings = Field(default_factory=TimeBudgetSettings)
+    adaptive_parsers: AdaptiveParsersSettings = Field(
+        default_factory=AdaptiveParsersSettings
+    )
+    wrappers: WrapperSettings = Field(default_factory=WrapperSettings)
+    head_only: HeadOnlySettings = Field(default_factory=HeadOnlySettings)
+    ingestion: IngestionSettings = Field(default_factory=IngestionSettings)
+    dom: DomSettings = Field(default_factory=DomSettings)
+    warm_up: WarmUpSettings = Field(default_factory=WarmUpSettings)
+    memory_report: MemoryReportSettings = Field(default_factory=MemoryReportSettings)
 
     model_config = SettingsConfigDict(
         env_file=BASE_DIR / ".env",
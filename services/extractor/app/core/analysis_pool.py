@@ -0,0 +1,227 @@
+# argus/services/extractor/app/core/analysis_pool.py
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, List, Optional, Tuple
+from loguru import logger
+from app.config import settings
+
+# The analyzer of the current worker process (or of the API process in thread mode)
+_worker_analyzer = None
+# The warm-up report of the current worker process
+_worker_report: Dict[str, Any] = {}
+
+
+class PoolSaturatedError(Exception):
+    """Raised when every worker is busy and the submission queue is full."""
+
+
+class PoolUnavailableError(Exception):
+    """Raised when the pool is not running (not started, shut down or broken)."""
+
+
+class AnalysisTimeoutError(Exception):
+    """Raised when an analysis does not finish within the configured timeout."""
+
+
+def _init_worker(log_level: str):
+    """Runs once in every worker process: loads the analyzer and warms it up."""
+    global _worker_analyzer, _worker_report
+    logger.remove()
+    logger.add(sys.stderr, level=log_level)
+
+    # Imported here so the API process does not load the modules twice
+    from app.core.analyzer import ProductPageAnalyzer
+    from app.core.warm_up import warm_up_analyzer
+
+    started_at = time.perf_counter()
+    _worker_analyzer = ProductPageAnalyzer()
+    analyzer_ms = round((time.perf_counter() - started_at) * 1000, 3)
+    _worker_report = {"analyzer_ms": analyzer_ms, **warm_up_analyzer(_worker_analyzer)}
+    logger.info(f"Analysis Pool: Worker {os.getpid()} is ready.")
+
+
+def _warm_up() -> Tuple[int, Dict[str, Any]]:
+    return os.getpid(), _worker_report
+
+
+def _analyze(
+    html_content: str,
+    url: str,
+    use_llm: bool,
+    fields: Optional[List[str]],
+    time_budget_ms: Optional[int],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    return _worker_analyzer.analyze_with_timings(
+        html_content=html_content,
+        url=url,
+        use_llm=use_llm,
+        fields=fields,
+        time_budget_ms=time_budget_ms,
+    )
+
+
+class AnalysisPool:
+    """
+    Runs analyses off the event loop in a pool of worker processes, each with
+    its own ProductPageAnalyzer and preloaded spaCy model.
+
+    At most 'workers + queue_size' analyses are accepted at the same time; the
+    next one is rejected with PoolSaturatedError instead of queuing without limit.
+    When the pool is disabled, the analyses run in a thread pool inside the API
+    process instead, with the same limits.
+    """
+
+    def __init__(self, analyzer=None):
+        pool_settings = settings.analysis_pool
+        self.use_processes = pool_settings.enabled
+        self.workers = pool_settings.workers or os.cpu_count() or 1
+        self.capacity = self.workers + pool_settings.queue_size
+        self.timeout_seconds = pool_settings.timeout_seconds
+        self._analyzer = analyzer
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._restart_lock = threading.Lock()
+        # Guards '_executor' and '_closed', so a start that is still warming up
+        # cannot install its workers after the pool was shut down
+        self._state_lock = threading.Lock()
+        self._closed = False
+        # The warm-up report of every worker (by process id, or "api" in thread mode)
+        self.worker_reports: Dict[Any, Dict[str, Any]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def start(self):
+        """
+        Starts the workers and waits until every worker has loaded and warmed up its analyzer.
+        Raises PoolUnavailableError when the pool is shut down before the start completes.
+        """
+        if self.use_processes:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(settings.service.log_level.strip().upper(),),
+            )
+            self._install(executor)
+            # Workers are spawned on demand, so submit one task per worker to start them all
+            try:
+                self.worker_reports = dict(
+                    future.result()
+                    for future in [executor.submit(_warm_up) for _ in range(self.workers)]
+                )
+            except (CancelledError, RuntimeError) as e:
+                raise PoolUnavailableError(f"The analysis pool was shut down while starting: {e!r}")
+            logger.info(
+                f"Analysis Pool: Started {len(self.worker_reports)} worker processes "
+                f"(capacity: {self.capacity} requests)."
+            )
+        else:
+            from app.core.warm_up import warm_up_analyzer
+
+            global _worker_analyzer
+            _worker_analyzer = self._analyzer
+            self.worker_reports = {"api": warm_up_analyzer(self._analyzer)}
+            self._install(
+                ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="argus-analysis")
+            )
+            logger.info(
+                f"Analysis Pool: Process pool disabled, using {self.workers} threads "
+                f"(capacity: {self.capacity} requests)."
+            )
+
+    def _install(self, executor: Executor):
+        with self._state_lock:
+            if not self._closed:
+                self._executor = executor
+                return
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise PoolUnavailableError("The analysis pool was shut down while starting.")
+
+    def shutdown(self):
+        """
+        Stops the workers for good. Analyses that have not started yet are
+        cancelled, and a start that is still running does not install its workers.
+        """
+        with self._state_lock:
+            self._closed = True
+        self._stop_executor()
+
+    def _stop_executor(self):
+        with self._state_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _release(self, _future):
+        with self._lock:
+            self._in_flight -= 1
+
+    async def analyze(
+        self,
+        html_content: str,
+        url: str,
+        use_llm: bool,
+        fields: Optional[List[str]] = None,
+        time_budget_ms: Optional[int] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Runs one analysis in the pool and returns the extracted data and its timings.
+        Raises PoolSaturatedError, PoolUnavailableError or AnalysisTimeoutError.
+        """
+        if self._executor is None:
+            raise PoolUnavailableError("The analysis pool is not running.")
+
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                raise PoolSaturatedError(
+                    f"All {self.workers} workers are busy and {self._in_flight - self.workers} "
+                    f"requests are already waiting."
+                )
+            self._in_flight += 1
+
+        executor = self._executor
+        try:
+            future = executor.submit(
+                _analyze, html_content, url, use_llm, fields, time_budget_ms
+            )
+        except (BrokenProcessPool, RuntimeError) as e:
+            with self._lock:
+                self._in_flight -= 1
+            if isinstance(e, BrokenProcessPool):
+                await asyncio.to_thread(self._restart, executor)
+            raise PoolUnavailableError(f"The analysis pool is not available: {e}")
+
+        # The slot is only freed when the worker is really done, even after a timeout,
+        # so a slow page keeps counting against the capacity while it still runs.
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            raise AnalysisTimeoutError(
+                f"The analysis of {url} did not finish within {self.timeout_seconds} seconds."
+            )
+        except BrokenProcessPool as e:
+            await asyncio.to_thread(self._restart, executor)
+            raise PoolUnavailableError(f"The analysis pool is not available: {e}")
+
+    def _restart(self, broken_executor: Executor):
+        """Replaces a broken pool, unless another request already did."""
+        with self._restart_lock:
+            if self._executor is not broken_executor:
+                return
+            logger.error("Analysis Pool: A worker process died, restarting the pool.")
+            self._stop_executor()
+            self.start()
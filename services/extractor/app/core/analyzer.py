@@ -1,18 +1,59 @@
 # argus/services/extractor/app/core/analyzer.py
 
-from typing import Dict, Any, List
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
-from langdetect import detect
-from bs4 import BeautifulSoup
-from app.core.context import shared_context
-from app.core.dependency_resolver import DependencyResolver
+from app.core.context import (
+    shared_context,
+    ExtractionContext,
+    ProcessedElementsRegistry,
+)
+from app.core.execution_plan import ExecutionPlan, ExecutionPlanCache
+from app.core.timings import MemoryProbe, RequestTimings, TimeBudget
+from app.core.result_cache import compute_code_version
 from app.core.types import ExtractionResult, FieldExtractionStatus
-from app.core.models import get_product_data_model, _BaseProductData
-from app.utils.html_processor import clean_html_for_extraction
+from app.core.models import get_product_data_model, Scoreboard
+from app.core.document import PageDocument, RAW_DOM
+from app.core.language import LanguageResolver
+from app.core.parser_stats import ParserStatsStore
+from app.core.wrappers import WrapperRun, WrapperStore, OUTCOME_HIT as WRAPPER_HIT
+from app.core.head_only import (
+    scan_head,
+    OUTCOME_FALLBACK as HEAD_ONLY_FALLBACK,
+    OUTCOME_HIT as HEAD_ONLY_HIT,
+    OUTCOME_NO_DATA as HEAD_ONLY_NO_DATA,
+)
 from app.utils.shared_resources import get_resources
 from app.core.module_loader import discover_and_load_modules
 from app.config import settings
 
+# Settings sections that cannot change what is extracted from a page. Every
+# other section is part of the module set version, so cached results of an
+# older configuration are not served after it changed. ('execution' is not
+# neutral: parallel modules of one level do not see each other's claims.)
+RESULT_NEUTRAL_SETTINGS = {
+    "service",
+    "auth",
+    "analysis_pool",
+    "batch",
+    "result_cache",
+    "warm_up",
+    "memory_report",
+}
+
+
+def _settings_version() -> str:
+    """Hashes the settings that affect extraction results."""
+    relevant_settings = settings.model_dump(mode="json", exclude=RESULT_NEUTRAL_SETTINGS)
+    return hashlib.sha256(
+        json.dumps(relevant_settings, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:8]
+
 
 class ProductPageAnalyzer:
     """
@@ -34,10 +75,41 @@ class ProductPageAnalyzer:
 
         # 2. Now create the data model based on the discovered modules
         self.ProductDataModel = get_product_data_model(all_discovered_modules)
+        self.product_fields = frozenset(self.ProductDataModel.model_fields)
 
         # 3. The rest of the __init__ remains the same
         self.alias_to_field_map = self._build_alias_map()
 
+        # 4. Compile the execution plans once. The module set only changes on restart.
+        modules_by_tier = {"free": dict(self.free_modules)}
+        if self.is_pro_activated:
+            modules_by_tier["pro"] = self.free_modules | self.pro_modules
+        self.execution_plans = ExecutionPlanCache(modules_by_tier)
+        for tier in modules_by_tier:
+            self.execution_plans.get(tier)
+
+        # 5. A version of everything that determines the output, used by the result cache
+        self.module_set_version = self._compute_module_set_version(
+            modules_by_tier["pro" if self.is_pro_activated else "free"]
+        )
+
+        # Resolves the page language; caches it per domain across requests
+        self.language_resolver = LanguageResolver()
+
+        # Per-domain parser statistics for adaptive parser ordering (opt-in)
+        self.parser_stats: Optional[ParserStatsStore] = (
+            ParserStatsStore() if settings.adaptive_parsers.enabled else None
+        )
+
+        # Induced per-domain wrappers for the fast extraction path (opt-in)
+        self.wrappers: Optional[WrapperStore] = (
+            WrapperStore() if settings.wrappers.enabled else None
+        )
+
+        # The worker pool for parallel execution is only created when it is used
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
         logger.info(
             f"Analyzer initialized with {len(self.free_modules)} free modules discovered."
         )
@@ -55,6 +127,20 @@ class ProductPageAnalyzer:
             # This is normal behavior if the Pro package is not installed.
             return {}
 
+    def validate_fields(self, fields: List[str]) -> List[str]:
+        """Returns the requested fields that no active module can extract."""
+        tier = "pro" if self.is_pro_activated else "free"
+        available = self.execution_plans.get(tier).modules
+        return [field for field in fields if field not in available]
+
+    def _compute_module_set_version(self, modules: Dict[str, Any]) -> str:
+        """Hashes the active modules, the shared code and the settings that affect results."""
+        app_dir = Path(__file__).resolve().parent.parent
+        shared_code = sorted(
+            list((app_dir / "core").rglob("*.py")) + list((app_dir / "utils").rglob("*.py"))
+        )
+        return compute_code_version(modules, shared_code) + "-" + _settings_version()
+
     def _build_alias_map(self) -> Dict[str, str]:
         """Builds the alias map from the settings for data enrichment."""
         return {
@@ -63,143 +149,385 @@ class ProductPageAnalyzer:
             for alias in aliases
         }
 
-    def analyze(self, html_content: str, url: str, use_llm: bool) -> Dict[str, Any]:
+    def analyze(
+        self,
+        html_content: str,
+        url: str,
+        use_llm: bool,
+        fields: Optional[List[str]] = None,
+        time_budget_ms: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
         Performs the full analysis for a given user tier.
+        With 'fields', only those fields (and the modules they depend on) are extracted.
+        'time_budget_ms' overrides the configured latency budget.
+        """
+        return self.analyze_with_timings(
+            html_content, url, use_llm, fields, time_budget_ms
+        )[0]
+
+    def analyze_with_timings(
+        self,
+        html_content: str,
+        url: str,
+        use_llm: bool,
+        fields: Optional[List[str]] = None,
+        time_budget_ms: Optional[int] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Performs the full analysis and also returns its timings block
+        (module and parser durations, the winning parser per module and
+        the parsers skipped because the time budget ran out).
         """
+        started_at = time.perf_counter()
+        memory_probe = MemoryProbe() if settings.memory_report.enabled else None
+        try:
+            return self._analyze(
+                html_content, url, use_llm, fields, time_budget_ms, memory_probe, started_at
+            )
+        finally:
+            if memory_probe is not None:
+                memory_probe.stop()
+
+    def _analyze(
+        self,
+        html_content: str,
+        url: str,
+        use_llm: bool,
+        fields: Optional[List[str]],
+        time_budget_ms: Optional[int],
+        memory_probe: Optional[MemoryProbe],
+        started_at: float,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """The steps of analyze_with_timings, measured by 'memory_probe' if given."""
+        time_budget = TimeBudget(
+            time_budget_ms if time_budget_ms is not None else settings.time_budget.default_ms
+        )
+        timings = RequestTimings()
+        timings.budget_ms = time_budget.budget_ms
         tier = "pro" if self.is_pro_activated else "free"
         logger.info(f"Analyzer: Starting analysis for URL: {url} (Tier: {tier})")
 
-        # STEP 1: Assemble the active modules based on the tier.
-        active_modules = self.free_modules.copy()
-        if tier == "pro" and self.pro_modules:
-            logger.info("Pro tier activated, merging Pro modules.")
-            active_modules.update(self.pro_modules)
+        # STEP 0: Pages whose structured data covers the required fields are
+        # extracted from their JSON-LD and head tags alone (see app.core.head_only).
+        if settings.head_only.enabled and fields is None and not use_llm:
+            head_result = self._analyze_head(html_content, url, tier, timings, time_budget)
+            if head_result is not None:
+                final_results, head_timings = head_result
+                return self._finish(final_results, head_timings, memory_probe, started_at)
+
+        # STEP 0b: A domain with an induced wrapper is extracted with its rules alone.
+        wrapper_run = None
+        if self.wrappers is not None and fields is None and not use_llm:
+            wrapper_run = self.wrappers.run(html_content, url)
+            timings.wrapper = wrapper_run.outcome
+            if wrapper_run.outcome == WRAPPER_HIT:
+                logger.success(f"Analyzer: Extracted with the wrapper of {wrapper_run.domain}.")
+                final_results = self.ProductDataModel.model_construct(
+                    **wrapper_run.values
+                ).model_dump()
+                return self._finish(final_results, timings, memory_probe, started_at)
+
+        # STEP 1 + 2: Look up the precompiled execution plan for this tier and field subset.
+        execution_plan = self.execution_plans.get(tier, fields)
+        logger.debug(f"Module execution order: {execution_plan.order}")
+
+        final_results, document = self._run_pipeline(
+            html_content, url, use_llm, execution_plan, timings, time_budget, wrapper_run
+        )
 
-        # STEP 2: Use the DependencyResolver to determine the execution order.
-        try:
-            resolver = DependencyResolver(active_modules)
-            execution_order = resolver.sort()
-            logger.info(f"Module execution order resolved: {execution_order}")
-        except ValueError as e:
-            logger.error(
-                f"Module dependency error: {e}. Aborting analysis.", exc_info=True
-            )
-            raise  # Stop the execution and propagate the error
+        if execution_plan.fields is not None:
+            # Only return what was asked for, not the dependencies that ran for it
+            final_results = {
+                field: value
+                for field, value in final_results.items()
+                if field in execution_plan.fields
+            }
 
+        timings.document = document.stats
+        return self._finish(final_results, timings, memory_probe, started_at)
+
+    def _run_pipeline(
+        self,
+        html_content: str,
+        url: str,
+        use_llm: bool,
+        execution_plan: ExecutionPlan,
+        timings: RequestTimings,
+        time_budget: TimeBudget,
+        wrapper_run: Optional[WrapperRun] = None,
+    ) -> Tuple[Dict[str, Any], PageDocument]:
+        """
+        Runs the modules of a plan on one page and returns the resolved results.
+        With a 'wrapper_run', the results are also used to learn the domain's wrapper.
+        """
         # Initialize the data objects for this run
-        product_data = self.ProductDataModel()
-        shared_context.initialize(
-            self._create_initial_context(html_content, url, use_llm)
+        scoreboard = Scoreboard(self.product_fields)
+        # The page the wrapper step parsed with lxml is reused by the lxml DOM view
+        document = PageDocument(
+            html_content,
+            lxml_root=wrapper_run.page.root if wrapper_run is not None and wrapper_run.page else None,
         )
+        context = self._create_initial_context(document, url, use_llm)
+        context.timings = timings
+        context.time_budget = time_budget
+
+        # The document and everything that points into it is released when the scope exits
+        with shared_context.scope(context):
+            # STEP 3: Execute the sorted modules.
+            self._run_modules(scoreboard, execution_plan, context)
+
+            # STEP 4: Enrich the data (optional, after the main analysis).
 
-        # STEP 3: Execute the sorted modules.
-        self._run_modules(product_data, execution_order, active_modules)
+            self._enrich_from_specifications(scoreboard)
 
-        # STEP 4: Enrich the data (optional, after the main analysis).
+            # STEP 5: Choose the best results from the scoreboard.
+            self._resolve_best_results(scoreboard)
 
-        self._enrich_from_specifications(product_data)
+            logger.success("Analyzer: Full analysis completed.")
+            document.log_stats()
 
-        # STEP 5: Choose the best results from the scoreboard.
-        self._resolve_best_results(product_data)
+            # Get the final results dictionary
+            final_results = scoreboard.get_final_results(self.ProductDataModel)
 
-        logger.success("Analyzer: Full analysis completed.")
+            # Learned before the document is released, so its lxml tree can be reused.
+            # Results cut short by the time budget are not used to learn a wrapper.
+            if wrapper_run is not None and not timings.skipped_parsers:
+                timings.wrapper = self.wrappers.learn(wrapper_run, final_results, document.lxml_root)
+        del scoreboard
+        return final_results, document
 
-        # Get the final results dictionary
-        final_results = product_data.get_final_results()
+    def _analyze_head(
+        self,
+        html_content: str,
+        url: str,
+        tier: str,
+        timings: RequestTimings,
+        time_budget: TimeBudget,
+    ) -> Optional[Tuple[Dict[str, Any], RequestTimings]]:
+        """
+        Head-only mode: runs the modules on a synthetic document made of the
+        page's JSON-LD scripts, title and head meta tags, found without parsing
+        the page. Returns the results and their timings when every required
+        field was found, or None (with the outcome on 'timings') to fall back
+        to the full analysis.
+        """
+        scan_started_at = time.perf_counter()
+        scan = scan_head(html_content)
+        scan_ms = round((time.perf_counter() - scan_started_at) * 1000, 3)
+        if not scan.has_structured_data:
+            timings.head_only = HEAD_ONLY_NO_DATA
+            return None
+
+        head_timings = RequestTimings()
+        head_timings.budget_ms = timings.budget_ms
+        final_results, document = self._run_pipeline(
+            scan.html, url, False, self.execution_plans.get(tier), head_timings, time_budget
+        )
+        missing = [
+            field for field in settings.head_only.required_fields if not final_results.get(field)
+        ]
+        if missing:
+            logger.info(f"Analyzer: Head-only mode is missing {missing}, running the full analysis.")
+            timings.head_only = HEAD_ONLY_FALLBACK
+            return None
+
+        logger.success("Analyzer: Extracted from the structured data of the page alone.")
+        head_timings.head_only = HEAD_ONLY_HIT
+        head_timings.document = {**document.stats, "head_scan_ms": scan_ms, **scan.describe()}
+        return final_results, head_timings
+
+    def _finish(
+        self,
+        final_results: Dict[str, Any],
+        timings: RequestTimings,
+        memory_probe: Optional[MemoryProbe],
+        started_at: float,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Completes the timings block and returns the results sorted by field."""
+        if memory_probe is not None:
+            timings.memory = memory_probe.report()
+            logger.info(f"Analyzer: Memory of this analysis: {timings.memory}")
+        timings.total_ms = (time.perf_counter() - started_at) * 1000
 
         # Create a new dictionary sorted alphabetically by key
-        return dict(sorted(final_results.items()))
+        return dict(sorted(final_results.items())), timings.to_dict()
 
     def _create_initial_context(
-        self, html_content: str, url: str, use_llm: bool
-    ) -> Dict[str, Any]:
+        self, document: PageDocument, url: str, use_llm: bool
+    ) -> ExtractionContext:
         """Creates the initial context for an analysis run."""
         # PHASE 1: HTML Preprocessing
+        # The views are only built when a module reads them; the language comes
+        # from the page's own declaration (in the 'dom' view) where possible.
         logger.info("Analyzer: PHASE 1: Starting HTML Preprocessing.")
-        preprocessed_soup = clean_html_for_extraction(html_content)
-        try:
-            lang_code = detect(preprocessed_soup.get_text())
-        except Exception:
-            lang_code = settings.language.default
-
-        return {
-            "raw_soup": BeautifulSoup(html_content, "lxml"),
-            "preprocessed_soup": preprocessed_soup,
-            "current_url": url,
-            "resources": get_resources(),
-            "lang_code": lang_code,
-            "use_llm": use_llm,
-            "processed_elements": set(),  # Initialize processed_elements set
-        }
+        lang_code, lang_source = self.language_resolver.resolve(document, url)
+        logger.info(f"Analyzer: Page language is '{lang_code}' (from {lang_source}).")
+
+        return ExtractionContext(
+            document=document,
+            current_url=url,
+            lang_code=lang_code,
+            use_llm=use_llm,
+            resources=get_resources(),
+            processed_elements=ProcessedElementsRegistry(),
+            parser_stats=self.parser_stats,
+        )
 
     def _run_modules(
         self,
-        product_data: _BaseProductData,
-        execution_order: List[str],
-        active_modules: Dict[str, Any],
+        scoreboard: Scoreboard,
+        execution_plan: ExecutionPlan,
+        context: ExtractionContext,
     ):
-        """Executes all active modules in the correct sorted order."""
-        logger.info(f"Analyzer: Running modules in sorted order: {execution_order}")
-        for module_name in execution_order:
-            module = active_modules.get(module_name)
-            if not module:
-                logger.warning(
-                    f"Module '{module_name}' was in execution order but could not be found."
-                )
-                continue
-
-            try:
-                # Call the 'extract' function of the module
-                extracted_data, selector, status, score = module.extract()
-
-                if extracted_data is None:
-                    continue
-
-                # Step 1: ALWAYS put the module's primary result on the context
-                # This allows 'price' to depend on 'json_ld', etc.
-                shared_context.update(module_name, extracted_data)
-
-                # Step 2: Check if this module *is* a field on the data model
-                # (e.g., 'price', 'title', 'json_ld', 'open_graph')
-                if hasattr(product_data, module_name):
-                    # If yes, add its main result to the scoreboard for that field
-                    field_name = module_name
-                    result = ExtractionResult(
-                        value=extracted_data,
-                        source=selector,
-                        score=score,
-                        status=status,
+        """
+        Executes the modules of the plan level by level. In parallel mode, the
+        modules of one level run concurrently and only see each other's claimed
+        elements from the next level on; either way, their results are merged
+        into the scoreboard and the context in plan order.
+        """
+        document = context.document
+        registry: ProcessedElementsRegistry = context.processed_elements
+        run_parallel = settings.execution.mode == "parallel"
+
+        for level in execution_plan.levels:
+            modules = [(name, execution_plan.modules[name]) for name in level]
+
+            # Build the document views this level declared before any module runs,
+            # so concurrent modules never race to build the same view.
+            if document is not None:
+                for _, module in modules:
+                    for view_name in getattr(module, "REQUIRES_VIEWS", [RAW_DOM]):
+                        document.get_view(view_name)
+
+            # The modules of one level all read the same frozen results
+            snapshot = context.snapshot()
+            if run_parallel and len(modules) > 1:
+                futures = [
+                    self._get_executor().submit(
+                        self._execute_module, name, module, snapshot
+                    )
+                    for name, module in modules
+                ]
+                outputs = [future.result() for future in futures]
+            else:
+                outputs = []
+                for name, module in modules:
+                    outputs.append(self._execute_module(name, module, snapshot))
+                    # The next module of the level sees this module's claims right away
+                    registry.seal([name])
+
+            for (module_name, _), output in zip(modules, outputs):
+                if output is not None:
+                    self._record_module_output(
+                        scoreboard, context, module_name, output
                     )
-                    product_data.add_result(field_name, result)
-
-                # Step 3: If the data is a dict, ALSO loop through it
-                # to populate sub-fields (like 'title' from 'open_graph')
-                if isinstance(extracted_data, dict):
-                    for field, value in extracted_data.items():
-                        # Check if this sub-key is a field AND it's not the module's own name
-                        # (We've already handled the 'open_graph' field itself in Step 2)
-                        if (
-                            field != module_name
-                            and value is not None
-                            and hasattr(product_data, field)
-                        ):
-                            # This adds 'title' and 'image' from the 'open_graph' module
-                            result = ExtractionResult(
-                                value=value,
-                                source=f"{module_name} ({selector})",
-                                score=score,
-                                status=status,
-                            )
-                            product_data.add_result(field, result)
-
-            except Exception as e:
-                logger.error(
-                    f"Error during execution of module '{module_name}': {e}",
-                    exc_info=True,
+            registry.seal(level)
+
+    def _execute_module(
+        self, module_name: str, module: Any, snapshot: ExtractionContext
+    ) -> Optional[Tuple[Any, str, FieldExtractionStatus, int]]:
+        """
+        Runs a single module with its own view of the level's context snapshot
+        and returns its output, or None if it found nothing or failed.
+        """
+        module_context = snapshot.for_module(
+            module_name, snapshot.processed_elements.for_module(module_name)
+        )
+        try:
+            # Call the 'extract' function of the module
+            started_at = time.perf_counter()
+            with shared_context.activate(module_context):
+                output = module.extract()
+            timings: Optional[RequestTimings] = module_context.timings
+            if timings is not None:
+                timings.record_module(
+                    module_name, (time.perf_counter() - started_at) * 1000, output
                 )
+            return output if output[0] is not None else None
 
-    def _enrich_from_specifications(self, product_data: _BaseProductData):
+        except Exception as e:
+            logger.error(
+                f"Error during execution of module '{module_name}': {e}",
+                exc_info=True,
+            )
+            return None
+
+    def _record_module_output(
+        self,
+        scoreboard: Scoreboard,
+        context: ExtractionContext,
+        module_name: str,
+        output: Tuple[Any, str, FieldExtractionStatus, int],
+    ):
+        """Puts a module's output on the context and the scoreboard."""
+        extracted_data, selector, status, score = output
+        try:
+            # Step 1: ALWAYS put the module's primary result on the context
+            # This allows 'price' to depend on 'json_ld', etc.
+            context.set_result(module_name, extracted_data)
+
+            # Step 2: Check if this module *is* a field on the data model
+            # (e.g., 'price', 'title', 'json_ld', 'open_graph')
+            if scoreboard.has_field(module_name):
+                # If yes, add its main result to the scoreboard for that field
+                field_name = module_name
+                result = ExtractionResult(
+                    value=extracted_data,
+                    source=selector,
+                    score=score,
+                    status=status,
+                )
+                scoreboard.add_result(field_name, result)
+
+            # Step 3: If the data is a dict, ALSO loop through it
+            # to populate sub-fields (like 'title' from 'open_graph')
+            if isinstance(extracted_data, dict):
+                for field, value in extracted_data.items():
+                    # Check if this sub-key is a field AND it's not the module's own name
+                    # (We've already handled the 'open_graph' field itself in Step 2)
+                    if (
+                        field != module_name
+                        and value is not None
+                        and scoreboard.has_field(field)
+                    ):
+                        # This adds 'title' and 'image' from the 'open_graph' module
+                        result = ExtractionResult(
+                            value=value,
+                            source=f"{module_name} ({selector})",
+                            score=score,
+                            status=status,
+                        )
+                        scoreboard.add_result(field, result)
+
+        except Exception as e:
+            logger.error(
+                f"Error while recording the result of module '{module_name}': {e}",
+                exc_info=True,
+            )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Returns the worker pool for parallel mode, creating it on first use."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=settings.execution.max_workers,
+                        thread_name_prefix="argus-module",
+                    )
+        return self._executor
+
+    def shutdown(self):
+        """Stops the worker pool, if one was started, and saves the parser statistics and wrappers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.parser_stats is not None:
+            self.parser_stats.close()
+        if self.wrappers is not None:
+            self.wrappers.close()
+
+    def _enrich_from_specifications(self, scoreboard: Scoreboard):
         """
         Scans the found specifications and adds results to the scoreboard
         for fields that have not yet been found with high confidence.
@@ -207,7 +535,7 @@ class ProductPageAnalyzer:
         logger.info("Enrichment: Checking specifications for extra data...")
 
         # Get the specifications from the snapshot of this run
-        specs_results = product_data.all_results.get("specifications")
+        specs_results = scoreboard.all_results.get("specifications")
         if not specs_results:
             logger.debug("Enrichment: No specifications found to enrich from.")
             return
@@ -242,25 +570,23 @@ class ProductPageAnalyzer:
                             score=150,
                             status=FieldExtractionStatus.FOUND_IN_SPECS,
                         )
-                        product_data.add_result(target_field, result)
+                        scoreboard.add_result(target_field, result)
 
-    def _resolve_best_results(self, product_data: _BaseProductData):
+    def _resolve_best_results(self, scoreboard: Scoreboard):
         """
         Iterates over the scoreboard ('all_results') and selects the entry
         with the highest score for each field to set the final value.
         """
         logger.info("Resolving best results from scoreboard...")
-        for field_name, results in product_data.all_results.items():
+        for field_name, results in scoreboard.all_results.items():
             if results:
                 # Find the result with the highest score
                 best_result = max(results, key=lambda r: r.score)
 
                 # Set the final value on the model
-                if hasattr(product_data, field_name):
-                    setattr(product_data, field_name, best_result.value)
-                    # Also update the status and selector for the winner
-                    product_data.field_status[field_name] = best_result.status
-                    product_data.selectors_used[field_name] = best_result.source
+                if scoreboard.has_field(field_name):
+                    # Also records the status and selector of the winner
+                    scoreboard.set_winner(field_name, best_result)
                     logger.debug(
                         f"Resolved field '{field_name}': chose value from '{best_result.source}' with score {best_result.score}."
                     )
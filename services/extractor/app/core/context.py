@@ -1,7 +1,229 @@
 # argus/services/extractor/app/core/context.py
 
+import threading
+from contextlib import contextmanager
 from contextvars import ContextVar
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    from app.core.dom import DomNode
+    from app.core.document import PageDocument
+
+
+class ProcessedElementsRegistry:
+    """
+    The request-wide registry of elements that a parser has already claimed.
+
+    Elements are keyed by identity (a bs4 Tag hashes by its full markup, which is
+    slow and makes identical-looking elements collide), and all access is guarded
+    by a lock so modules can run concurrently.
+
+    Modules never use the registry directly but get a view from for_module(). A
+    view sees the marks of its own module and of the modules that were sealed.
+    Sequential execution seals every module as soon as it has run, so later
+    modules see its marks right away, as with one shared set. Parallel execution
+    seals a level once all its modules have run, so there the outcome does not
+    depend on the order in which the modules of one level happen to run.
+    """
+
+    def __init__(self):
+        self._marks: Dict[int, Tuple[Any, Set[str]]] = {}
+        self._sealed_modules: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def for_module(self, module_name: str) -> "ProcessedElementsView":
+        return ProcessedElementsView(self, module_name)
+
+    def seal(self, module_names: Iterable[str]) -> None:
+        """Makes the marks of finished modules visible to every later module."""
+        with self._lock:
+            self._sealed_modules.update(module_names)
+
+    def _add(self, element: Any, module_name: str) -> None:
+        with self._lock:
+            entry = self._marks.get(id(element))
+            if entry is None:
+                # Keep a reference to the element so its id() cannot be reused
+                self._marks[id(element)] = (element, {module_name})
+            else:
+                entry[1].add(module_name)
+
+    def _contains(self, element: Any, module_name: str) -> bool:
+        with self._lock:
+            entry = self._marks.get(id(element))
+            if entry is None:
+                return False
+            owners = entry[1]
+            return module_name in owners or not owners.isdisjoint(
+                self._sealed_modules
+            )
+
+    def _visible(self, module_name: str) -> list:
+        with self._lock:
+            return [
+                element
+                for element, owners in self._marks.values()
+                if module_name in owners or not owners.isdisjoint(self._sealed_modules)
+            ]
+
+    def __len__(self) -> int:
+        return len(self._marks)
+
+    def clear(self):
+        """Drops every mark (and with it the references to the marked elements)."""
+        with self._lock:
+            self._marks.clear()
+            self._sealed_modules.clear()
+
+
+class ProcessedElementsView:
+    """The set-like view of the registry that is handed to one module's parsers."""
+
+    __slots__ = ("_registry", "_module_name")
+
+    def __init__(self, registry: ProcessedElementsRegistry, module_name: str):
+        self._registry = registry
+        self._module_name = module_name
+
+    def add(self, element: Any) -> None:
+        self._registry._add(element, self._module_name)
+
+    def __contains__(self, element: Any) -> bool:
+        return self._registry._contains(element, self._module_name)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._registry._visible(self._module_name))
+
+    def __len__(self) -> int:
+        return len(self._registry._visible(self._module_name))
+
+
+class ExtractionContext:
+    """
+    The typed, request-scoped state that modules and parsers read.
+
+    Module results are stored in a plain dict, so recording one is O(1) no matter
+    how many modules there are. snapshot() freezes the results for the modules
+    of one dependency level, which can then read them concurrently, and
+    for_module() gives each module its own view with its processed_elements.
+    Both copy a fixed number of slots, not the results.
+    """
+
+    __slots__ = (
+        "document",
+        "current_url",
+        "lang_code",
+        "use_llm",
+        "resources",
+        "processed_elements",
+        "timings",
+        "time_budget",
+        "parser_stats",
+        "current_module",
+        "_results",
+    )
+
+    def __init__(
+        self,
+        document: "PageDocument",
+        current_url: str,
+        lang_code: str,
+        use_llm: bool,
+        resources: Dict[str, Any],
+        processed_elements: Any,
+        timings: Any = None,
+        time_budget: Any = None,
+        parser_stats: Any = None,
+    ):
+        self.document = document
+        self.current_url = current_url
+        self.lang_code = lang_code
+        self.use_llm = use_llm
+        self.resources = resources
+        self.processed_elements = processed_elements
+        self.timings = timings
+        self.time_budget = time_budget
+        # The ParserStatsStore, when adaptive parser ordering is enabled
+        self.parser_stats = parser_stats
+        self.current_module: Optional[str] = None
+        self._results: Dict[str, Any] = {}
+
+    # --- Document views (built on first access) ---
+
+    @property
+    def raw_soup(self) -> Optional["BeautifulSoup"]:
+        return self.document.raw_dom if self.document is not None else None
+
+    @property
+    def preprocessed_soup(self) -> Optional["BeautifulSoup"]:
+        return self.document.clean_dom if self.document is not None else None
+
+    @property
+    def dom(self) -> Optional["DomNode"]:
+        return self.document.dom if self.document is not None else None
+
+    # --- Module results ---
+
+    @property
+    def json_ld(self) -> Optional[List[Dict[str, Any]]]:
+        return self._results.get("json_ld")
+
+    @property
+    def open_graph(self) -> Optional[Dict[str, Any]]:
+        return self._results.get("open_graph")
+
+    def result(self, module_name: str, default: Any = None) -> Any:
+        """The primary result of a module that ran in an earlier level."""
+        return self._results.get(module_name, default)
+
+    def set_result(self, module_name: str, value: Any) -> None:
+        if isinstance(self._results, MappingProxyType):
+            raise TypeError("Cannot record a module result on a context snapshot.")
+        self._results[module_name] = value
+
+    # --- Cheap copies ---
+
+    def _copy(self, **changes: Any) -> "ExtractionContext":
+        clone = object.__new__(ExtractionContext)
+        for slot in ExtractionContext.__slots__:
+            setattr(clone, slot, changes[slot] if slot in changes else getattr(self, slot))
+        return clone
+
+    def snapshot(self) -> "ExtractionContext":
+        """A read-only copy of the context with the module results recorded so far."""
+        return self._copy(_results=MappingProxyType(dict(self._results)))
+
+    def for_module(
+        self, module_name: str, processed_elements: Any
+    ) -> "ExtractionContext":
+        """The view of this context that one module runs with."""
+        return self._copy(
+            current_module=module_name, processed_elements=processed_elements
+        )
+
+    def release(self):
+        """
+        Tears the request down: frees the parsed document and drops the module
+        results and processed elements, which can hold references into the trees.
+        """
+        if self.document is not None:
+            self.document.release()
+        if isinstance(self.processed_elements, ProcessedElementsRegistry):
+            self.processed_elements.clear()
+        if isinstance(self._results, dict):
+            self._results.clear()
 
 
 class SharedContextManager:
@@ -12,30 +234,39 @@ class SharedContextManager:
 
     def __init__(self):
         # The ContextVar is now a 'private' implementation detail.
-        self._context_var: ContextVar[Dict[str, Any]] = ContextVar(
-            "shared_context", default={}
+        self._context_var: ContextVar[Optional[ExtractionContext]] = ContextVar(
+            "shared_context", default=None
         )
 
-    def initialize(self, initial_data: Dict[str, Any]) -> None:
-        """Sets the initial context for a new request."""
-        self._context_var.set(initial_data)
-
-    def get(self, key: str, default: Any = None) -> Any:
-        """Retrieves one specific value from the context."""
-        return self._context_var.get().get(key, default)
+    def initialize(self, context: ExtractionContext) -> None:
+        """Sets the context for a new request."""
+        self._context_var.set(context)
 
-    def get_all(self) -> Dict[str, Any]:
-        """Retrieves the complete context dictionary."""
+    def current(self) -> Optional[ExtractionContext]:
+        """Returns the context of the current request (or module), if any."""
         return self._context_var.get()
 
-    def update(self, key: str, value: Any) -> None:
+    @contextmanager
+    def activate(self, context: ExtractionContext) -> Iterator[ExtractionContext]:
+        """Makes a context current for the duration of the 'with' block."""
+        token = self._context_var.set(context)
+        try:
+            yield context
+        finally:
+            self._context_var.reset(token)
+
+    @contextmanager
+    def scope(self, context: ExtractionContext) -> Iterator[ExtractionContext]:
         """
-        The method you suggested: update the context safely.
-        This performs the 'get -> modify -> set' cycle internally.
+        The lifecycle of one request: the context is current inside the 'with'
+        block and released when the block exits, also on errors.
         """
-        current_context = self._context_var.get().copy()  # Work with a copy
-        current_context[key] = value
-        self._context_var.set(current_context)
+        token = self._context_var.set(context)
+        try:
+            yield context
+        finally:
+            self._context_var.reset(token)
+            context.release()
 
 
 # Create a single global instance of the manager.
@@ -1,6 +1,5 @@
 # argus/services/extractor/app/core/dependency_resolver.py
 
-from collections import deque
 from typing import Dict, Any, List
 from loguru import logger
 
@@ -25,6 +24,14 @@ class DependencyResolver:
         Performs a topological sort and returns the execution order.
         Ignores dependencies that are not in the current set of active modules.
         """
+        return [name for level in self.levels() for name in level]
+
+    def levels(self) -> List[List[str]]:
+        """
+        Groups the modules into dependency levels. Every module only depends on
+        modules in earlier levels, so the modules of one level can run together.
+        Ignores dependencies that are not in the current set of active modules.
+        """
         # We build a 'clean' graph with only the dependencies that actually exist
         # in the set of active modules for this tier.
         dependencies = {}
@@ -48,26 +55,32 @@ class DependencyResolver:
                 graph[dep].append(name)
                 in_degree[name] += 1
 
-        # Step 2: Start the queue with all modules that have an in-degree of 0.
-        queue = deque([name for name in self.module_names if in_degree[name] == 0])
-
-        sorted_order = []
-
-        # Step 3: Process the queue.
-        while queue:
-            current_module = queue.popleft()
-            sorted_order.append(current_module)
+        # Step 2: Peel off the modules whose dependencies are all satisfied, one
+        # level at a time. Modules within a level do not depend on each other.
+        # Names are sorted within a level so the order is the same on every run.
+        current_level = sorted(
+            name for name in self.module_names if in_degree[name] == 0
+        )
+        levels = []
+        resolved_count = 0
 
-            for dependent_module in graph[current_module]:
-                in_degree[dependent_module] -= 1
-                if in_degree[dependent_module] == 0:
-                    queue.append(dependent_module)
+        # Step 3: Process the levels.
+        while current_level:
+            levels.append(current_level)
+            resolved_count += len(current_level)
+            next_level = []
+            for current_module in current_level:
+                for dependent_module in graph[current_module]:
+                    in_degree[dependent_module] -= 1
+                    if in_degree[dependent_module] == 0:
+                        next_level.append(dependent_module)
+            current_level = sorted(next_level)
 
         # Step 4: Check for circular dependencies.
-        if len(sorted_order) != len(self.module_names):
+        if resolved_count != len(self.module_names):
             cycle_nodes = {name for name, degree in in_degree.items() if degree > 0}
             raise ValueError(
                 f"Circular dependency detected! Modules in cycle: {cycle_nodes}"
             )
 
-        return sorted_order
+        return levels
@@ -0,0 +1,225 @@
+# argus/services/extractor/app/core/document.py
+
+import copy
+import threading
+import time
+from typing import Dict, Any, Optional, List
+from bs4 import BeautifulSoup
+from loguru import logger
+from app.config import settings
+from app.core.dom import BACKEND_LXML, DomNode, LxmlTree, SoupTree, lxml_available
+from app.core.ingestion import parse_streaming, uses_streaming
+from app.core.memo import DocumentMemo
+from app.utils.html_processor import clean_soup_for_extraction, extract_clean_text
+
+# The views a module can declare in its REQUIRES_VIEWS list
+RAW_DOM = "raw_dom"
+CLEAN_DOM = "clean_dom"
+TEXT = "text"
+DOM = "dom"
+DOCUMENT_VIEWS = (RAW_DOM, CLEAN_DOM, TEXT, DOM)
+
+
+class PageDocument:
+    """
+    A single parsed page that serves every view the extractor needs.
+
+    The page is parsed into at most two trees, each once. The raw DOM is the
+    BeautifulSoup tree; the cleaned view is derived from it by cloning (no
+    re-parse), and the text view is read from the cleaned view if it exists,
+    otherwise derived from the raw DOM without building the cleaned view at
+    all. The 'dom' view is the DOM abstraction the ported modules and the
+    language resolver read (see app.core.dom): with the lxml backend it is a
+    second, native lxml.html parse, otherwise it wraps the raw DOM. A request
+    that only needs the 'dom' view therefore parses the page once, and
+    'parse_count' counts both parses. Every view is built on first access only.
+    The facts parsers derive from the views are kept in 'memo' (see app.core.memo).
+    """
+
+    def __init__(self, html_content: str, lxml_root: Any = None):
+        self.html_content = html_content or ""
+        # The page's lxml.html tree, when the wrapper step has parsed it already
+        self._lxml_root = lxml_root
+        self._raw_dom: Optional[BeautifulSoup] = None
+        self._clean_dom: Optional[BeautifulSoup] = None
+        self._text: Optional[str] = None
+        self._dom: Optional[DomNode] = None
+        self._released = False
+        # Views may be requested from several module threads at once
+        self._lock = threading.RLock()
+        self.memo = DocumentMemo(
+            count_hits=settings.service.log_level.strip().upper() == "DEBUG"
+        )
+        self.stats: Dict[str, Any] = {
+            "html_bytes": len(self.html_content),
+            "parse_count": 0,
+            "parse_ms": 0.0,
+            "clone_ms": 0.0,
+            "clean_ms": 0.0,
+            "text_ms": 0.0,
+            "dom_ms": 0.0,
+            "dom_backend": None,
+            "release_ms": 0.0,
+            "streamed": False,
+        }
+
+    def _record(self, key: str, started_at: float):
+        self.stats[key] += round((time.perf_counter() - started_at) * 1000, 3)
+
+    def _check_not_released(self):
+        if self._released:
+            raise RuntimeError("The document has been released at the end of its request.")
+
+    @property
+    def raw_dom(self) -> BeautifulSoup:
+        """
+        The untouched DOM, parsed once with lxml. Oversized pages are streamed
+        instead: their noise subtrees are dropped while parsing and the tree is
+        bounded by the ingestion ceilings (see app.core.ingestion).
+        """
+        if self._raw_dom is None:
+            with self._lock:
+                self._check_not_released()
+                if self._raw_dom is None:
+                    started_at = time.perf_counter()
+                    if uses_streaming(self.html_content):
+                        self._raw_dom, ingestion_stats = parse_streaming(self.html_content)
+                        self.stats["streamed"] = True
+                        self.stats.update(ingestion_stats)
+                    else:
+                        self._raw_dom = BeautifulSoup(self.html_content, "lxml")
+                    self.stats["parse_count"] += 1
+                    self._record("parse_ms", started_at)
+        return self._raw_dom
+
+    @property
+    def clean_dom(self) -> BeautifulSoup:
+        """A cleaned copy of the raw DOM (noise, comments and empty tags removed)."""
+        if self._clean_dom is None:
+            with self._lock:
+                self._check_not_released()
+                if self._clean_dom is None:
+                    raw_dom = self.raw_dom
+
+                    # Clone node by node into an empty soup. 'copy.copy(soup)' would
+                    # serialize and re-parse the document on older bs4 versions.
+                    started_at = time.perf_counter()
+                    clone = BeautifulSoup("", "lxml")
+                    for child in raw_dom.contents:
+                        clone.append(copy.copy(child))
+                    self._record("clone_ms", started_at)
+
+                    started_at = time.perf_counter()
+                    self._clean_dom = clean_soup_for_extraction(clone)
+                    self._record("clean_ms", started_at)
+        return self._clean_dom
+
+    @property
+    def text(self) -> str:
+        """The plain text of the cleaned view."""
+        if self._text is None:
+            with self._lock:
+                self._check_not_released()
+                if self._text is None:
+                    raw_dom = self.raw_dom
+                    started_at = time.perf_counter()
+                    if self._clean_dom is not None:
+                        self._text = self._clean_dom.get_text()
+                    else:
+                        # Same text as the cleaned view, without paying for the clone and cleanup
+                        self._text = extract_clean_text(raw_dom)
+                    self._record("text_ms", started_at)
+        return self._text
+
+    @property
+    def dom(self) -> DomNode:
+        """
+        The document node of the DOM abstraction. With the lxml backend the
+        page is parsed into a native lxml.html tree, without building the raw
+        DOM; streamed pages, pages lxml cannot parse and the bs4 backend get
+        the raw DOM instead.
+        """
+        if self._dom is None:
+            with self._lock:
+                self._check_not_released()
+                if self._dom is None:
+                    tree = None
+                    started_at = time.perf_counter()
+                    if (
+                        settings.dom.backend == BACKEND_LXML
+                        and lxml_available()
+                        and not uses_streaming(self.html_content)
+                    ):
+                        tree = LxmlTree.parse(self.html_content, root=self._lxml_root)
+                    if tree is None:
+                        tree = SoupTree(self.raw_dom)
+                    elif self._lxml_root is None:
+                        self.stats["parse_count"] += 1
+                    self._record("dom_ms", started_at)
+                    self.stats["dom_backend"] = tree.backend
+                    self._dom = tree.document
+        return self._dom
+
+    @property
+    def lxml_root(self) -> Optional[Any]:
+        """The lxml.html tree of the page, if the 'dom' view was built on one."""
+        if self._lxml_root is None and self._dom is not None and self._dom.tree.backend == BACKEND_LXML:
+            return self._dom.element
+        return self._lxml_root
+
+    def get_view(self, name: str) -> Any:
+        """Returns (and builds, if needed) a view by its REQUIRES_VIEWS name."""
+        if name not in DOCUMENT_VIEWS:
+            raise ValueError(
+                f"Unknown document view '{name}'. Available views: {DOCUMENT_VIEWS}"
+            )
+        return getattr(self, name)
+
+    def built_views(self) -> List[str]:
+        """Returns the names of the views that have been built so far."""
+        built = {
+            RAW_DOM: self._raw_dom is not None,
+            CLEAN_DOM: self._clean_dom is not None,
+            TEXT: self._text is not None,
+            DOM: self._dom is not None,
+        }
+        return [name for name in DOCUMENT_VIEWS if built[name]]
+
+    def release(self):
+        """
+        Frees the parsed trees and the HTML at the end of the request.
+
+        A bs4 tree is full of reference cycles (parent, sibling and next_element
+        links), so merely dropping it leaves it to the cyclic garbage collector.
+        Decomposing the top-level nodes breaks those cycles and the memory is
+        returned right away. Views cannot be built after a release.
+        """
+        with self._lock:
+            if self._released:
+                return
+            started_at = time.perf_counter()
+            for tree in (self._clean_dom, self._raw_dom):
+                if tree is not None:
+                    for node in list(tree.contents):
+                        node.decompose()
+                    tree.decompose()
+            self.memo.clear()
+            if self._dom is not None:
+                self._dom.tree.clear()
+            self._dom = None
+            self._lxml_root = None
+            self._raw_dom = None
+            self._clean_dom = None
+            self._text = None
+            self.html_content = ""
+            self._released = True
+            self._record("release_ms", started_at)
+
+    def log_stats(self):
+        """Logs the parse count, view timings and built views for this request."""
+        if self.memo.count_hits:
+            self.stats["memo"] = self.memo.describe()
+        logger.info(
+            f"Document: Parse stats for this request: {self.stats} "
+            f"(views built: {self.built_views()})"
+        )
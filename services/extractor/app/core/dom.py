@@ -0,0 +1,720 @@
+# argus/services/extractor/app/core/dom.py
+
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from bs4 import BeautifulSoup, Doctype, Tag
+from bs4.builder import HTMLTreeBuilder
+from loguru import logger
+from lxml import etree
+from lxml import html as lxml_html
+from app.core.memo import current_memo
+from app.core.token_index import attribute_matches, rule_matches
+
+try:
+    from lxml.cssselect import CSSSelector
+except ImportError:  # cssselect is optional; without it the bs4 backend is used
+    CSSSelector = None
+
+BACKEND_LXML = "lxml"
+BACKEND_BS4 = "bs4"
+
+# bs4's name for the node above <html>
+DOCUMENT_NAME = "[document]"
+
+# How bs4 builds an HTML tree, which the lxml backend reproduces: the attributes
+# split into a list of tokens, the tags whose strings are not text (their own
+# string types), and the tags whose whitespace-only strings are kept as they are
+_MULTI_VALUED: Dict[str, frozenset] = {
+    tag: frozenset(names) for tag, names in HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES.items()
+}
+_STRING_CONTAINERS = frozenset(HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS)
+_PRESERVE_WHITESPACE = frozenset(HTMLTreeBuilder.DEFAULT_PRESERVE_WHITESPACE_TAGS)
+_ASCII_SPACES = BeautifulSoup.ASCII_SPACES
+
+# libxml2 gives every HTML document a doctype; bs4 only sees one the page declares
+_DOCTYPE = re.compile(r"<!doctype", re.IGNORECASE)
+
+
+def lxml_available() -> bool:
+    """Whether the lxml backend can run (it needs cssselect for select())."""
+    return CSSSelector is not None
+
+
+def parse_html(html_content: str) -> Optional[Any]:
+    """The lxml.html tree of a page, or None if lxml cannot parse it (an empty page)."""
+    try:
+        return lxml_html.document_fromstring(
+            html_content.encode("utf-8"),
+            parser=lxml_html.HTMLParser(encoding="utf-8"),
+        )
+    except (etree.ParserError, ValueError) as e:
+        logger.debug(f"DOM: Could not parse the page with lxml: {e}")
+        return None
+
+
+def _normalize(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    """bs4's 'class_' keyword is the 'class' attribute."""
+    if "class_" in attrs:
+        attrs = dict(attrs)
+        attrs["class"] = attrs.pop("class_")
+    return attrs
+
+
+class DomNode(ABC):
+    """
+    The DOM the extractor modules read, independent of the parser behind it.
+
+    A node is an element (or the document above <html>) of one of two trees:
+    a native lxml.html tree (LxmlNode) or a BeautifulSoup tree (SoupNode), which
+    is kept as the fallback for streamed pages and pages lxml cannot parse.
+    Both answer every call with what bs4 returns for the same page:
+
+    - name, attrs, get() and node[key] as on a bs4 Tag, with 'class' (and the other
+      multi-valued attributes) as a list of tokens;
+    - find_all() and find() take bs4's arguments (a name or a function of the
+      node, attribute rules, limit, recursive) and match the way bs4 does;
+    - select() and select_one() take a CSS selector and search the descendants;
+    - get_text(), string and text_nodes() see the strings bs4 would: comments,
+      scripts and styles are left out of the text, whitespace-only strings collapsed.
+
+    Navigation (parent, children, next_sibling, previous_sibling) only goes
+    through elements. Nodes are cached per tree, so the same element is always
+    the same node, and processed_elements and the memo can key on it.
+
+    A backend implements every abstract method; one that misses any fails
+    when its first node is created, not when a parser first calls it.
+    """
+
+    __slots__ = ("tree",)
+
+    name: str
+
+    @property
+    @abstractmethod
+    def attrs(self) -> Dict[str, Any]:
+        ...
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.attrs.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.attrs[key]
+
+    # --- Navigation ---
+
+    @property
+    @abstractmethod
+    def parent(self) -> Optional["DomNode"]:
+        ...
+
+    @property
+    @abstractmethod
+    def children(self) -> List["DomNode"]:
+        """The child elements."""
+
+    @property
+    @abstractmethod
+    def next_sibling(self) -> Optional["DomNode"]:
+        """The next element with the same parent (strings in between are skipped)."""
+
+    @property
+    @abstractmethod
+    def previous_sibling(self) -> Optional["DomNode"]:
+        """The previous element with the same parent (strings in between are skipped)."""
+
+    # --- Search ---
+
+    @abstractmethod
+    def find_all(
+        self, name: Any = None, limit: Optional[int] = None, recursive: bool = True, **attrs: Any
+    ) -> List["DomNode"]:
+        ...
+
+    def find(self, name: Any = None, recursive: bool = True, **attrs: Any) -> Optional["DomNode"]:
+        found = self.find_all(name, limit=1, recursive=recursive, **attrs)
+        return found[0] if found else None
+
+    @abstractmethod
+    def find_any(self, queries: Iterable[Tuple[Any, Dict[str, Any]]]) -> List["DomNode"]:
+        """The descendants matching any of the (name, attrs) queries, in document order."""
+
+    def matches(self, name: Any = None, **attrs: Any) -> bool:
+        """Whether this node is one find_all(name, **attrs) would return."""
+        if name is not None:
+            if callable(name):
+                if not name(self):
+                    return False
+            elif not rule_matches(name, self.name):
+                return False
+        return all(
+            attribute_matches(rule, self.attrs.get(key))
+            for key, rule in _normalize(attrs).items()
+        )
+
+    def find_parent(self, name: Any = None, **attrs: Any) -> Optional["DomNode"]:
+        """The closest ancestor that matches."""
+        node = self.parent
+        while node is not None:
+            if node.matches(name, **attrs):
+                return node
+            node = node.parent
+        return None
+
+    @abstractmethod
+    def select(self, css: str) -> List["DomNode"]:
+        """The descendants matching a CSS selector, in document order."""
+
+    def select_one(self, css: str) -> Optional["DomNode"]:
+        found = self.select(css)
+        return found[0] if found else None
+
+    # --- Text ---
+
+    @abstractmethod
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        ...
+
+    @property
+    @abstractmethod
+    def string(self) -> Optional[str]:
+        """The node's only string, as bs4's .string: None unless it has exactly one child."""
+
+    @abstractmethod
+    def text_nodes(self, recursive: bool = True, string: Any = None) -> List[Tuple[str, "DomNode"]]:
+        """
+        Every string under the node, comments and script contents included,
+        with the element it is a child of: what find_all(string=True) returns.
+        A 'string' rule (a string, regex or list) keeps the strings it matches.
+        """
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+# --- The BeautifulSoup backend ---
+
+
+class SoupNode(DomNode):
+    """A DomNode over a bs4 Tag; lookups go through the memo's token index."""
+
+    __slots__ = ("tag",)
+
+    def __init__(self, tree: "SoupTree", tag: Tag):
+        self.tree = tree
+        self.tag = tag
+
+    @property
+    def name(self) -> str:
+        return self.tag.name
+
+    @property
+    def attrs(self) -> Dict[str, Any]:
+        return self.tag.attrs
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.tag.get(key, default)
+
+    @property
+    def parent(self) -> Optional[DomNode]:
+        parent = self.tag.parent
+        return self.tree.node(parent) if parent is not None else None
+
+    @property
+    def children(self) -> List[DomNode]:
+        return [self.tree.node(child) for child in self.tag.children if isinstance(child, Tag)]
+
+    @property
+    def next_sibling(self) -> Optional[DomNode]:
+        sibling = self.tag.find_next_sibling()
+        return self.tree.node(sibling) if sibling is not None else None
+
+    @property
+    def previous_sibling(self) -> Optional[DomNode]:
+        sibling = self.tag.find_previous_sibling()
+        return self.tree.node(sibling) if sibling is not None else None
+
+    def find_all(
+        self, name: Any = None, limit: Optional[int] = None, recursive: bool = True, **attrs: Any
+    ) -> List[DomNode]:
+        if callable(name):
+            function = name
+            name = lambda tag: function(self.tree.node(tag))  # noqa: E731
+        if recursive:
+            found = current_memo().find_all(self.tag, name, limit=limit, **attrs)
+        else:
+            found = self.tag.find_all(name, limit=limit, recursive=False, **attrs)
+        return [self.tree.node(tag) for tag in found]
+
+    def find_any(self, queries: Iterable[Tuple[Any, Dict[str, Any]]]) -> List[DomNode]:
+        return [self.tree.node(tag) for tag in current_memo().find_any(self.tag, list(queries))]
+
+    def select(self, css: str) -> List[DomNode]:
+        return [self.tree.node(tag) for tag in self.tag.select(css)]
+
+    def select_one(self, css: str) -> Optional[DomNode]:
+        tag = self.tag.select_one(css)
+        return self.tree.node(tag) if tag is not None else None
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self.tag.get_text(separator, strip=strip)
+
+    @property
+    def string(self) -> Optional[str]:
+        string = self.tag.string
+        return str(string) if string is not None else None
+
+    def text_nodes(self, recursive: bool = True, string: Any = None) -> List[Tuple[str, DomNode]]:
+        return [
+            (str(found), self.tree.node(found.parent))
+            for found in self.tag.find_all(
+                string=True if string is None else string, recursive=recursive
+            )
+        ]
+
+
+class SoupTree:
+    """The DomNodes of one BeautifulSoup tree, one per Tag."""
+
+    backend = BACKEND_BS4
+
+    __slots__ = ("soup", "document", "_nodes")
+
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+        self._nodes: Dict[int, SoupNode] = {}
+        self.document = self.node(soup)
+
+    def node(self, tag: Tag) -> SoupNode:
+        node = self._nodes.get(id(tag))
+        if node is None:
+            # Concurrent modules may both wrap a tag; they get the same node
+            node = self._nodes.setdefault(id(tag), SoupNode(self, tag))
+        return node
+
+    def clear(self):
+        self._nodes.clear()
+
+
+# --- The lxml backend ---
+
+
+def _attribute(element: Any, key: str) -> Any:
+    """An attribute of an lxml element as bs4 has it: multi-valued ones as a list of tokens."""
+    value = element.get(key)
+    if value is None:
+        return None
+    if key in _MULTI_VALUED["*"] or key in _MULTI_VALUED.get(element.tag, ()):
+        return value.split()
+    return value
+
+
+def _collapse(text: str, preserve: bool) -> str:
+    """bs4 replaces a string of ASCII whitespace by a single newline or space (outside <pre>)."""
+    if preserve or text.strip(_ASCII_SPACES):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def _leaf_text(leaf: Any, preserve: bool) -> str:
+    """The string of a comment or processing instruction (entities have none)."""
+    if leaf.tag is etree.Comment:
+        return _collapse(leaf.text or "", preserve)
+    if leaf.tag is etree.ProcessingInstruction:
+        return _collapse(f"{leaf.target} {leaf.text or ''}", preserve)
+    return ""
+
+
+def _leaf_strings(
+    leaf: Any, parent: Any, container: Optional[str], preserve: bool
+) -> Iterator[Tuple[str, Any, bool, Optional[str]]]:
+    """The strings of a comment or processing instruction: itself and the text after it."""
+    text = _leaf_text(leaf, preserve)
+    # find_all(string=True) never returns an empty string (an empty comment inside a <pre>)
+    if text:
+        yield text, parent, False, container
+    if leaf.tail:
+        yield _collapse(leaf.tail, preserve), parent, True, container
+
+
+def _iter_strings(element: Any) -> Iterator[Tuple[str, Any, bool, Optional[str]]]:
+    """
+    Every string under an element, in document order, as (text, the element it
+    is a child of, whether it is text rather than a comment or processing
+    instruction, the name of its innermost string container tag).
+    """
+    container, preserve = None, False
+    for ancestor in element.iterancestors():
+        if container is None and ancestor.tag in _STRING_CONTAINERS:
+            container = ancestor.tag
+        preserve = preserve or ancestor.tag in _PRESERVE_WHITESPACE
+    if element.tag in _STRING_CONTAINERS:
+        container = element.tag
+    preserve = preserve or element.tag in _PRESERVE_WHITESPACE
+
+    if element.text:
+        yield _collapse(element.text, preserve), element, True, container
+    stack = [(element, iter(element), container, preserve)]
+    while stack:
+        parent, children, container, preserve = stack[-1]
+        for child in children:
+            tag = child.tag
+            if isinstance(tag, str):
+                child_container = tag if tag in _STRING_CONTAINERS else container
+                child_preserve = preserve or tag in _PRESERVE_WHITESPACE
+                if child.text:
+                    yield _collapse(child.text, child_preserve), child, True, child_container
+                stack.append((child, iter(child), child_container, child_preserve))
+                break
+            yield from _leaf_strings(child, parent, container, preserve)
+        else:
+            stack.pop()
+            if stack and parent.tail:
+                outer, _, container, preserve = stack[-1]
+                yield _collapse(parent.tail, preserve), outer, True, container
+
+
+# Tag and attribute names that can be written into an XPath expression as they are
+_XPATH_NAME = re.compile(r"^[A-Za-z_][\w.-]*$")
+
+# The text of an element outside script, style, template and ruby annotations
+_VISIBLE_TEXT = etree.XPath(
+    "descendant::text()[not("
+    + " or ".join(f"ancestor::{tag}" for tag in sorted(_STRING_CONTAINERS))
+    + ")]",
+    smart_strings=False,
+)
+
+
+@lru_cache(maxsize=512)
+def _candidates_xpath(axis: str, branches: Tuple[Tuple[Optional[Tuple[str, ...]], Tuple[str, ...]], ...]) -> Any:
+    """
+    The XPath that selects, in document order, the elements that can match one
+    of the queries: per query (branch), its tag names and the attributes it tests.
+    """
+    paths = []
+    for tags, keys in branches:
+        # One path per tag name: libxml2 matches name tests much faster than predicates
+        predicates = "".join(f"[@{key}]" for key in keys)
+        paths.extend(f"{axis}::{tag}{predicates}" for tag in tags or ("*",))
+    return etree.XPath(" | ".join(paths))
+
+
+@lru_cache(maxsize=256)
+def _css_selector(css: str) -> Any:
+    """A compiled CSS selector; the parsers use a fixed set, so each is translated once."""
+    return CSSSelector(css, translator="html")
+
+
+class LxmlNode(DomNode):
+    """
+    A DomNode over an lxml.html element. Lookups select their candidates with
+    an XPath on the tag names and attributes they test, evaluated by libxml2,
+    and apply bs4's matching rules to those candidates only.
+    """
+
+    __slots__ = ("element", "name", "_attrs")
+
+    # The XPath axes of a recursive and a non-recursive lookup
+    _axes = ("descendant", "child")
+
+    def __init__(self, tree: "LxmlTree", element: Any):
+        self.tree = tree
+        self.element = element
+        self.name = element.tag
+        self._attrs: Optional[Dict[str, Any]] = None
+
+    @property
+    def attrs(self) -> Dict[str, Any]:
+        if self._attrs is None:
+            self._attrs = {key: _attribute(self.element, key) for key in self.element.keys()}
+        return self._attrs
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = _attribute(self.element, key)
+        return default if value is None else value
+
+    def _accepts(self, element: Any, name: Any, attrs: Dict[str, Any]) -> bool:
+        """Whether an element matches the (normalized) find_all() arguments."""
+        if name is not None:
+            if callable(name):
+                if not name(self.tree.node(element)):
+                    return False
+            elif not rule_matches(name, element.tag):
+                return False
+        for key, rule in attrs.items():
+            if not attribute_matches(rule, _attribute(element, key)):
+                return False
+        return True
+
+    def matches(self, name: Any = None, **attrs: Any) -> bool:
+        return self._accepts(self.element, name, _normalize(attrs))
+
+    # --- Navigation ---
+
+    @property
+    def parent(self) -> Optional[DomNode]:
+        parent = self.element.getparent()
+        return self.tree.node(parent) if parent is not None else self.tree.document
+
+    @property
+    def children(self) -> List[DomNode]:
+        return [self.tree.node(child) for child in self._elements(recursive=False)]
+
+    @property
+    def next_sibling(self) -> Optional[DomNode]:
+        sibling = self.element.getnext()
+        while sibling is not None and not isinstance(sibling.tag, str):
+            sibling = sibling.getnext()
+        return self.tree.node(sibling) if sibling is not None else None
+
+    @property
+    def previous_sibling(self) -> Optional[DomNode]:
+        sibling = self.element.getprevious()
+        while sibling is not None and not isinstance(sibling.tag, str):
+            sibling = sibling.getprevious()
+        return self.tree.node(sibling) if sibling is not None else None
+
+    def _elements(self, recursive: bool) -> Iterable[Any]:
+        """The descendant (or child) elements, in document order."""
+        element = self.element
+        if not recursive:
+            return element.iterchildren(etree.Element)
+        return (descendant for descendant in element.iter(etree.Element) if descendant is not element)
+
+    # --- Search ---
+
+    def _candidates(self, queries: List[Tuple[Any, Dict[str, Any]]], recursive: bool) -> Iterable[Any]:
+        branches = []
+        for name, attrs in queries:
+            tags = self.tree.tag_names(name)
+            if tags == ():
+                # No element of the page has a matching name
+                continue
+            keys = tuple(attrs)
+            if not all(_XPATH_NAME.match(key) for key in keys + (tags or ())):
+                # A name XPath cannot spell ('fb:like'): every element is a candidate
+                return self._elements(recursive)
+            branches.append((tags, keys))
+        if not branches:
+            return ()
+        axis = self._axes[0 if recursive else 1]
+        return _candidates_xpath(axis, tuple(branches))(self.element)
+
+    def _search(
+        self, queries: List[Tuple[Any, Dict[str, Any]]], recursive: bool, limit: Optional[int]
+    ) -> List[DomNode]:
+        """The elements matching any of the (name, attrs) queries, in document order."""
+        queries = [(name, _normalize(attrs)) for name, attrs in queries]
+        found = []
+        for element in self._candidates(queries, recursive):
+            if any(self._accepts(element, name, attrs) for name, attrs in queries):
+                found.append(self.tree.node(element))
+                if limit and len(found) >= limit:
+                    break
+        return found
+
+    def find_all(
+        self, name: Any = None, limit: Optional[int] = None, recursive: bool = True, **attrs: Any
+    ) -> List[DomNode]:
+        return self._search([(name, attrs)], recursive, limit)
+
+    def find_any(self, queries: Iterable[Tuple[Any, Dict[str, Any]]]) -> List[DomNode]:
+        return self._search(list(queries), True, None)
+
+    def select(self, css: str) -> List[DomNode]:
+        # As with soupsieve, the whole selector may match above this node ("div div"
+        # from inside a div); only the matched element has to be a descendant
+        element = self.element
+        return [
+            self.tree.node(match)
+            for match in _css_selector(css)(self.tree.document.element)
+            if any(ancestor is element for ancestor in match.iterancestors())
+        ]
+
+    # --- Text ---
+
+    def _strings(self) -> Iterator[Tuple[str, Any, bool, Optional[str]]]:
+        return _iter_strings(self.element)
+
+    def _in_string_container(self) -> bool:
+        element = self.element
+        return element.tag in _STRING_CONTAINERS or any(
+            ancestor.tag in _STRING_CONTAINERS for ancestor in element.iterancestors()
+        )
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        if strip and not self._in_string_container():
+            # Stripped, whitespace-only strings drop out; libxml2 can collect the rest
+            texts = (text.strip() for text in _VISIBLE_TEXT(self.element))
+            return separator.join(text for text in texts if text)
+
+        # A script, style or template gives its own strings, any other node its text
+        wanted = self.name if self.name in _STRING_CONTAINERS else None
+        texts = []
+        for text, _, is_text, container in self._strings():
+            if not is_text or container != wanted:
+                continue
+            if strip:
+                text = text.strip()
+                if not text:
+                    continue
+            texts.append(text)
+        return separator.join(texts)
+
+    @property
+    def string(self) -> Optional[str]:
+        # Down a chain of only children to a text, comment or processing instruction
+        element = self.element
+        while not element.text:
+            children = list(element)
+            if len(children) != 1 or children[0].tail:
+                return None
+            element = children[0]
+            if not isinstance(element.tag, str):
+                # .string does return an empty comment
+                preserve = any(
+                    ancestor.tag in _PRESERVE_WHITESPACE for ancestor in element.iterancestors()
+                )
+                return _leaf_text(element, preserve)
+        if len(element):
+            return None
+        return next((text for text, _, _, _ in self._strings()), None)
+
+    def text_nodes(self, recursive: bool = True, string: Any = None) -> List[Tuple[str, DomNode]]:
+        element = self.element
+        return [
+            (text, self.tree.node(owner))
+            for text, owner, _, _ in self._strings()
+            if (recursive or owner is element) and (string is None or rule_matches(string, text))
+        ]
+
+
+class LxmlDocument(LxmlNode):
+    """The document node of an lxml tree: the parent of <html>, like a BeautifulSoup object."""
+
+    __slots__ = ()
+
+    _axes = ("descendant-or-self", "self")
+
+    def __init__(self, tree: "LxmlTree", root: Any):
+        super().__init__(tree, root)
+        self.name = DOCUMENT_NAME
+        self._attrs = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return default
+
+    def matches(self, name: Any = None, **attrs: Any) -> bool:
+        return DomNode.matches(self, name, **attrs)
+
+    @property
+    def parent(self) -> Optional[DomNode]:
+        return None
+
+    @property
+    def next_sibling(self) -> Optional[DomNode]:
+        return None
+
+    @property
+    def previous_sibling(self) -> Optional[DomNode]:
+        return None
+
+    def _elements(self, recursive: bool) -> Iterable[Any]:
+        root = self.element
+        return root.iter(etree.Element) if recursive else (root,)
+
+    def select(self, css: str) -> List[DomNode]:
+        return [self.tree.node(match) for match in _css_selector(css)(self.element)]
+
+    def _in_string_container(self) -> bool:
+        return False
+
+    def _strings(self) -> Iterator[Tuple[str, Any, bool, Optional[str]]]:
+        # The doctype and the comments around <html> are strings of the document (owner None)
+        root = self.element
+        if self.tree.doctype is not None:
+            yield self.tree.doctype, None, False, None
+        for sibling in reversed(list(root.itersiblings(preceding=True))):
+            yield from _leaf_strings(sibling, None, None, False)
+        yield from _iter_strings(root)
+        for sibling in root.itersiblings():
+            yield from _leaf_strings(sibling, None, None, False)
+
+    @property
+    def string(self) -> Optional[str]:
+        # Only <html> itself, without a doctype or comments around it
+        root = self.element
+        if self.tree.doctype is not None or root.getprevious() is not None or root.getnext() is not None:
+            return None
+        return self.tree.node(root).string
+
+    def text_nodes(self, recursive: bool = True, string: Any = None) -> List[Tuple[str, DomNode]]:
+        return [
+            (text, self.tree.node(owner) if owner is not None else self)
+            for text, owner, _, _ in self._strings()
+            if (recursive or owner is None) and (string is None or rule_matches(string, text))
+        ]
+
+
+class LxmlTree:
+    """The DomNodes of one lxml.html tree, one per element."""
+
+    backend = BACKEND_LXML
+
+    __slots__ = ("document", "doctype", "_nodes", "_vocabulary", "_tag_names")
+
+    def __init__(self, root: Any, declares_doctype: bool = True):
+        self._nodes: Dict[Any, LxmlNode] = {}
+        # The distinct tag names of the tree, and name rule -> the names it matches
+        self._vocabulary: Optional[List[str]] = None
+        self._tag_names: Dict[Any, Tuple[str, ...]] = {}
+        self.document = LxmlDocument(self, root)
+        # The doctype string as bs4 has it, if the page declares one
+        self.doctype: Optional[str] = None
+        docinfo = root.getroottree().docinfo
+        if declares_doctype and docinfo.doctype:
+            self.doctype = str(
+                Doctype.for_name_and_ids(docinfo.root_name, docinfo.public_id, docinfo.system_url)
+            )
+
+    @classmethod
+    def parse(cls, html_content: str, root: Any = None) -> Optional["LxmlTree"]:
+        """
+        The tree of a page; 'root' is its lxml.html tree when another step of
+        the request (the wrapper step) has parsed the page already.
+        """
+        if root is None:
+            root = parse_html(html_content)
+        if root is None:
+            return None
+        return cls(root, declares_doctype=_DOCTYPE.search(html_content) is not None)
+
+    def node(self, element: Any) -> LxmlNode:
+        node = self._nodes.get(element)
+        if node is None:
+            # Concurrent modules may both wrap an element; they get the same node
+            node = self._nodes.setdefault(element, LxmlNode(self, element))
+        return node
+
+    def tag_names(self, rule: Any) -> Optional[Tuple[str, ...]]:
+        """
+        The tag names of this tree that a name rule matches, so a regex or a list
+        becomes an XPath name test; None if the rule does not restrict the name.
+        """
+        if rule is None or rule is True or callable(rule):
+            return None
+        if isinstance(rule, str):
+            return (rule,)
+        key = tuple(rule) if isinstance(rule, list) else rule
+        names = self._tag_names.get(key)
+        if names is None:
+            if self._vocabulary is None:
+                self._vocabulary = sorted({element.tag for element in self.document.element.iter(etree.Element)})
+            names = tuple(name for name in self._vocabulary if rule_matches(rule, name))
+            self._tag_names[key] = names
+        return names
+
+    def clear(self):
+        self._nodes.clear()
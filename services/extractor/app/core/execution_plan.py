@@ -0,0 +1,131 @@
+# argus/services/extractor/app/core/execution_plan.py
+
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, List, Tuple, Optional, FrozenSet, Iterable, Mapping
+from loguru import logger
+from app.core.dependency_resolver import DependencyResolver
+
+# Cache key: (tier, field subset). A field subset of None means "all fields".
+PlanKey = Tuple[str, Optional[FrozenSet[str]]]
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    An immutable, precompiled module execution plan.
+
+    The plan is built once per (tier, field subset) and then shared by every
+    request, so it must never be modified after it has been compiled.
+    """
+
+    tier: str
+    fields: Optional[FrozenSet[str]]
+    levels: Tuple[Tuple[str, ...], ...]
+    modules: Mapping[str, Any]
+
+    @property
+    def order(self) -> Tuple[str, ...]:
+        """The flat execution order (the levels, one after the other)."""
+        return tuple(name for level in self.levels for name in level)
+
+    def describe(self) -> Dict[str, Any]:
+        """A JSON-friendly description of the plan, used by the debug endpoint."""
+        return {
+            "tier": self.tier,
+            "fields": sorted(self.fields) if self.fields is not None else None,
+            "levels": [list(level) for level in self.levels],
+            "order": list(self.order),
+            "modules": {
+                name: {
+                    "requires": list(getattr(module, "REQUIRES", [])),
+                    "requires_views": list(getattr(module, "REQUIRES_VIEWS", [])),
+                }
+                for name, module in self.modules.items()
+            },
+        }
+
+
+def _dependency_closure(
+    fields: Iterable[str], modules: Mapping[str, Any]
+) -> FrozenSet[str]:
+    """Returns the requested modules plus everything they (transitively) require."""
+    selected = set()
+    pending = list(fields)
+    while pending:
+        name = pending.pop()
+        if name in selected or name not in modules:
+            continue
+        selected.add(name)
+        pending.extend(getattr(modules[name], "REQUIRES", []))
+    return frozenset(selected)
+
+
+def compile_execution_plan(
+    tier: str,
+    modules: Mapping[str, Any],
+    fields: Optional[FrozenSet[str]] = None,
+) -> ExecutionPlan:
+    """
+    Compiles the execution plan for a set of modules.
+    Raises ValueError on unknown fields or circular dependencies.
+    """
+    if fields is not None:
+        unknown_fields = sorted(field for field in fields if field not in modules)
+        if unknown_fields:
+            raise ValueError(
+                f"Unknown fields requested: {unknown_fields}. "
+                f"Available fields: {sorted(modules)}"
+            )
+        selected = _dependency_closure(fields, modules)
+        modules = {name: modules[name] for name in modules if name in selected}
+
+    levels = DependencyResolver(dict(modules)).levels()
+    return ExecutionPlan(
+        tier=tier,
+        fields=fields,
+        levels=tuple(tuple(level) for level in levels),
+        modules=MappingProxyType(dict(modules)),
+    )
+
+
+class ExecutionPlanCache:
+    """
+    Compiles execution plans on first use and keeps them for the lifetime of
+    the process. The module set only changes on restart, so plans never expire.
+    """
+
+    def __init__(self, modules_by_tier: Dict[str, Mapping[str, Any]]):
+        self._modules_by_tier = modules_by_tier
+        self._plans: Dict[PlanKey, ExecutionPlan] = {}
+        self._lock = threading.Lock()
+
+    def get(self, tier: str, fields: Optional[Iterable[str]] = None) -> ExecutionPlan:
+        """Returns the cached plan for a tier and field subset, compiling it if needed."""
+        key: PlanKey = (tier, frozenset(fields) if fields is not None else None)
+        plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                if tier not in self._modules_by_tier:
+                    raise ValueError(
+                        f"Unknown tier '{tier}'. Available tiers: {list(self._modules_by_tier)}"
+                    )
+                plan = compile_execution_plan(
+                    tier, self._modules_by_tier[tier], key[1]
+                )
+                self._plans[key] = plan
+                logger.info(
+                    f"Execution plan compiled for tier '{tier}' "
+                    f"(fields: {sorted(key[1]) if key[1] is not None else 'all'}): "
+                    f"{[list(level) for level in plan.levels]}"
+                )
+        return plan
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """Describes every plan compiled so far."""
+        return [plan.describe() for plan in list(self._plans.values())]
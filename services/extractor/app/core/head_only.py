@@ -0,0 +1,108 @@
+# argus/services/extractor/app/core/head_only.py
+
+import re
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+# The outcomes reported in the 'head_only' entry of the timings block
+OUTCOME_HIT = "hit"
+OUTCOME_FALLBACK = "fallback"
+OUTCOME_NO_DATA = "no_data"
+
+# One token per match: a comment, a raw-text element (script or style, with its
+# content), the html start tag, a title element, a meta tag, or the end of the head.
+# Comments and non-JSON-LD scripts are matched only so their content is skipped.
+_TOKEN = re.compile(
+    r"<!--.*?-->"
+    r"|<(?P<raw>script|style)\b(?P<raw_attrs>[^>]*)>(?P<raw_text>.*?)</(?P=raw)\s*>"
+    r"|<(?P<html>html)\b[^>]*>"
+    r"|<(?P<title>title)\b[^>]*>.*?</title\s*>"
+    r"|<(?P<meta>meta)\b(?P<meta_attrs>[^>]*)>"
+    r"|<(?P<head_end>/head\s*>|body\b)",
+    re.IGNORECASE | re.DOTALL,
+)
+_ATTRIBUTE = re.compile(
+    r"""([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?""",
+)
+_JSON_LD_TYPE = "application/ld+json"
+# Meta tags read by the open_graph, description and brand modules
+_STRUCTURED_META = re.compile(r"^(og|product|twitter|article):", re.IGNORECASE)
+
+
+def _attributes(source: str) -> Dict[str, str]:
+    attributes: Dict[str, str] = {}
+    for match in _ATTRIBUTE.finditer(source):
+        name = match.group(1).lower()
+        if name not in attributes:
+            value = next((group for group in match.groups()[1:] if group is not None), "")
+            attributes[name] = value
+    return attributes
+
+
+class HeadScan:
+    """
+    The structured data of a page, found by scanning its HTML with a regex
+    tokenizer instead of parsing it: the JSON-LD scripts (anywhere on the page),
+    and the html start tag, the title and the meta tags of the head.
+
+    'html' is a synthetic document made of exactly those tags, copied verbatim,
+    which the regular modules can analyze at a fraction of the cost of the page.
+    """
+
+    __slots__ = ("html_tag", "title", "metas", "json_ld_scripts", "structured_metas")
+
+    def __init__(self):
+        self.html_tag = "<html>"
+        self.title: Optional[str] = None
+        self.metas: List[str] = []
+        self.json_ld_scripts: List[str] = []
+        self.structured_metas = 0
+
+    @property
+    def has_structured_data(self) -> bool:
+        return bool(self.json_ld_scripts or self.structured_metas)
+
+    @property
+    def html(self) -> str:
+        return "".join(
+            [self.html_tag, "<head>", self.title or "", *self.metas, *self.json_ld_scripts,
+             "</head><body></body></html>"]
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "json_ld_scripts": len(self.json_ld_scripts),
+            "metas": len(self.metas),
+            "structured_metas": self.structured_metas,
+            "title": self.title is not None,
+        }
+
+
+def scan_head(html_content: str) -> HeadScan:
+    """Scans a page for its JSON-LD scripts and its head's title and meta tags."""
+    scan = HeadScan()
+    in_head = True
+    for match in _TOKEN.finditer(html_content):
+        if match.group("raw") is not None:
+            if match.group("raw").lower() == "script":
+                script_type = _attributes(match.group("raw_attrs")).get("type", "")
+                if script_type.strip().lower() == _JSON_LD_TYPE and match.group("raw_text").strip():
+                    scan.json_ld_scripts.append(match.group(0))
+        elif not in_head:
+            # Past the head, only JSON-LD scripts are collected
+            continue
+        elif match.group("html") is not None:
+            scan.html_tag = match.group(0)
+        elif match.group("title") is not None:
+            if scan.title is None:
+                scan.title = match.group(0)
+        elif match.group("meta") is not None:
+            attributes = _attributes(match.group("meta_attrs"))
+            scan.metas.append(match.group(0))
+            key = attributes.get("property") or attributes.get("name") or ""
+            if _STRUCTURED_META.match(key):
+                scan.structured_metas += 1
+        elif match.group("head_end") is not None:
+            in_head = False
+    logger.debug(f"Head Scan: Found {scan.describe()}")
+    return scan
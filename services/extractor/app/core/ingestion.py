@@ -0,0 +1,140 @@
+# argus/services/extractor/app/core/ingestion.py
+
+from typing import Any, Dict, List, Tuple
+from bs4 import BeautifulSoup
+from bs4.builder import LXMLTreeBuilder, ParserRejectedMarkup
+from lxml import etree
+from loguru import logger
+from app.config import settings
+
+# Subtrees no module reads: they are not built at all on the streaming path
+DROPPED_TAGS = frozenset({"svg", "template", "style"})
+JSON_LD_TYPE = "application/ld+json"
+
+
+class StreamingTreeBuilder(LXMLTreeBuilder):
+    """
+    A bs4 tree builder that feeds the HTML to lxml's incremental parser in
+    chunks and filters the parser events before they become bs4 nodes.
+
+    Known-noise subtrees (svg, template, style and every script that is not
+    JSON-LD) are dropped while parsing, so they never take memory in the tree.
+    Once 'max_nodes' elements were built or 'max_bytes' bytes (UTF-8) were fed,
+    the rest of the page is skipped: the document is truncated, not rejected.
+    """
+
+    NAME = "argus-streaming-lxml"
+
+    def __init__(self, max_nodes: int, max_bytes: int, chunk_size: int, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.max_nodes = max_nodes
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        # One flag per open element: whether its start was passed on to bs4
+        self._kept: List[bool] = []
+        self.stats: Dict[str, Any] = {
+            "kept_nodes": 0,
+            "dropped_nodes": 0,
+            "fed_bytes": 0,
+            "truncated": False,
+        }
+
+    def _is_noise(self, tag: str, attrib: Any) -> bool:
+        if tag in DROPPED_TAGS:
+            return True
+        if tag == "script":
+            return (attrib.get("type") or "").strip().lower() != JSON_LD_TYPE
+        return False
+
+    def _is_full(self) -> bool:
+        return self.stats["kept_nodes"] >= self.max_nodes
+
+    def feed(self, markup: Any):
+        if not isinstance(markup, str):
+            # Bytes are decoded by bs4 before they reach a builder; keep its behaviour otherwise
+            return super().feed(markup)
+
+        self._kept = []
+        position = 0
+        fed_bytes = 0
+        try:
+            self.parser = self.parser_for(self.soup.original_encoding)
+            while position < len(markup) and fed_bytes < self.max_bytes and not self._is_full():
+                # A character takes at least one byte, so this never starts past the ceiling
+                size = min(self.chunk_size, self.max_bytes - fed_bytes)
+                chunk = markup[position:position + size]
+                self.parser.feed(chunk)
+                position += len(chunk)
+                fed_bytes += len(chunk.encode("utf-8"))
+            self.parser.close()
+        except (UnicodeDecodeError, LookupError, etree.ParserError) as e:
+            raise ParserRejectedMarkup(e)
+
+        self.stats["fed_bytes"] = fed_bytes
+        if position < len(markup):
+            self.stats["truncated"] = True
+            logger.warning(
+                f"Ingestion: Page truncated after {position} of {len(markup)} characters "
+                f"({fed_bytes} bytes, {self.stats['kept_nodes']} nodes kept)."
+            )
+
+    def start(self, tag: Any, attrib: Any, nsmap: Any = {}):
+        in_kept_element = self._in_kept_element()
+        keep = in_kept_element and not self._is_full() and not self._is_noise(tag, attrib)
+        self._kept.append(keep)
+        if keep:
+            self.stats["kept_nodes"] += 1
+            super().start(tag, attrib, nsmap)
+            return
+        self.stats["dropped_nodes"] += 1
+        if in_kept_element:
+            # The text around a dropped subtree stays two strings, as in a full parse
+            self.soup.endData()
+
+    def end(self, tag: Any):
+        # lxml balances its events, so every end matches the latest open start
+        kept = self._kept.pop() if self._kept else True
+        if kept:
+            super().end(tag)
+
+    def _in_kept_element(self) -> bool:
+        # Text is still added to open elements after the node ceiling; it is
+        # bounded by the chunk the parser is working through
+        return not self._kept or self._kept[-1]
+
+    def data(self, data: Any):
+        if self._in_kept_element():
+            super().data(data)
+
+    def comment(self, text: Any):
+        if self._in_kept_element():
+            super().comment(text)
+
+    def pi(self, target: Any, data: Any):
+        if self._in_kept_element():
+            super().pi(target, data)
+
+
+def uses_streaming(html_content: str) -> bool:
+    """Whether a page is large enough (in UTF-8 bytes) to be ingested by the streaming builder."""
+    ingestion = settings.ingestion
+    threshold = ingestion.streaming_threshold_bytes
+    # A character takes one to four bytes, so most pages are decided without encoding them
+    if not ingestion.enabled or len(html_content) * 4 < threshold:
+        return False
+    return len(html_content) >= threshold or len(html_content.encode("utf-8")) >= threshold
+
+
+def parse_streaming(html_content: str) -> Tuple[BeautifulSoup, Dict[str, Any]]:
+    """
+    Parses a page with the streaming builder. Returns the soup and the
+    builder's stats (kept and dropped nodes, fed bytes, truncated).
+    """
+    ingestion = settings.ingestion
+    builder = StreamingTreeBuilder(
+        max_nodes=ingestion.max_nodes,
+        max_bytes=ingestion.max_bytes,
+        chunk_size=ingestion.chunk_size,
+    )
+    soup = BeautifulSoup(html_content, builder=builder)
+    return soup, builder.stats
@@ -0,0 +1,141 @@
+# argus/services/extractor/app/core/language.py
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+from langdetect import DetectorFactory, detect
+from loguru import logger
+from app.config import settings
+from app.core.document import PageDocument
+from app.core.dom import DomNode
+from app.utils.html_processor import sample_visible_text
+
+# langdetect is randomized; a fixed seed gives the same answer for the same text
+DetectorFactory.seed = 0
+
+# The primary subtag of a language tag: "nl" in "nl-NL", "nl_BE" or "NL"
+_LANGUAGE_TAG = re.compile(r"^\s*([A-Za-z]{2,3})(?:[-_][A-Za-z0-9]+)*\s*$")
+
+# Where the resolved language came from, in order of preference
+SOURCE_HTML_LANG = "html_lang"
+SOURCE_OG_LOCALE = "og_locale"
+SOURCE_CONTENT_LANGUAGE = "content_language"
+SOURCE_DOMAIN_CACHE = "domain_cache"
+SOURCE_DETECTED = "detected"
+SOURCE_DEFAULT = "default"
+
+
+def normalize_language_tag(value: Optional[str]) -> Optional[str]:
+    """Returns the lowercase primary language of a tag, or None if it is not one."""
+    if not value:
+        return None
+    # content-language may list several languages; the first one is the main one
+    match = _LANGUAGE_TAG.match(value.split(",")[0])
+    return match.group(1).lower() if match else None
+
+
+def _meta_content(dom: DomNode, **attrs: str) -> Optional[str]:
+    for name, value in attrs.items():
+        for meta in dom.find_all("meta", **{name: True}):
+            if meta.get(name, "").strip().lower() == value:
+                return meta.get("content")
+    return None
+
+
+def declared_language(dom: DomNode) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Returns the language the page declares about itself, and where it was found:
+    <html lang>, then og:locale, then the content-language meta tag.
+    """
+    html_tag = dom.find("html")
+    if html_tag is not None:
+        lang_code = normalize_language_tag(html_tag.get("lang") or html_tag.get("xml:lang"))
+        if lang_code:
+            return lang_code, SOURCE_HTML_LANG
+
+    lang_code = normalize_language_tag(_meta_content(dom, property="og:locale"))
+    if lang_code:
+        return lang_code, SOURCE_OG_LOCALE
+
+    lang_code = normalize_language_tag(
+        _meta_content(dom, **{"http-equiv": "content-language"})
+    )
+    if lang_code:
+        return lang_code, SOURCE_CONTENT_LANGUAGE
+
+    return None, None
+
+
+class LanguageResolver:
+    """
+    Resolves the language of a page, cheapest source first: what the page
+    declares, then the language recently resolved for the same domain, and only
+    then statistical detection on a bounded sample of the visible text.
+
+    The declaration is read from the 'dom' view, which the ported modules read
+    as well; only detection needs the raw DOM, so a page that declares its
+    language and is served by those modules alone is parsed once.
+
+    Resolved languages are cached per domain for 'domain_cache_ttl_seconds', in a
+    bounded LRU that is shared by the requests of one analyzer.
+    """
+
+    def __init__(self):
+        language_settings = settings.language
+        self.default = language_settings.default
+        self.sample_chars = language_settings.detection_sample_chars
+        self.ttl_seconds = language_settings.domain_cache_ttl_seconds
+        self.max_entries = language_settings.domain_cache_max_entries
+        # domain -> (language, expires at)
+        self._domains: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, document: PageDocument, url: str) -> Tuple[str, str]:
+        """Returns the language of the page and the source it was resolved from."""
+        domain = urlparse(url).netloc.lower()
+
+        lang_code, source = declared_language(document.dom)
+        if lang_code is None:
+            lang_code = self._cached(domain)
+            if lang_code is not None:
+                # Not remembered again, so the entry still expires after its TTL
+                return lang_code, SOURCE_DOMAIN_CACHE
+            lang_code, source = self._detect(document), SOURCE_DETECTED
+        if lang_code is None:
+            return self.default, SOURCE_DEFAULT
+
+        self._remember(domain, lang_code)
+        return lang_code, source
+
+    def _detect(self, document: PageDocument) -> Optional[str]:
+        sample = sample_visible_text(document.raw_dom, self.sample_chars)
+        try:
+            return normalize_language_tag(detect(sample))
+        except Exception as e:
+            logger.debug(f"Language: Detection failed on a {len(sample)} character sample: {e}")
+            return None
+
+    def _cached(self, domain: str) -> Optional[str]:
+        if not domain:
+            return None
+        with self._lock:
+            entry = self._domains.get(domain)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._domains[domain]
+                return None
+            self._domains.move_to_end(domain)
+            return entry[0]
+
+    def _remember(self, domain: str, lang_code: str):
+        if not domain or self.ttl_seconds == 0:
+            return
+        with self._lock:
+            self._domains[domain] = (lang_code, time.monotonic() + self.ttl_seconds)
+            self._domains.move_to_end(domain)
+            while len(self._domains) > self.max_entries:
+                self._domains.popitem(last=False)
@@ -0,0 +1,121 @@
+# argus/services/extractor/app/core/memo.py
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+from bs4 import BeautifulSoup, Tag
+from app.core.context import shared_context
+from app.core.token_index import TokenIndex
+
+T = TypeVar("T")
+
+# The <img> tags the image parsers consider: those with an absolute src
+_ABSOLUTE_SRC = re.compile(r"https?://")
+
+
+class DocumentMemo:
+    """
+    The facts parsers derive from the trees of one document, computed once.
+
+    The same facts are asked for by several parsers of several modules (the
+    brand parsers check every candidate against the main title, the title,
+    price and availability parsers read the text of the same nodes), and the
+    trees do not change once built. Every fact is kept per node: the raw and
+    cleaned views, and any node within them, have their own entries. An entry
+    holds its node, so the id() it is keyed by cannot be reused while it lives.
+
+    Lookups by class, id, itemprop or tag name go through find_all(), which
+    answers them from one token index per tree instead of scanning it.
+
+    When 'count_hits' is on (debug logging), the hits and misses per kind of
+    fact are counted and reported with the document stats.
+    """
+
+    __slots__ = ("_entries", "count_hits", "indexed", "hits", "misses")
+
+    def __init__(self, count_hits: bool = False, indexed: bool = True):
+        self._entries: Dict[Tuple[str, int], Tuple[Any, Any]] = {}
+        # A memo used for a single lookup is not worth indexing a tree for
+        self.indexed = indexed
+        self.count_hits = count_hits
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+    def cached(self, kind: str, node: Any, compute: Callable[[], T]) -> T:
+        """The 'kind' fact of a node: computed by 'compute' on first request only."""
+        key = (kind, id(node))
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self.count_hits:
+                self.hits[kind] = self.hits.get(kind, 0) + 1
+            return entry[1]
+        value = compute()
+        # Concurrent modules may both compute a fact; they get the same value
+        self._entries[key] = (node, value)
+        if self.count_hits:
+            self.misses[kind] = self.misses.get(kind, 0) + 1
+        return value
+
+    def text(self, node: Tag) -> str:
+        """node.get_text(strip=True)"""
+        return self.cached("text", node, lambda: node.get_text(strip=True))
+
+    def body_text(self, soup: Any) -> str:
+        """The stripped text of the <body>, or "" if the document has none."""
+
+        def compute() -> str:
+            body = soup.find("body")
+            return self.text(body) if body is not None else ""
+
+        return self.cached("body_text", soup, compute)
+
+    def h1s(self, soup: BeautifulSoup) -> List[Tag]:
+        """Every <h1> of the document, in document order."""
+        return self.cached("h1s", soup, lambda: soup.find_all("h1"))
+
+    def images(self, node: Tag) -> List[Tag]:
+        """The <img> tags under a node whose src is an absolute http(s) URL."""
+        return self.cached(
+            "images", node, lambda: node.find_all("img", src=_ABSOLUTE_SRC)
+        )
+
+    def token_index(self, soup: BeautifulSoup) -> TokenIndex:
+        """The class/id/itemprop and tag name index of a tree (see app.core.token_index)."""
+        return self.cached("token_index", soup, lambda: TokenIndex(soup))
+
+    def find_all(self, node: Any, name: Any = None, limit: Optional[int] = None, **attrs: Any) -> List[Tag]:
+        """
+        node.find_all(name, limit=limit, **attrs), answered by the index of
+        node's tree. A DomNode (see app.core.dom) runs the lookup itself.
+        """
+        if not self.indexed or not isinstance(node, Tag):
+            return node.find_all(name, limit=limit, **attrs)
+        root = node
+        while root.parent is not None:
+            root = root.parent
+        return self.token_index(root).find_all(node, name, limit=limit, **attrs)
+
+    def find_any(self, node: Any, queries: List[Tuple[Any, Dict[str, Any]]]) -> List[Tag]:
+        """The elements under node matching any of the (name, attrs) queries, in document order."""
+        if not isinstance(node, Tag):
+            return node.find_any(queries)
+        root = node
+        while root.parent is not None:
+            root = root.parent
+        return self.token_index(root).find_any(node, queries)
+
+    def describe(self) -> Dict[str, Any]:
+        return {"hits": dict(self.hits), "misses": dict(self.misses)}
+
+    def clear(self):
+        """Drops every entry, and with them the references into the trees."""
+        self._entries.clear()
+
+
+def current_memo() -> DocumentMemo:
+    """
+    The memo of the document being analyzed. Outside of a request (or for a
+    context without a document), a fresh memo: the facts are simply computed.
+    """
+    context = shared_context.current()
+    document = context.document if context is not None else None
+    return document.memo if document is not None else DocumentMemo(indexed=False)
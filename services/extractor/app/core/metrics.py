@@ -0,0 +1,99 @@
+# argus/services/extractor/app/core/metrics.py
+
+from typing import Dict, Any
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+
+# A dedicated registry, so only the extractor's own metrics are exported
+registry = CollectorRegistry()
+
+# Bucket bounds in seconds: parsers usually take microseconds to milliseconds,
+# whole analyses up to a few seconds
+_FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+_SLOW_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+ANALYSIS_DURATION = Histogram(
+    "argus_analysis_duration_seconds",
+    "Duration of a full page analysis.",
+    buckets=_SLOW_BUCKETS,
+    registry=registry,
+)
+MODULE_DURATION = Histogram(
+    "argus_module_duration_seconds",
+    "Duration of a module's extract() call.",
+    ["module"],
+    buckets=_FAST_BUCKETS,
+    registry=registry,
+)
+PARSER_DURATION = Histogram(
+    "argus_parser_duration_seconds",
+    "Duration of a parser call inside a module orchestrator.",
+    ["module", "parser"],
+    buckets=_FAST_BUCKETS,
+    registry=registry,
+)
+PARSER_WINS = Counter(
+    "argus_parser_wins_total",
+    "Number of times a parser produced the result a module returned.",
+    ["module", "parser"],
+    registry=registry,
+)
+ANALYSIS_PEAK_MEMORY = Histogram(
+    "argus_analysis_peak_memory_bytes",
+    "Peak memory allocated by one analysis (only with the memory report enabled).",
+    buckets=tuple(mb * 1024 * 1024 for mb in (1, 5, 10, 25, 50, 100, 250, 500, 1000)),
+    registry=registry,
+)
+RESULT_CACHE_LOOKUPS = Counter(
+    "argus_result_cache_lookups_total",
+    "Result cache lookups, by outcome (memory_hit, disk_hit or miss).",
+    ["result"],
+    registry=registry,
+)
+
+WRAPPER_OUTCOMES = Counter(
+    "argus_wrapper_outcomes_total",
+    "Outcomes of the induced wrapper fast path (hit, miss, validation_failed, drift_ok, ...).",
+    ["outcome"],
+    registry=registry,
+)
+
+HEAD_ONLY_OUTCOMES = Counter(
+    "argus_head_only_outcomes_total",
+    "Outcomes of the head-only mode (hit, fallback or no_data).",
+    ["outcome"],
+    registry=registry,
+)
+
+
+def observe_timings(timings: Dict[str, Any]):
+    """Feeds the timings block of one analysis into the histograms and counters."""
+    ANALYSIS_DURATION.observe(timings["total_ms"] / 1000)
+    for module_name, elapsed_ms in timings["modules"].items():
+        MODULE_DURATION.labels(module=module_name).observe(elapsed_ms / 1000)
+    for module_name, parsers in timings["parsers"].items():
+        for parser_name, elapsed_ms in parsers.items():
+            PARSER_DURATION.labels(module=module_name, parser=parser_name).observe(
+                elapsed_ms / 1000
+            )
+    for module_name, parser_name in timings["winners"].items():
+        PARSER_WINS.labels(module=module_name, parser=parser_name).inc()
+    if timings.get("memory"):
+        ANALYSIS_PEAK_MEMORY.observe(timings["memory"]["peak_bytes"])
+    if timings.get("wrapper"):
+        WRAPPER_OUTCOMES.labels(outcome=timings["wrapper"]).inc()
+    if timings.get("head_only"):
+        HEAD_ONLY_OUTCOMES.labels(outcome=timings["head_only"]).inc()
+
+
+def render_metrics() -> bytes:
+    """Renders all metrics in the Prometheus text format."""
+    return generate_latest(registry)
+
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
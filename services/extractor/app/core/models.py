@@ -1,7 +1,7 @@
 # argus/services/extractor/app/core/models.py
 
-from pydantic import BaseModel, Field, create_model
-from typing import Dict, Any, Optional, List, Type
+from pydantic import BaseModel, create_model
+from typing import Dict, Any, Optional, List, Type, Iterable
 
 # Import the new building blocks from types.py
 from app.core.types import FieldExtractionStatus, ExtractionResult
@@ -9,30 +9,54 @@ from app.core.types import FieldExtractionStatus, ExtractionResult
 
 class _BaseProductData(BaseModel):
     """
-    The base class for our dynamic product data model.
-    It contains the core scoreboard and metadata functionality.
+    The base class for our dynamic product data model: the typed shape of the
+    extracted data. It is only built once per request, from the resolved
+    scoreboard, to produce the final results.
     """
 
-    all_results: Dict[str, List[ExtractionResult]] = Field(
-        default_factory=dict, exclude=True
-    )
-    field_status: Dict[str, FieldExtractionStatus] = Field(
-        default_factory=dict, exclude=True
-    )
-    selectors_used: Dict[str, str] = Field(default_factory=dict, exclude=True)
+
+class Scoreboard:
+    """
+    The per-request scoreboard: every candidate result for every field, and
+    after resolving, the winning value, status and selector per field.
+
+    Plain slotted containers, so adding a candidate is a list append instead
+    of a pydantic model allocation.
+    """
+
+    __slots__ = ("field_names", "all_results", "values", "field_status", "selectors_used")
+
+    def __init__(self, field_names: Iterable[str]):
+        # The fields of the product data model (a frozenset, shared between requests)
+        self.field_names = field_names
+        self.all_results: Dict[str, List[ExtractionResult]] = {}
+        self.values: Dict[str, Any] = {}
+        self.field_status: Dict[str, FieldExtractionStatus] = {}
+        self.selectors_used: Dict[str, str] = {}
+
+    def has_field(self, field_name: str) -> bool:
+        return field_name in self.field_names
 
     def add_result(self, field_name: str, result: ExtractionResult):
         """Adds a new found result to the scoreboard."""
-        if field_name not in self.all_results:
-            self.all_results[field_name] = []
-        self.all_results[field_name].append(result)
-
-    def get_final_results(self) -> Dict[str, Any]:
-        """Returns the final model data, excluding metadata."""
-        # This helper function makes cleanup in the analyzer easier
-        return self.model_dump(
-            exclude={"all_results", "field_status", "selectors_used"}
-        )
+        results = self.all_results.get(field_name)
+        if results is None:
+            self.all_results[field_name] = [result]
+        else:
+            results.append(result)
+
+    def set_winner(self, field_name: str, result: ExtractionResult):
+        """Makes a result the final value of a field."""
+        self.values[field_name] = result.value
+        self.field_status[field_name] = result.status
+        self.selectors_used[field_name] = result.source
+
+    def get_final_results(self, model: Type[_BaseProductData]) -> Dict[str, Any]:
+        """
+        Converts the resolved values into the product data model, once, and
+        returns its data (every field, None if nothing was found).
+        """
+        return model.model_construct(**self.values).model_dump()
 
 
 # The Dynamic Model Factory
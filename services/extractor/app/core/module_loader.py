@@ -2,6 +2,7 @@
 
 from typing import Dict, Any
 from loguru import logger
+from app.core.document import DOCUMENT_VIEWS
 import importlib
 import pkgutil
 
@@ -31,6 +32,17 @@ def discover_and_load_modules(package_path: str) -> Dict[str, Any]:
             module = importlib.import_module(full_extract_path)
 
             if hasattr(module, "extract") and callable(getattr(module, "extract")):
+                unknown_views = [
+                    view
+                    for view in getattr(module, "REQUIRES_VIEWS", [])
+                    if view not in DOCUMENT_VIEWS
+                ]
+                if unknown_views:
+                    logger.error(
+                        f"Module '{module_name}' requires unknown document views "
+                        f"{unknown_views}. Available views: {DOCUMENT_VIEWS}. Skipping."
+                    )
+                    continue
                 loaded_modules[module_name] = module
                 logger.debug(
                     f"Module '{module_name}' from '{package_path}' successfully loaded."
@@ -0,0 +1,67 @@
+# argus/services/extractor/app/core/parser_chain.py
+
+from typing import Any, Callable, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+from loguru import logger
+from app.core.context import shared_context
+from app.core.timings import get_parser_name
+from app.core.types import FieldExtractionStatus
+
+ParserResult = Tuple[Any, str, FieldExtractionStatus, int]
+# A parser and the positional arguments to call it with
+ParserCall = Tuple[Callable[..., ParserResult], Tuple[Any, ...]]
+
+NOT_FOUND_RESULT: ParserResult = (None, "NOT_FOUND", FieldExtractionStatus.NOT_FOUND, 0)
+
+
+def _found(value: Any) -> bool:
+    return bool(value)
+
+
+def run_first_match(
+    parsers: Sequence[ParserCall],
+    accept: Callable[[Any], bool] = _found,
+) -> ParserResult:
+    """
+    Runs a priority chain of parsers and returns the first result whose value
+    is accepted (truthy by default), or a NOT_FOUND result.
+
+    With adaptive parser ordering enabled, the parser that has been producing
+    this field on the current domain is tried first (see ParserStatsStore), and
+    every run is recorded to keep those statistics up to date.
+    """
+    context = shared_context.current()
+    parser_stats = context.parser_stats if context is not None else None
+    field = context.current_module if context is not None else None
+    domain = urlparse(context.current_url).netloc.lower() if context is not None else ""
+    if parser_stats is not None and not (field and parser_stats.is_enabled_for(domain)):
+        parser_stats = None
+
+    names = [get_parser_name(parser) for parser, _ in parsers]
+    order = (
+        parser_stats.plan(domain, field, names)
+        if parser_stats is not None
+        else range(len(parsers))
+    )
+    if parser_stats is not None and order[0] != 0:
+        logger.debug(
+            f"Parser Chain: Trying '{names[order[0]]}' first for '{field}' on {domain}."
+        )
+
+    attempted = []
+    winner: Optional[str] = None
+    result = NOT_FOUND_RESULT
+    for index in order:
+        parser, args = parsers[index]
+        attempted.append(names[index])
+        parser_result = parser(*args)
+        if accept(parser_result[0]):
+            winner, result = names[index], parser_result
+            logger.info(
+                f"Parser Chain: '{field}' extracted with '{winner}'. Score: {result[3]}"
+            )
+            break
+
+    if parser_stats is not None:
+        parser_stats.record(domain, field, attempted, winner)
+    return result
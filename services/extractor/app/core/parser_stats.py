@@ -0,0 +1,187 @@
+# argus/services/extractor/app/core/parser_stats.py
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from loguru import logger
+from app.config import settings, BASE_DIR
+
+# Stats key: (domain, field)
+StatsKey = Tuple[str, str]
+
+
+class FieldStats:
+    """
+    Decayed statistics of one field on one domain: how often the chain ran, and
+    per parser how often it was tried and how often it produced the result.
+    Every new observation first multiplies all counters by the decay factor, so
+    old pages weigh less and a site redesign is picked up after a few requests.
+    """
+
+    __slots__ = ("observations", "attempts", "wins")
+
+    def __init__(self):
+        self.observations = 0.0
+        self.attempts: Dict[str, float] = {}
+        self.wins: Dict[str, float] = {}
+
+    def observe(self, attempted: Sequence[str], winner: Optional[str], decay: float):
+        self.observations = self.observations * decay + 1
+        for counters in (self.attempts, self.wins):
+            for name in counters:
+                counters[name] *= decay
+        for name in attempted:
+            self.attempts[name] = self.attempts.get(name, 0.0) + 1
+        if winner is not None:
+            self.wins[winner] = self.wins.get(winner, 0.0) + 1
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "observations": self.observations,
+            "attempts": self.attempts,
+            "wins": self.wins,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "FieldStats":
+        stats = cls()
+        stats.observations = float(data.get("observations", 0.0))
+        stats.attempts = {k: float(v) for k, v in dict(data.get("attempts", {})).items()}
+        stats.wins = {k: float(v) for k, v in dict(data.get("wins", {})).items()}
+        return stats
+
+
+class ParserStatsStore:
+    """
+    Learns which parser wins each field per domain, to try that parser first.
+
+    The stats are kept in memory (a bounded LRU of (domain, field) entries) and,
+    if enabled, flushed to a local SQLite file every 'flush_interval_seconds', so
+    they survive restarts and are shared (last writer wins) between workers.
+    """
+
+    def __init__(self):
+        adaptive_settings = settings.adaptive_parsers
+        self.decay = adaptive_settings.decay
+        self.min_observations = adaptive_settings.min_observations
+        self.min_confidence = adaptive_settings.min_confidence
+        self.skip_unproductive = adaptive_settings.skip_unproductive
+        self.disabled_domains = {domain.lower() for domain in adaptive_settings.disabled_domains}
+        self.max_entries = adaptive_settings.max_entries
+        self.flush_interval_seconds = adaptive_settings.flush_interval_seconds
+
+        self._stats: "OrderedDict[StatsKey, FieldStats]" = OrderedDict()
+        self._dirty: set = set()
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+        self._disk: Optional[sqlite3.Connection] = None
+        if adaptive_settings.persist:
+            self._open_disk(BASE_DIR / adaptive_settings.path)
+
+    def _open_disk(self, path: Path):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._disk = sqlite3.connect(path, check_same_thread=False)
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS parser_stats ("
+                "domain TEXT, field TEXT, payload TEXT, updated_at REAL, "
+                "PRIMARY KEY (domain, field))"
+            )
+            rows = self._disk.execute(
+                "SELECT domain, field, payload FROM parser_stats "
+                "ORDER BY updated_at DESC LIMIT ?",
+                (self.max_entries,),
+            ).fetchall()
+            for domain, field, payload in reversed(rows):
+                self._stats[(domain, field)] = FieldStats.from_dict(json.loads(payload))
+            logger.info(
+                f"Parser Stats: Loaded {len(rows)} (domain, field) entries from {path}."
+            )
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            logger.error(f"Parser Stats: Could not open {path}: {e}")
+            self._disk = None
+
+    def is_enabled_for(self, domain: str) -> bool:
+        return bool(domain) and domain not in self.disabled_domains
+
+    def plan(self, domain: str, field: str, parser_names: Sequence[str]) -> List[int]:
+        """
+        Returns the order (indexes into 'parser_names') in which to try the parsers.
+
+        When one parser produced the result on at least 'min_confidence' of the
+        recent pages of the domain, it is tried first and the rest of the chain
+        follows in its normal order, optionally without the parsers that were
+        tried often but never found anything. Otherwise the full chain runs as is.
+        """
+        full_chain = list(range(len(parser_names)))
+        with self._lock:
+            stats = self._stats.get((domain, field))
+            if stats is None or stats.observations < self.min_observations:
+                return full_chain
+            winner, wins = max(stats.wins.items(), key=lambda item: item[1], default=(None, 0.0))
+            if winner not in parser_names or wins / stats.observations < self.min_confidence:
+                return full_chain
+
+            first = parser_names.index(winner)
+            order = [first]
+            for index, name in enumerate(parser_names):
+                if index == first:
+                    continue
+                if (
+                    self.skip_unproductive
+                    and stats.attempts.get(name, 0.0) >= self.min_observations
+                    and stats.wins.get(name, 0.0) == 0.0
+                ):
+                    continue
+                order.append(index)
+            return order
+
+    def record(self, domain: str, field: str, attempted: Sequence[str], winner: Optional[str]):
+        """Records which parsers a chain tried and which one produced its result."""
+        key = (domain, field)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = FieldStats()
+            stats.observe(attempted, winner, self.decay)
+            self._stats.move_to_end(key)
+            self._dirty.add(key)
+            while len(self._stats) > self.max_entries:
+                evicted, _ = self._stats.popitem(last=False)
+                self._dirty.discard(evicted)
+            due = time.monotonic() - self._last_flush >= self.flush_interval_seconds
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Writes the changed entries to the SQLite file."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if self._disk is None or not self._dirty:
+                self._dirty.clear()
+                return
+            rows = [
+                (domain, field, json.dumps(self._stats[(domain, field)].to_dict()), time.time())
+                for domain, field in self._dirty
+                if (domain, field) in self._stats
+            ]
+            self._dirty.clear()
+            try:
+                self._disk.executemany(
+                    "INSERT OR REPLACE INTO parser_stats VALUES (?, ?, ?, ?)", rows
+                )
+                self._disk.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Parser Stats: Could not write the stats: {e}")
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
@@ -0,0 +1,212 @@
+# argus/services/extractor/app/core/result_cache.py
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlparse
+from loguru import logger
+from app.config import settings, BASE_DIR
+from app.core.metrics import RESULT_CACHE_LOOKUPS
+
+# A cached entry: (extracted data, timings block of the analysis that produced it)
+CacheEntry = Tuple[Dict[str, Any], Dict[str, Any]]
+
+
+class ResultCache:
+    """
+    A content-addressed cache of extraction results.
+
+    The key is a hash of the normalized HTML (volatile tokens such as nonces and
+    CSRF tokens removed), the URL host, the use_llm flag and the versions of
+    everything else that can change the result: the module set and its code, the
+    pattern files and the relevant configuration.
+
+    Lookups go to a bounded in-memory LRU first and then, if enabled, to a
+    SQLite file that survives restarts. Cached data is shared between callers
+    and must be treated as read-only.
+    """
+
+    def __init__(self, analyzer_version: str, pattern_version: str):
+        cache_settings = settings.result_cache
+        self.enabled = cache_settings.enabled
+        self.max_entries = cache_settings.max_entries
+        self._volatile_patterns = [
+            re.compile(pattern) for pattern in cache_settings.volatile_patterns
+        ]
+        self._version = hashlib.sha256(
+            f"{analyzer_version}|{pattern_version}|{cache_settings.version}".encode(
+                "utf-8"
+            )
+        ).hexdigest()
+
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+        self._disk: Optional[sqlite3.Connection] = None
+        self._disk_max_entries = cache_settings.disk_max_entries
+        if self.enabled and cache_settings.disk_enabled:
+            self._open_disk(BASE_DIR / cache_settings.disk_path)
+
+    def _open_disk(self, path: Path):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._disk = sqlite3.connect(path, check_same_thread=False)
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, version TEXT, payload TEXT, accessed_at REAL)"
+            )
+            # Entries written by an older module set or pattern version can never hit again
+            deleted = self._disk.execute(
+                "DELETE FROM results WHERE version != ?", (self._version,)
+            ).rowcount
+            self._disk.commit()
+            logger.info(
+                f"Result Cache: Disk tier opened at {path} ({deleted} outdated entries removed)."
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Result Cache: Could not open the disk tier at {path}: {e}")
+            self._disk = None
+
+    @property
+    def has_disk_tier(self) -> bool:
+        return self._disk is not None
+
+    def make_key(
+        self,
+        html_content: str,
+        url: str,
+        use_llm: bool,
+        fields: Optional[List[str]] = None,
+    ) -> str:
+        """Builds the content-addressed key for one request."""
+        normalized_html = html_content
+        for pattern in self._volatile_patterns:
+            normalized_html = pattern.sub("", normalized_html)
+
+        digest = hashlib.sha256()
+        digest.update(self._version.encode("utf-8"))
+        field_subset = ",".join(sorted(set(fields))) if fields is not None else "*"
+        digest.update(
+            f"|{urlparse(url).netloc.lower()}|{use_llm}|{field_subset}|".encode("utf-8")
+        )
+        digest.update(normalized_html.encode("utf-8", errors="surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns the cached entry for a key, or None (and counts the hit or miss)."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                RESULT_CACHE_LOOKUPS.labels(result="memory_hit").inc()
+                return entry
+
+        entry = self._get_from_disk(key)
+        with self._lock:
+            if entry is not None:
+                self.stats["disk_hits"] += 1
+                self._put_in_memory(key, entry)
+            else:
+                self.stats["misses"] += 1
+        RESULT_CACHE_LOOKUPS.labels(result="disk_hit" if entry else "miss").inc()
+        return entry
+
+    def put(self, key: str, entry: CacheEntry):
+        """Stores the result of an analysis."""
+        with self._lock:
+            self._put_in_memory(key, entry)
+        self._put_on_disk(key, entry)
+
+    def _put_in_memory(self, key: str, entry: CacheEntry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _get_from_disk(self, key: str) -> Optional[CacheEntry]:
+        if self._disk is None:
+            return None
+        try:
+            with self._lock:
+                row = self._disk.execute(
+                    "SELECT payload FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._disk.execute(
+                    "UPDATE results SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+                self._disk.commit()
+            payload = json.loads(row[0])
+            return payload["data"], payload["timings"]
+        except (sqlite3.Error, ValueError, KeyError) as e:
+            logger.warning(f"Result Cache: Could not read from the disk tier: {e}")
+            return None
+
+    def _put_on_disk(self, key: str, entry: CacheEntry):
+        if self._disk is None:
+            return
+        try:
+            payload = json.dumps({"data": entry[0], "timings": entry[1]})
+            with self._lock:
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                    (key, self._version, payload, time.time()),
+                )
+                # Evict the least recently used entries beyond the limit
+                self._disk.execute(
+                    "DELETE FROM results WHERE key IN ("
+                    "SELECT key FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self._disk_max_entries,),
+                )
+                self._disk.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Result Cache: Could not write to the disk tier: {e}")
+
+    def describe(self) -> Dict[str, Any]:
+        """The cache size and hit/miss counters, used by the debug endpoint."""
+        with self._lock:
+            lookups = sum(self.stats.values())
+            hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+            return {
+                "enabled": self.enabled,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "disk_enabled": self._disk is not None,
+                **self.stats,
+                "hit_ratio": round(hits / lookups, 4) if lookups else None,
+            }
+
+    def close(self):
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+
+def compute_code_version(modules: Dict[str, Any], extra_files: List[Path]) -> str:
+    """
+    Hashes the names and source files of the modules, plus any extra files.
+    Any code change in a module package therefore gives a new version.
+    """
+    digest = hashlib.sha256()
+    source_files = set(extra_files)
+    for name in sorted(modules):
+        digest.update(name.encode("utf-8"))
+        module_file = getattr(modules[name], "__file__", None)
+        if module_file:
+            source_files.update(Path(module_file).parent.rglob("*.py"))
+    for path in sorted(source_files):
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(str(path).encode("utf-8"))
+    return digest.hexdigest()[:16]
@@ -0,0 +1,195 @@
+# argus/services/extractor/app/core/timings.py
+
+import functools
+import threading
+import time
+import tracemalloc
+from typing import Dict, Any, List, Optional, Tuple, Callable
+from loguru import logger
+from app.core.context import shared_context
+from app.core.types import FieldExtractionStatus
+
+
+class TimeBudget:
+    """
+    The latency budget of one analysis. Once it has run out, low-priority
+    parsers are skipped instead of run.
+    """
+
+    __slots__ = ("budget_ms", "_deadline")
+
+    def __init__(self, budget_ms: Optional[float]):
+        self.budget_ms = budget_ms
+        self._deadline = (
+            time.perf_counter() + budget_ms / 1000 if budget_ms is not None else None
+        )
+
+    @property
+    def exhausted(self) -> bool:
+        return self._deadline is not None and time.perf_counter() >= self._deadline
+
+
+class MemoryProbe:
+    """
+    Measures the memory of one analysis with tracemalloc: the peak allocated
+    on top of what was in use when the analysis started, and what is still
+    allocated after its teardown. A probe that started tracing stops it again,
+    so later allocations of the worker are not slowed down by it.
+
+    tracemalloc counts the whole process, so the numbers are only exact when
+    one analysis runs at a time per process (the default worker setup).
+    """
+
+    __slots__ = ("_baseline", "_started_tracing")
+
+    def __init__(self):
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def stop(self):
+        """Stops tracing if this probe started it; safe to call more than once."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def report(self) -> Dict[str, int]:
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "peak_bytes": max(0, peak - self._baseline),
+            "retained_bytes": current - self._baseline,
+        }
+
+
+class RequestTimings:
+    """
+    Collects the timings of one analysis: the duration of every module, of every
+    parser call inside the module orchestrators, and which parser won each field.
+
+    The object travels back from the worker process with the result, so the
+    metrics can be aggregated in the API process.
+    """
+
+    def __init__(self):
+        self.total_ms: float = 0.0
+        self.modules: Dict[str, float] = {}
+        self.parsers: Dict[str, Dict[str, float]] = {}
+        self.winners: Dict[str, str] = {}
+        # Parse and view-building stats of the page document
+        self.document: Dict[str, Any] = {}
+        # The time budget of the request and the parsers skipped because it ran out
+        self.budget_ms: Optional[float] = None
+        self.skipped_parsers: List[str] = []
+        # Peak and retained bytes, only when the memory report is enabled
+        self.memory: Optional[Dict[str, int]] = None
+        # The outcome of the wrapper fast path, when wrappers are enabled
+        self.wrapper: Optional[str] = None
+        # The outcome of the head-only mode, when it is enabled
+        self.head_only: Optional[str] = None
+        # Per module: (parser name, value, selector) of every parser that found something
+        self._candidates: Dict[str, List[Tuple[str, Any, str]]] = {}
+        self._lock = threading.Lock()
+
+    def record_module(self, module_name: str, elapsed_ms: float, output: Any):
+        """Records a module's duration and works out which of its parsers won."""
+        with self._lock:
+            self.modules[module_name] = round(elapsed_ms, 3)
+            if not output or output[0] is None:
+                return
+            value, selector = output[0], output[1]
+            for parser_name, parser_value, parser_selector in self._candidates.get(
+                module_name, []
+            ):
+                if parser_selector == selector and parser_value == value:
+                    self.winners[module_name] = parser_name
+                    break
+
+    def record_parser(
+        self, module_name: str, parser_name: str, elapsed_ms: float, result: Any
+    ):
+        with self._lock:
+            module_parsers = self.parsers.setdefault(module_name, {})
+            module_parsers[parser_name] = round(
+                module_parsers.get(parser_name, 0.0) + elapsed_ms, 3
+            )
+            if isinstance(result, tuple) and len(result) == 4 and result[0] is not None:
+                self._candidates.setdefault(module_name, []).append(
+                    (parser_name, result[0], result[1])
+                )
+
+    def record_skipped(self, module_name: str, parser_name: str):
+        with self._lock:
+            self.skipped_parsers.append(f"{module_name}.{parser_name}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The JSON-friendly timings block (all durations in milliseconds)."""
+        with self._lock:
+            return {
+                "total_ms": round(self.total_ms, 3),
+                "modules": dict(self.modules),
+                "parsers": {name: dict(parsers) for name, parsers in self.parsers.items()},
+                "winners": dict(self.winners),
+                "document": dict(self.document),
+                "budget_ms": self.budget_ms,
+                "skipped_parsers": list(self.skipped_parsers),
+                "memory": dict(self.memory) if self.memory is not None else None,
+                "wrapper": self.wrapper,
+                "head_only": self.head_only,
+            }
+
+
+def timed_parser(func: Optional[Callable] = None, *, low_priority: bool = False):
+    """
+    Decorator for the parsers that the module orchestrators call. Records how
+    long the parser took (and what it found) on the timings of the current request.
+    Outside an analysis, the parser runs untimed.
+
+    A parser marked 'low_priority' (NLP, regex over the whole body, generic
+    fallbacks) is skipped once the request's time budget has run out; it then
+    reports "not found" and is listed in the skipped parsers.
+    """
+    if func is None:
+        return functools.partial(timed_parser, low_priority=low_priority)
+
+    parser_name = get_parser_name(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        context = shared_context.current()
+        if context is None or context.timings is None or context.current_module is None:
+            return func(*args, **kwargs)
+        timings: RequestTimings = context.timings
+        module_name = context.current_module
+
+        if low_priority:
+            time_budget: Optional[TimeBudget] = context.time_budget
+            if time_budget is not None and time_budget.exhausted:
+                logger.warning(
+                    f"Time budget of {time_budget.budget_ms} ms exhausted, "
+                    f"skipping parser '{module_name}.{parser_name}'."
+                )
+                timings.record_skipped(module_name, parser_name)
+                return None, "SKIPPED", FieldExtractionStatus.NOT_FOUND, 0
+
+        started_at = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings.record_parser(
+            module_name,
+            parser_name,
+            (time.perf_counter() - started_at) * 1000,
+            result,
+        )
+        return result
+
+    wrapper.parser_name = parser_name
+    return wrapper
+
+
+def get_parser_name(func: Callable) -> str:
+    """The name a parser is reported under, e.g. 'itemprop_parser.parse_itemprop'."""
+    parser_name = getattr(func, "parser_name", None)
+    if parser_name is None:
+        parser_name = func.__module__.rsplit(".", 1)[-1] + "." + func.__name__
+    return parser_name
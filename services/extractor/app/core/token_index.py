@@ -0,0 +1,188 @@
+# argus/services/extractor/app/core/token_index.py
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from bs4 import BeautifulSoup, Tag
+
+# The attributes whose values are indexed, besides the tag names
+INDEXED_ATTRIBUTES = ("class", "id", "itemprop", "itemtype")
+
+_Pattern = type(re.compile(""))
+
+
+def _is_rule(rule: Any) -> bool:
+    """A rule the index can evaluate: a string, a compiled regex, True, or a list of those."""
+    if isinstance(rule, (list, tuple)):
+        return all(isinstance(item, (str, _Pattern)) for item in rule)
+    return rule is True or isinstance(rule, (str, _Pattern))
+
+
+def rule_matches(rule: Any, value: str) -> bool:
+    """Whether a rule matches one value, as bs4 applies it to a tag name or an attribute value."""
+    if rule is True:
+        return True
+    if isinstance(rule, _Pattern):
+        return rule.search(value) is not None
+    if isinstance(rule, (list, tuple)):
+        return any(rule_matches(item, value) for item in rule)
+    return rule == value
+
+
+def attribute_matches(rule: Any, value: Any) -> bool:
+    """
+    Whether a rule matches an attribute value the way bs4's find_all() tests
+    it: a missing attribute never matches, and a multi-valued one (class)
+    matches on one of its tokens or, with more or less than one, on the
+    tokens joined with spaces.
+    """
+    if value is None:
+        return False
+    if not isinstance(value, list):
+        return rule_matches(rule, value)
+    if any(rule_matches(rule, token) for token in value):
+        return True
+    return len(value) != 1 and rule_matches(rule, " ".join(value))
+
+
+class TokenIndex:
+    """
+    An inverted index of one tree: every distinct tag name, class token and
+    id, itemprop and itemtype value, mapped to its elements in document order.
+
+    find_all() evaluates a query on that vocabulary, which is much smaller
+    than the tree, and only then expands the matching keys to elements, so
+    the cost of a lookup follows the number of matches, not the size of the
+    page. The results are those of bs4's find_all() with the same arguments:
+
+    - a rule (string, regex, True or a list of those) matches a tag name or a
+      single-valued attribute (id, itemprop, itemtype) by equality or regex.search();
+    - a rule on 'class' matches if it matches one of the class tokens, or the
+      tokens joined with spaces (for elements with more or less than one);
+    - every given rule must match, and 'limit' keeps the first matches in
+      document order.
+
+    The index is built in one traversal and assumes the tree is not modified
+    afterwards, which holds for the document views (see DocumentMemo).
+    """
+
+    __slots__ = ("root", "elements", "positions", "ends", "_keys", "_matched")
+
+    def __init__(self, root: BeautifulSoup):
+        self.root = root
+        self.elements: List[Tag] = []
+        # id(element) -> its position, and the position of its last descendant
+        self.positions: Dict[int, int] = {}
+        self.ends: List[int] = []
+        # Per attribute (None for the tag names): key -> positions of its elements
+        self._keys: Dict[Optional[str], Dict[str, List[int]]] = {
+            name: {} for name in (None, *INDEXED_ATTRIBUTES)
+        }
+        # (attribute, rule) -> the positions of the elements the rule matches
+        self._matched: Dict[Any, Set[int]] = {}
+        self._build()
+
+    def _add(self, attribute: Optional[str], key: str, position: int):
+        positions = self._keys[attribute].setdefault(key, [])
+        if not positions or positions[-1] != position:
+            positions.append(position)
+
+    def _build(self):
+        names = self._keys[None]
+        stack = [(-1, iter(self.root.contents))]
+        while stack:
+            parent, children = stack[-1]
+            for child in children:
+                if isinstance(child, Tag):
+                    position = len(self.elements)
+                    self.elements.append(child)
+                    self.positions[id(child)] = position
+                    self.ends.append(position)
+                    names.setdefault(child.name, []).append(position)
+                    for attribute in INDEXED_ATTRIBUTES:
+                        value = child.attrs.get(attribute)
+                        if value is None:
+                            continue
+                        if isinstance(value, list):
+                            for token in value:
+                                self._add(attribute, token, position)
+                            if len(value) != 1:
+                                self._add(attribute, " ".join(value), position)
+                        else:
+                            self._add(attribute, value, position)
+                    stack.append((position, iter(child.contents)))
+                    break
+            else:
+                stack.pop()
+                if parent >= 0:
+                    self.ends[parent] = len(self.elements) - 1
+
+    def _match(self, attribute: Optional[str], rule: Any) -> Set[int]:
+        """The positions of the elements whose name (or attribute) the rule matches."""
+        cache_key = (attribute, rule if not isinstance(rule, list) else tuple(rule))
+        matched = self._matched.get(cache_key)
+        if matched is None:
+            keys = self._keys[attribute]
+            if isinstance(rule, str):
+                matched = set(keys.get(rule, ()))
+            else:
+                matched = set()
+                for key, positions in keys.items():
+                    if rule_matches(rule, key):
+                        matched.update(positions)
+            self._matched[cache_key] = matched
+        return matched
+
+    def find_all(
+        self, node: Any = None, name: Any = None, limit: Optional[int] = None, **attrs: Any
+    ) -> List[Tag]:
+        """
+        node.find_all(name, limit=limit, **attrs) over the index; 'node' is the
+        root (the default) or an element of this tree. Queries the index cannot
+        evaluate (other attributes, functions, no rule at all) are run by bs4.
+        """
+        node = self.root if node is None else node
+        if "class_" in attrs:
+            attrs["class"] = attrs.pop("class_")
+        scope = self.positions.get(id(node)) if node is not self.root else -1
+        supported = (
+            scope is not None
+            and (name is not None or attrs)
+            and (name is None or _is_rule(name))
+            and all(key in INDEXED_ATTRIBUTES and _is_rule(rule) for key, rule in attrs.items())
+        )
+        if not supported:
+            if "class" in attrs:
+                attrs["class_"] = attrs.pop("class")
+            return node.find_all(name, limit=limit, **attrs)
+
+        candidates: Optional[Set[int]] = None
+        rules = ([(None, name)] if name is not None else []) + list(attrs.items())
+        # The most selective rules first, so the intersections stay small
+        for attribute, rule in sorted(rules, key=lambda item: len(self._match(*item))):
+            matched = self._match(attribute, rule)
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return []
+
+        if scope >= 0:
+            end = self.ends[scope]
+            candidates = {position for position in candidates if scope < position <= end}
+        positions = sorted(candidates)
+        if limit:
+            positions = positions[:limit]
+        return [self.elements[position] for position in positions]
+
+    def find_any(self, node: Any, queries: Iterable[Tuple[Any, Dict[str, Any]]]) -> List[Tag]:
+        """
+        The elements that match any of the (name, attrs) queries, without
+        duplicates and in document order: what a CSS selector group returns.
+        """
+        elements = [
+            element for name, attrs in queries for element in self.find_all(node, name, **dict(attrs))
+        ]
+        return self.in_document_order(elements)
+
+    def in_document_order(self, elements: Iterable[Tag]) -> List[Tag]:
+        """The elements of this tree, without duplicates, in document order."""
+        positions = {self.positions[id(element)] for element in elements}
+        return [self.elements[position] for position in sorted(positions)]
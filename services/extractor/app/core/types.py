@@ -39,10 +39,26 @@ class SpecificationCategory(BaseModel):
     details: Union[Dict[str, Any], List[Any]]
 
 
-class ExtractionResult(BaseModel):
-    """A model to capture a single extraction result and its metadata."""
+class ExtractionResult:
+    """
+    A single candidate on the scoreboard: a found value and its metadata.
+
+    A plain slotted record rather than a pydantic model: a request creates
+    dozens of these and none of them crosses the API boundary.
+    """
+
+    __slots__ = ("value", "source", "score", "status")
+
+    def __init__(
+        self, value: Any, source: str, score: int, status: FieldExtractionStatus
+    ):
+        self.value = value
+        self.source = source
+        self.score = score
+        self.status = status
 
-    value: Any
-    source: str
-    score: int
-    status: FieldExtractionStatus
+    def __repr__(self) -> str:
+        return (
+            f"ExtractionResult(value={self.value!r}, source={self.source!r}, "
+            f"score={self.score!r}, status={self.status!r})"
+        )
@@ -0,0 +1,116 @@
+# argus/services/extractor/app/core/warm_up.py
+
+import time
+from typing import Dict, Any
+from langdetect.detector_factory import init_factory
+from loguru import logger
+from app.config import settings
+from app.utils.noise_matcher import get_noise_matcher
+from app.utils.pattern_manager import pattern_manager
+from app.utils.shared_resources import get_resources
+
+# A small but complete product page that reaches every module and most parsers,
+# so their imports, regexes and lazy caches are all built before real traffic.
+SYNTHETIC_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <title>Warm-up Kettle 1.7 L | Example Store</title>
+  <meta name="description" content="A stainless steel kettle used to warm up the extractor.">
+  <meta property="og:title" content="Warm-up Kettle 1.7 L">
+  <meta property="og:type" content="product">
+  <meta property="og:image" content="https://example.com/images/kettle.jpg">
+  <meta property="og:description" content="A stainless steel kettle used to warm up the extractor.">
+  <meta property="product:price:amount" content="39.99">
+  <meta property="product:price:currency" content="EUR">
+  <script type="application/ld+json">
+  {
+    "@context": "https://schema.org",
+    "@type": "Product",
+    "name": "Warm-up Kettle 1.7 L",
+    "image": "https://example.com/images/kettle.jpg",
+    "description": "A stainless steel kettle used to warm up the extractor.",
+    "brand": {"@type": "Brand", "name": "Example"},
+    "offers": {
+      "@type": "Offer",
+      "price": "39.99",
+      "priceCurrency": "EUR",
+      "availability": "https://schema.org/InStock"
+    }
+  }
+  </script>
+  <script type="application/ld+json">
+  {
+    "@context": "https://schema.org",
+    "@type": "BreadcrumbList",
+    "itemListElement": [
+      {"@type": "ListItem", "position": 1, "name": "Home", "item": "https://example.com/"},
+      {"@type": "ListItem", "position": 2, "name": "Kitchen", "item": "https://example.com/kitchen"}
+    ]
+  }
+  </script>
+</head>
+<body>
+  <header><nav><a href="/">Home</a></nav></header>
+  <nav class="breadcrumb"><ol><li><a href="/">Home</a></li><li><a href="/kitchen">Kitchen</a></li></ol></nav>
+  <main>
+    <h1 class="product-title">Warm-up Kettle 1.7 L</h1>
+    <div class="product-brand">Brand: Example</div>
+    <img class="product-image" src="https://example.com/images/kettle.jpg" alt="Warm-up Kettle" width="800" height="800">
+    <span class="price">&euro; 39,99</span>
+    <p class="stock">In stock</p>
+    <div class="product-description">
+      <p>This stainless steel kettle boils 1.7 litres of water and switches off automatically.</p>
+    </div>
+    <table class="specifications">
+      <tr><th>Brand</th><td>Example</td></tr>
+      <tr><th>Capacity</th><td>1.7 L</td></tr>
+    </table>
+  </main>
+  <footer><p>&copy; Example Store</p></footer>
+</body>
+</html>
+"""
+
+
+def warm_up_analyzer(analyzer) -> Dict[str, Any]:
+    """
+    Prepares an analyzer for its first real request: loads the shared resources
+    (the spaCy model), loads the language detection profiles, compiles the pattern
+    bundles of every configured language and the noise selectors, and runs the
+    synthetic page through the full analysis.
+
+    Returns a report with the duration of every step in milliseconds.
+    """
+    report: Dict[str, Any] = {}
+
+    started_at = time.perf_counter()
+    get_resources()
+    report["resources_ms"] = round((time.perf_counter() - started_at) * 1000, 3)
+
+    if settings.warm_up.enabled:
+        # The language profiles of langdetect, for pages that declare no language
+        started_at = time.perf_counter()
+        init_factory()
+        report["language_profiles_ms"] = round((time.perf_counter() - started_at) * 1000, 3)
+
+        started_at = time.perf_counter()
+        report["patterns_compiled"] = pattern_manager.warm_up()
+        report["patterns_ms"] = round((time.perf_counter() - started_at) * 1000, 3)
+
+        started_at = time.perf_counter()
+        report["noise_selectors"] = get_noise_matcher().describe()
+        report["noise_selectors_ms"] = round((time.perf_counter() - started_at) * 1000, 3)
+
+        started_at = time.perf_counter()
+        data = analyzer.analyze(
+            html_content=SYNTHETIC_PAGE,
+            url="https://warm-up.invalid/kettle",
+            use_llm=False,
+        )
+        report["synthetic_page_ms"] = round((time.perf_counter() - started_at) * 1000, 3)
+        report["synthetic_page_fields"] = sorted(
+            field for field, value in data.items() if value is not None
+        )
+
+    logger.info(f"Warm-up: Analyzer is warm: {report}")
+    return report
@@ -0,0 +1,753 @@
+# argus/services/extractor/app/core/wrappers.py
+
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+from loguru import logger
+from lxml import etree
+from lxml import html as lxml_html
+from app.config import settings, BASE_DIR
+from app.core.dom import parse_html
+from app.utils.data_utils import clean_price_text
+from app.modules.json_ld.utils import decode_json_ld
+
+# Rule kinds: where the value of a field is read from
+KIND_ABSENT = "absent"
+KIND_XPATH = "xpath"
+KIND_XPATH_LIST = "xpath_list"
+KIND_JSON_LD = "json_ld"
+KIND_JSON_LD_PATH = "json_ld_path"
+KIND_OPEN_GRAPH = "open_graph"
+KIND_OPEN_GRAPH_KEY = "open_graph_key"
+
+# Value types a rule casts its raw value to
+TYPE_STR = "str"
+TYPE_FLOAT = "float"
+
+# Outcomes of the wrapper step of an analysis, reported in the timings block
+OUTCOME_MISS = "miss"
+OUTCOME_HIT = "hit"
+OUTCOME_VALIDATION_FAILED = "validation_failed"
+OUTCOME_DRIFT_CHECK = "drift_check"
+OUTCOME_DRIFT_OK = "drift_ok"
+OUTCOME_DRIFT_DETECTED = "drift_detected"
+
+_SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template"})
+# Attributes that commonly carry a field's value (meta content, image src, ...)
+_VALUE_ATTRIBUTES = ("content", "src", "href", "data-src", "value", "title", "alt")
+# Ids and classes with long numbers or hashes are usually generated per page or build
+_UNSTABLE_TOKEN = re.compile(r"\d{3,}|[0-9a-f]{8,}|['\"\s]")
+# Tag names XPath can test directly; others ('o:p', 'fb:like') read as a namespace prefix
+_XPATH_NAME = re.compile(r"^[A-Za-z_][\w.-]*$")
+_MAX_CANDIDATES = 20
+_MAX_PRICE_TEXT = 40
+_MAX_JSON_DEPTH = 8
+
+_UNSET = object()
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _cast(raw: Any, value_type: str) -> Any:
+    """Casts a raw text, attribute or JSON value to a rule's value type, or None."""
+    if value_type == TYPE_STR:
+        return (_normalize(raw) or None) if isinstance(raw, str) else None
+    if value_type == TYPE_FLOAT:
+        if isinstance(raw, bool) or not isinstance(raw, (str, int, float)):
+            return None
+        if isinstance(raw, str) and (len(raw) > _MAX_PRICE_TEXT or not re.search(r"\d", raw)):
+            return None
+        return clean_price_text(raw)
+    return None
+
+
+def _is_stable(token: Optional[str]) -> bool:
+    return bool(token) and len(token) <= 64 and not _UNSTABLE_TOKEN.search(token)
+
+
+def _name_test(tag: str) -> Optional[str]:
+    """The XPath name test of a tag, or None if it cannot be written as one."""
+    if _XPATH_NAME.match(tag):
+        return tag
+    if '"' in tag:
+        return None
+    return f'*[name()="{tag}"]'
+
+
+def _path(element, ancestor=None) -> Optional[str]:
+    """
+    The path of an element from the root (or below 'ancestor'), positioned like
+    lxml's getpath() but with name tests that also hold for prefixed tags.
+    """
+    steps = []
+    node = element
+    while node is not None and node is not ancestor:
+        step = _name_test(node.tag)
+        if step is None:
+            return None
+        parent = node.getparent()
+        if parent is not None:
+            same_tag = [sibling for sibling in parent if sibling.tag == node.tag]
+            if len(same_tag) > 1:
+                step += f"[{same_tag.index(node) + 1}]"
+        steps.append(step)
+        node = parent
+    return "/" + "/".join(reversed(steps))
+
+
+class PageTree:
+    """
+    A page parsed once with lxml for the wrapper fast path. The JSON-LD nodes
+    and Open Graph tags are read the same way the json_ld and open_graph
+    modules read them from the BeautifulSoup tree.
+    """
+
+    __slots__ = ("root", "_json_ld", "_open_graph")
+
+    def __init__(self, root: lxml_html.HtmlElement):
+        self.root = root
+        self._json_ld: Any = _UNSET
+        self._open_graph: Any = _UNSET
+
+    @classmethod
+    def parse(cls, html_content: str) -> Optional["PageTree"]:
+        root = parse_html(html_content)
+        return cls(root) if root is not None else None
+
+    @property
+    def json_ld(self) -> Optional[List[Any]]:
+        if self._json_ld is _UNSET:
+            nodes: List[Any] = []
+            for script in self.root.iterfind(".//script[@type='application/ld+json']"):
+                try:
+                    data = decode_json_ld(script.text) if script.text and script.text.strip() else None
+                except (ValueError, TypeError):
+                    continue
+                if isinstance(data, list):
+                    nodes.extend(data)
+                elif isinstance(data, dict):
+                    nodes.append(data)
+            self._json_ld = nodes or None
+        return self._json_ld
+
+    @property
+    def open_graph(self) -> Optional[Dict[str, str]]:
+        if self._open_graph is _UNSET:
+            og_tags: Dict[str, str] = {}
+            for meta in self.root.iterfind(".//meta[@property]"):
+                prop, content = meta.get("property"), meta.get("content")
+                if prop and content and prop.startswith("og:"):
+                    og_tags[prop.replace("og:", "")] = content.strip()
+            self._open_graph = og_tags or None
+        return self._open_graph
+
+
+class FieldRule:
+    """
+    How one field is read from a page: a compiled XPath expression (the text or
+    an attribute of the first match, or the texts of all matches), a path into
+    the JSON-LD nodes or a key of the Open Graph tags, plus the expected type.
+    An 'absent' rule expects the field to be empty on the domain's pages.
+    """
+
+    __slots__ = ("kind", "expression", "source", "value_type", "_xpath")
+
+    def __init__(
+        self,
+        kind: str,
+        expression: Any = None,
+        source: Optional[str] = None,
+        value_type: Optional[str] = None,
+    ):
+        self.kind = kind
+        self.expression = expression
+        self.source = source
+        self.value_type = value_type
+        self._xpath = (
+            etree.XPath(expression) if kind in (KIND_XPATH, KIND_XPATH_LIST) else None
+        )
+
+    def apply(self, page: PageTree) -> Any:
+        """Returns the field's value on the page, or None if the rule finds nothing."""
+        if self.kind == KIND_ABSENT:
+            return None
+        if self.kind == KIND_JSON_LD:
+            return page.json_ld
+        if self.kind == KIND_OPEN_GRAPH:
+            return page.open_graph
+        if self.kind == KIND_OPEN_GRAPH_KEY:
+            return _cast((page.open_graph or {}).get(self.expression), self.value_type)
+        if self.kind == KIND_JSON_LD_PATH:
+            data: Any = page.json_ld
+            for key in self.expression:
+                if isinstance(key, int) and isinstance(data, list) and 0 <= key < len(data):
+                    data = data[key]
+                elif isinstance(key, str) and isinstance(data, dict) and key in data:
+                    data = data[key]
+                else:
+                    return None
+            return _cast(data, self.value_type)
+
+        matches = self._xpath(page.root)
+        if self.kind == KIND_XPATH_LIST:
+            texts = [_normalize(element.text_content()) for element in matches]
+            return texts if texts and all(texts) else None
+        if not matches:
+            return None
+        element = matches[0]
+        raw = element.text_content() if self.source == "text" else element.get(self.source[1:])
+        return _cast(raw, self.value_type)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "expression": self.expression,
+            "source": self.source,
+            "value_type": self.value_type,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FieldRule":
+        return cls(data["kind"], data.get("expression"), data.get("source"), data.get("value_type"))
+
+
+class Wrapper:
+    """The compiled rules of one domain, applied to a page that is parsed once with lxml."""
+
+    __slots__ = ("domain", "rules")
+
+    def __init__(self, domain: str, rules: Dict[str, FieldRule]):
+        self.domain = domain
+        self.rules = rules
+
+    def apply(self, page: PageTree) -> Optional[Dict[str, Any]]:
+        """
+        Returns the value of every field, or None if the page fails validation:
+        a field the wrapper expects to find is missing or has the wrong type.
+        """
+        values: Dict[str, Any] = {}
+        for field, rule in self.rules.items():
+            value = rule.apply(page)
+            if value is None and rule.kind != KIND_ABSENT:
+                logger.debug(f"Wrappers: '{field}' failed validation on {self.domain}.")
+                return None
+            values[field] = value
+        return values
+
+
+def _element_expressions(page: PageTree, element) -> Iterator[Tuple[int, str]]:
+    """
+    Candidate XPath expressions for one element, most robust first: its id, its
+    itemprop, name or property, one of its classes, a path from the closest ancestor with an id,
+    and finally its absolute path. Yields (rank, expression).
+    """
+    tag = _name_test(element.tag)
+    if tag is None:
+        return
+    element_id = element.get("id")
+    if _is_stable(element_id):
+        yield 0, f'//{tag}[@id="{element_id}"]'
+    for attribute in ("itemprop", "name", "property"):
+        attribute_value = element.get(attribute)
+        if _is_stable(attribute_value):
+            yield 1, f'//{tag}[@{attribute}="{attribute_value}"]'
+    for token in (element.get("class") or "").split():
+        if _is_stable(token):
+            yield 2, f'//{tag}[contains(concat(" ", normalize-space(@class), " "), " {token} ")]'
+
+    for depth, ancestor in enumerate(element.iterancestors()):
+        if depth >= 4:
+            break
+        ancestor_id = ancestor.get("id")
+        ancestor_tag = _name_test(ancestor.tag)
+        if _is_stable(ancestor_id) and ancestor_tag is not None:
+            relative = _path(element, ancestor)
+            if relative is not None:
+                yield 3, f'//{ancestor_tag}[@id="{ancestor_id}"]{relative}'
+            break
+    absolute = _path(element)
+    if absolute is not None:
+        yield 4, absolute
+
+
+def _group_expressions(element) -> Iterator[str]:
+    """Candidate XPath expressions that select an element and its siblings in a list."""
+    tag = _name_test(element.tag)
+    if tag is None:
+        return
+    for token in (element.get("class") or "").split():
+        if _is_stable(token):
+            yield f'//{tag}[contains(concat(" ", normalize-space(@class), " "), " {token} ")]'
+    for depth, ancestor in enumerate(element.iterancestors()):
+        if depth >= 4:
+            break
+        ancestor_tag = _name_test(ancestor.tag)
+        if ancestor_tag is None:
+            continue
+        ancestor_id = ancestor.get("id")
+        if _is_stable(ancestor_id):
+            yield f'//{ancestor_tag}[@id="{ancestor_id}"]//{tag}'
+        for token in (ancestor.get("class") or "").split():
+            if _is_stable(token):
+                yield (
+                    f'//{ancestor_tag}[contains(concat(" ", normalize-space(@class), " "), '
+                    f'" {token} ")]//{tag}'
+                )
+
+
+def _text_may_match(element, value: Any, value_type: str) -> bool:
+    """A cheap test on the element's own text before its full text is built."""
+    own_text = _normalize(element.text or "")
+    if value_type == TYPE_STR:
+        if own_text:
+            return value.startswith(own_text)
+        return 0 < len(element) <= 3
+    return bool(re.search(r"\d", own_text)) or (not own_text and 0 < len(element) <= 3)
+
+
+def _element_candidates(page: PageTree, value: Any, value_type: str) -> Iterator[Tuple[Any, str]]:
+    """Yields (element, source) pairs whose text or attribute reproduces the value."""
+    for element in page.root.iter(etree.Element):
+        if element.tag in _SKIPPED_TAGS:
+            continue
+        for attribute in _VALUE_ATTRIBUTES:
+            raw = element.get(attribute)
+            if raw is not None and _cast(raw, value_type) == value:
+                yield element, f"@{attribute}"
+        if _text_may_match(element, value, value_type):
+            if _cast(element.text_content(), value_type) == value:
+                yield element, "text"
+
+
+def _json_ld_paths(data: Any, path: Tuple[Any, ...] = ()) -> Iterator[Tuple[Tuple[Any, ...], Any]]:
+    """Yields (path, leaf) for every scalar in the JSON-LD nodes, in document order."""
+    if len(path) > _MAX_JSON_DEPTH:
+        return
+    if isinstance(data, dict):
+        for key, item in data.items():
+            yield from _json_ld_paths(item, path + (key,))
+    elif isinstance(data, list):
+        for index, item in enumerate(data):
+            yield from _json_ld_paths(item, path + (index,))
+    else:
+        yield path, data
+
+
+def _induce_scalar(page: PageTree, value: Any, value_type: str) -> Optional[FieldRule]:
+    for path, leaf in _json_ld_paths(page.json_ld):
+        if _cast(leaf, value_type) == value:
+            return FieldRule(KIND_JSON_LD_PATH, list(path), value_type=value_type)
+    for key, content in (page.open_graph or {}).items():
+        if _cast(content, value_type) == value:
+            return FieldRule(KIND_OPEN_GRAPH_KEY, key, value_type=value_type)
+
+    best: Optional[Tuple[Tuple[int, int], FieldRule]] = None
+    for count, (element, source) in enumerate(_element_candidates(page, value, value_type)):
+        if count >= _MAX_CANDIDATES:
+            break
+        for rank, expression in _element_expressions(page, element):
+            matches = page.root.xpath(expression)
+            if matches and matches[0] is element:
+                # The most robust expression wins; between equals, the innermost element
+                key = (rank, -sum(1 for _ in element.iterancestors()))
+                if best is None or key < best[0]:
+                    best = key, FieldRule(KIND_XPATH, expression, source, value_type)
+                break
+    return best[1] if best is not None else None
+
+
+def _induce_list(page: PageTree, values: List[Any]) -> Optional[FieldRule]:
+    if not values or not all(isinstance(value, str) and value for value in values):
+        return None
+    for count, (element, source) in enumerate(_element_candidates(page, values[0], TYPE_STR)):
+        if count >= _MAX_CANDIDATES:
+            break
+        if source != "text":
+            continue
+        for expression in _group_expressions(element):
+            rule = FieldRule(KIND_XPATH_LIST, expression, "text", "list")
+            if rule.apply(page) == values:
+                return rule
+    return None
+
+
+def induce_rules(page: PageTree, results: Dict[str, Any]) -> Tuple[Dict[str, FieldRule], List[str]]:
+    """
+    Induces a rule for every field from the final results of a full analysis.
+    A rule is only kept if applying it to the same page reproduces the value
+    exactly. Returns the rules and the fields no rule could be found for.
+    """
+    rules: Dict[str, FieldRule] = {}
+    missing: List[str] = []
+    for field, value in results.items():
+        rule: Optional[FieldRule] = None
+        if value is None:
+            rule = FieldRule(KIND_ABSENT)
+        elif isinstance(value, bool):
+            rule = None
+        elif isinstance(value, str):
+            rule = _induce_scalar(page, value, TYPE_STR)
+        elif isinstance(value, (int, float)):
+            rule = _induce_scalar(page, float(value), TYPE_FLOAT)
+        elif isinstance(value, dict) and value == page.open_graph:
+            rule = FieldRule(KIND_OPEN_GRAPH)
+        elif isinstance(value, list) and value == page.json_ld:
+            rule = FieldRule(KIND_JSON_LD)
+        elif isinstance(value, list):
+            rule = _induce_list(page, value)
+
+        if rule is not None and rule.apply(page) == value:
+            rules[field] = rule
+        else:
+            missing.append(field)
+    return rules, missing
+
+
+def _signature(rules: Dict[str, FieldRule]) -> str:
+    return json.dumps({field: rule.to_dict() for field, rule in rules.items()}, sort_keys=True)
+
+
+def _new_state() -> Dict[str, Any]:
+    return {
+        "active": None,
+        "candidate": None,
+        "stats": {
+            "pages_observed": 0,
+            "incomplete_pages": 0,
+            "hits": 0,
+            "validation_failures": 0,
+            "consecutive_failures": 0,
+            "drift_checks": 0,
+            "drifts": 0,
+        },
+    }
+
+
+class WrapperRun:
+    """The wrapper step of one analysis: the parsed page and what the wrapper found."""
+
+    __slots__ = ("domain", "html_content", "page", "values", "outcome")
+
+    def __init__(
+        self,
+        domain: str,
+        html_content: str,
+        page: Optional[PageTree],
+        values: Optional[Dict[str, Any]],
+        outcome: str,
+    ):
+        self.domain = domain
+        self.html_content = html_content
+        self.page = page
+        self.values = values
+        self.outcome = outcome
+
+
+class WrapperStore:
+    """
+    Induces per-domain wrappers from the results of full analyses and uses them
+    as a fast path: the page is parsed once with lxml and every field is read
+    with one compiled expression, instead of running the module graph.
+
+    A domain's wrapper is only activated after the same rules were induced on
+    'min_support' pages in a row, and every field of the model has a rule.
+    The full analysis still runs when the page fails validation, and on a
+    'drift_sample_rate' share of the hits to compare both results; on a
+    mismatch, the wrapper is dropped and induction starts over.
+
+    The wrappers live in a local SQLite file, shared by all workers and read by
+    the admin API. Each process keeps a copy that is refreshed every
+    'refresh_seconds'; hit counters are written every 'flush_interval_seconds'.
+    """
+
+    def __init__(self):
+        wrapper_settings = settings.wrappers
+        self.min_support = wrapper_settings.min_support
+        self.drift_sample_rate = wrapper_settings.drift_sample_rate
+        self.max_validation_failures = wrapper_settings.max_validation_failures
+        self.disabled_domains = {domain.lower() for domain in wrapper_settings.disabled_domains}
+        self.refresh_seconds = wrapper_settings.refresh_seconds
+        self.flush_interval_seconds = wrapper_settings.flush_interval_seconds
+        self.max_entries = wrapper_settings.max_entries
+
+        # domain -> (loaded at, wrapper or None)
+        self._wrappers: "OrderedDict[str, Tuple[float, Optional[Wrapper]]]" = OrderedDict()
+        # domain -> counter -> increments not yet written
+        self._pending: Dict[str, Dict[str, int]] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._disk = self._open_disk(BASE_DIR / wrapper_settings.path)
+
+    def _open_disk(self, path: Path) -> sqlite3.Connection:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                path, timeout=5.0, isolation_level=None, check_same_thread=False
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Wrappers: Could not open {path}, keeping the wrappers in memory: {e}")
+            connection = sqlite3.connect(":memory:", isolation_level=None, check_same_thread=False)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS wrappers ("
+            "domain TEXT PRIMARY KEY, payload TEXT, updated_at REAL)"
+        )
+        return connection
+
+    def is_enabled_for(self, domain: str) -> bool:
+        return bool(domain) and domain not in self.disabled_domains
+
+    # --- The fast path ---
+
+    def run(self, html_content: str, url: str) -> WrapperRun:
+        """
+        Applies the domain's wrapper, if it has one. The outcome is a hit (use
+        the values), a drift check (use them to check the full analysis), a
+        failed validation or a miss (run the full analysis and learn from it).
+        """
+        domain = urlparse(url).netloc.lower()
+        wrapper = self._lookup(domain) if self.is_enabled_for(domain) else None
+        if wrapper is None:
+            return WrapperRun(domain, html_content, None, None, OUTCOME_MISS)
+
+        page = PageTree.parse(html_content)
+        try:
+            values = wrapper.apply(page) if page is not None else None
+        except Exception as e:
+            logger.error(f"Wrappers: The wrapper of {domain} could not be applied: {e}", exc_info=True)
+            values = None
+        if values is None:
+            self._update(domain, self._record_validation_failure)
+            return WrapperRun(domain, html_content, page, None, OUTCOME_VALIDATION_FAILED)
+        if random.random() < self.drift_sample_rate:
+            return WrapperRun(domain, html_content, page, values, OUTCOME_DRIFT_CHECK)
+        self._count(domain, "hits")
+        return WrapperRun(domain, html_content, page, values, OUTCOME_HIT)
+
+    def learn(
+        self, wrapper_run: WrapperRun, results: Dict[str, Any], lxml_root: Any = None
+    ) -> str:
+        """
+        Learns from the results of a full analysis: compares them with the
+        wrapper's on a drift check, and otherwise induces rules from them.
+        'lxml_root' is the page's lxml.html tree if the analysis built one, so
+        it is not parsed again. Returns the final outcome of the wrapper step.
+        A failure to learn is logged and never fails the analysis.
+        """
+        domain = wrapper_run.domain
+        if not self.is_enabled_for(domain):
+            return wrapper_run.outcome
+        try:
+            return self._learn(wrapper_run, results, lxml_root)
+        except Exception as e:
+            logger.error(f"Wrappers: Could not learn from the page of {domain}: {e}", exc_info=True)
+            return wrapper_run.outcome
+
+    def _learn(self, wrapper_run: WrapperRun, results: Dict[str, Any], lxml_root: Any) -> str:
+        domain = wrapper_run.domain
+
+        if wrapper_run.outcome == OUTCOME_DRIFT_CHECK:
+            drifted = sorted(
+                field for field, value in results.items()
+                if wrapper_run.values.get(field) != value
+            )
+            if not drifted:
+                self._count(domain, "drift_checks")
+                return OUTCOME_DRIFT_OK
+            logger.warning(f"Wrappers: Drift on {domain} in {drifted}, dropping its wrapper.")
+            self._update(domain, lambda state: self._record_drift(state, drifted))
+
+        page = wrapper_run.page
+        if page is None:
+            page = PageTree(lxml_root) if lxml_root is not None else PageTree.parse(wrapper_run.html_content)
+        if page is None:
+            return wrapper_run.outcome
+        self.observe(domain, page, results)
+        return OUTCOME_DRIFT_DETECTED if wrapper_run.outcome == OUTCOME_DRIFT_CHECK else wrapper_run.outcome
+
+    def observe(self, domain: str, page: PageTree, results: Dict[str, Any]):
+        """Induces the rules of one page and promotes them once they are stable."""
+        rules, missing = induce_rules(page, results)
+        if all(rule.kind == KIND_ABSENT for rule in rules.values()):
+            # Nothing was found; there is nothing for a wrapper to learn
+            return
+        signature = _signature(rules)
+
+        def promote(state: Dict[str, Any]):
+            stats = state["stats"]
+            stats["pages_observed"] += 1
+            if missing:
+                stats["incomplete_pages"] += 1
+                state["candidate"] = None
+                state["last_missing_fields"] = missing
+                return
+            candidate = state["candidate"]
+            if candidate is not None and candidate["signature"] == signature:
+                candidate["support"] += 1
+            else:
+                candidate = state["candidate"] = {
+                    "signature": signature,
+                    "rules": {field: rule.to_dict() for field, rule in rules.items()},
+                    "support": 1,
+                }
+            active = state["active"]
+            if candidate["support"] >= self.min_support and (
+                active is None or active["signature"] != signature
+            ):
+                state["active"] = dict(candidate, activated_at=time.time())
+                state["candidate"] = None
+                stats["consecutive_failures"] = 0
+                logger.info(
+                    f"Wrappers: Activated a wrapper for {domain} "
+                    f"after {candidate['support']} pages."
+                )
+
+        self._update(domain, promote)
+
+    def _record_validation_failure(self, state: Dict[str, Any]):
+        stats = state["stats"]
+        stats["validation_failures"] += 1
+        stats["consecutive_failures"] += 1
+        if state["active"] is not None and stats["consecutive_failures"] >= self.max_validation_failures:
+            logger.warning(
+                f"Wrappers: {stats['consecutive_failures']} pages in a row failed validation, "
+                f"dropping the wrapper."
+            )
+            state["active"] = None
+
+    @staticmethod
+    def _record_drift(state: Dict[str, Any], drifted: List[str]):
+        state["stats"]["drift_checks"] += 1
+        state["stats"]["drifts"] += 1
+        state["active"] = None
+        state["candidate"] = None
+        state["last_drift_fields"] = drifted
+
+    # --- Storage ---
+
+    def _lookup(self, domain: str) -> Optional[Wrapper]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._wrappers.get(domain)
+            if entry is not None and now - entry[0] < self.refresh_seconds:
+                self._wrappers.move_to_end(domain)
+                return entry[1]
+            state = self._read(domain)
+            wrapper = self._cache(domain, state, now)
+        self._flush_if_due()
+        return wrapper
+
+    def _cache(self, domain: str, state: Optional[Dict[str, Any]], now: float) -> Optional[Wrapper]:
+        wrapper = None
+        active = state.get("active") if state is not None else None
+        if active is not None:
+            try:
+                wrapper = Wrapper(
+                    domain,
+                    {field: FieldRule.from_dict(rule) for field, rule in active["rules"].items()},
+                )
+            except (etree.XPathError, KeyError, TypeError) as e:
+                logger.error(f"Wrappers: The stored wrapper of {domain} is invalid: {e}")
+        self._wrappers[domain] = (now, wrapper)
+        self._wrappers.move_to_end(domain)
+        while len(self._wrappers) > self.max_entries:
+            self._wrappers.popitem(last=False)
+        return wrapper
+
+    def _read(self, domain: str) -> Optional[Dict[str, Any]]:
+        try:
+            row = self._disk.execute(
+                "SELECT payload FROM wrappers WHERE domain = ?", (domain,)
+            ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Wrappers: Could not read the wrapper of {domain}: {e}")
+            return None
+
+    def _update(self, domain: str, mutate):
+        """Reads, changes and writes the state of one domain in one transaction."""
+        with self._lock:
+            try:
+                self._disk.execute("BEGIN IMMEDIATE")
+                try:
+                    state = self._read(domain) or _new_state()
+                    for counter, increment in self._pending.pop(domain, {}).items():
+                        state["stats"][counter] += increment
+                    mutate(state)
+                    self._disk.execute(
+                        "INSERT OR REPLACE INTO wrappers VALUES (?, ?, ?)",
+                        (domain, json.dumps(state), time.time()),
+                    )
+                    self._disk.execute("COMMIT")
+                except BaseException:
+                    self._disk.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as e:
+                logger.warning(f"Wrappers: Could not update the wrapper of {domain}: {e}")
+                return
+            self._cache(domain, state, time.monotonic())
+
+    def _count(self, domain: str, counter: str):
+        with self._lock:
+            counters = self._pending.setdefault(domain, {})
+            counters[counter] = counters.get(counter, 0) + 1
+        self._flush_if_due()
+
+    def _flush_if_due(self):
+        if time.monotonic() - self._last_flush >= self.flush_interval_seconds:
+            self.flush()
+
+    def flush(self):
+        """Writes the pending hit and drift check counters."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            domains = list(self._pending)
+        for domain in domains:
+            self._update(domain, lambda state: None)
+
+    def describe(self, domain: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Returns the stored state of one domain, or of all domains."""
+        self.flush()
+        query, parameters = "SELECT domain, payload, updated_at FROM wrappers", ()
+        if domain is not None:
+            query, parameters = query + " WHERE domain = ?", (domain.lower(),)
+        with self._lock:
+            rows = self._disk.execute(query + " ORDER BY domain", parameters).fetchall()
+        entries = []
+        for row_domain, payload, updated_at in rows:
+            state = json.loads(payload)
+            for key in ("active", "candidate"):
+                if state.get(key) is not None:
+                    state[key].pop("signature", None)
+            entries.append({"domain": row_domain, "updated_at": updated_at, **state})
+        return entries
+
+    def reset(self, domain: Optional[str] = None) -> int:
+        """Forgets the wrapper of one domain, or of all domains. Returns how many were removed."""
+        with self._lock:
+            if domain is None:
+                removed = self._disk.execute("DELETE FROM wrappers").rowcount
+                self._wrappers.clear()
+                self._pending.clear()
+            else:
+                domain = domain.lower()
+                removed = self._disk.execute(
+                    "DELETE FROM wrappers WHERE domain = ?", (domain,)
+                ).rowcount
+                self._wrappers.pop(domain, None)
+                self._pending.pop(domain, None)
+        logger.info(f"Wrappers: Removed {removed} wrappers ({domain or 'all domains'}).")
+        return removed
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._disk.close()
@@ -1,10 +1,17 @@
 # argus/services/extractor/app/main.py
+import asyncio
 import sys
+import time
+from typing import Dict, Any
 from loguru import logger
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, Request, HTTPException, Response
 from contextlib import asynccontextmanager
 from app.config import settings
 from app.core.analyzer import ProductPageAnalyzer
+from app.core.analysis_pool import AnalysisPool, PoolUnavailableError
+from app.core.metrics import render_metrics, METRICS_CONTENT_TYPE
+from app.core.result_cache import ResultCache
+from app.utils.pattern_manager import pattern_manager
 from app.api.v1.endpoints import router as api_v1_router
 from pathlib import Path
 
@@ -17,16 +24,61 @@ logger.add(sys.stderr, level=log_level)
 logger.add(log_file, rotation="10 MB", level=log_level)
 
 
+def _warm_up(app: FastAPI, started_at: float, report: Dict[str, Any]):
+    """
+    Starts the analysis workers, each of which preloads its models, compiles the
+    pattern bundles and analyzes a synthetic page. Runs in a thread, so /health
+    answers during warm-up; /ready only turns green once it has finished.
+    """
+    try:
+        step_started_at = time.perf_counter()
+        app.state.analysis_pool.start()
+        report["pool_ms"] = round((time.perf_counter() - step_started_at) * 1000, 3)
+        report["workers"] = app.state.analysis_pool.worker_reports
+        report["total_ms"] = round((time.perf_counter() - started_at) * 1000, 3)
+        app.state.startup_report = report
+        app.state.ready = True
+        logger.success(f"Warm-up complete, service is ready. Startup report: {report}")
+    except PoolUnavailableError as e:
+        logger.info(f"Warm-up stopped, the service is shutting down: {e}")
+    except Exception as e:
+        logger.error(f"Warm-up failed, the service stays unready: {e}", exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Code to run on startup
     logger.info("Starting up service and loading analyzer...")
+    started_at = time.perf_counter()
+    app.state.ready = False
+    app.state.startup_report = None
+    report: Dict[str, Any] = {}
     # Initialize the analyzer once and store it in the application state
     app.state.analyzer = ProductPageAnalyzer()
+    report["analyzer_ms"] = round((time.perf_counter() - started_at) * 1000, 3)
     logger.info("ProductPageAnalyzer loaded and stored in app.state.")
+    # The workers that run the analyses off the event loop are started by the warm-up
+    app.state.analysis_pool = AnalysisPool(app.state.analyzer)
+    # Identical pages are answered from this cache without a new analysis
+    app.state.result_cache = ResultCache(
+        app.state.analyzer.module_set_version, pattern_manager.version
+    )
+    warm_up_task = asyncio.create_task(
+        asyncio.to_thread(_warm_up, app, started_at, report)
+    )
     yield
     # Code to run on shutdown
     logger.info("Shutting down service...")
+    app.state.ready = False
+    # The warm-up thread cannot be cancelled: shut the pool down first, so a start
+    # that is still running gives up instead of installing its workers, then wait
+    # for the thread before the analyzer it uses is torn down.
+    app.state.analysis_pool.shutdown()
+    await warm_up_task
+    app.state.analysis_pool = None
+    app.state.result_cache.close()
+    app.state.result_cache = None
+    app.state.analyzer.shutdown()
     app.state.analyzer = None
 
 
@@ -49,6 +101,22 @@ async def health_check(request: Request):
     return {"status": "ok", "analyzer_loaded": True}
 
 
+@app.get("/ready", tags=["Monitoring"])
+async def readiness_check(request: Request):
+    """Ready once the warm-up has finished; reports how long each startup step took."""
+    if not getattr(request.app.state, "ready", False):
+        raise HTTPException(
+            status_code=503, detail="Service is not ready: Warm-up has not finished."
+        )
+    return {"status": "ready", "startup": request.app.state.startup_report}
+
+
+@app.get("/metrics", tags=["Monitoring"])
+async def metrics():
+    """Module and parser latency histograms and parser wins, in the Prometheus format."""
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
 # Add the API routers
 app.include_router(api_v1_router, prefix="/api/v1", tags=["Extraction"])
 
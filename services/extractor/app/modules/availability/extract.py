@@ -4,6 +4,7 @@ from typing import Optional, Tuple, Any
 from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.core.context import shared_context
+from app.core.parser_chain import run_first_match
 
 from .parsers.json_ld_parser import parse_json_ld
 from .parsers.open_graph_parser import parse_open_graph
@@ -14,13 +15,14 @@ from .parsers.title_parser import parse_title
 
 FIELD_TYPE = Optional[str]
 REQUIRES = ["json_ld", "open_graph"]
+REQUIRES_VIEWS = ["raw_dom"]
 
 
 def extract() -> Tuple[Any, str, FieldExtractionStatus, int]:
     """
     The orchestrator function that extracts the availability status by calling a series of parsers.
     """
-    soup_to_use = shared_context.get("raw_soup")
+    soup_to_use = shared_context.current().raw_soup
     logger.info(
         "Availability Extractor (Main): Starting extraction of availability status."
     )
@@ -31,53 +33,24 @@ def extract() -> Tuple[Any, str, FieldExtractionStatus, int]:
         )
         return None, "NOT_FOUND", FieldExtractionStatus.NOT_FOUND, 0
 
-    # Priority 1: JSON-LD (highest reliability structured data)
-    availability, selector, status, score = parse_json_ld()
-    if availability:
-        logger.info(
-            f"Availability Extractor: Status successfully extracted with JSON-LD Parser. Score: {score}"
-        )
-        return availability, selector, status, score
-
-    # Priority 2: Open Graph (high reliability structured data)
-    availability, selector, status, score = parse_open_graph()
-    if availability:
-        logger.info(
-            f"Availability Extractor: Status successfully extracted with Open Graph Parser. Score: {score}"
-        )
-        return availability, selector, status, score
-
-    # Priority 3: Schema.org microdata (HTML fallback)
-    availability, selector, status, score = parse_schema(soup_to_use)
-    if availability:
-        logger.info(
-            f"Availability Extractor: Status successfully extracted with Schema Parser. Score: {score}"
-        )
-        return availability, selector, status, score
-
-    # Priority 4: Textual indicators in relevant DOM elements
-    availability, selector, status, score = parse_textual_indicators(soup_to_use)
-    if availability:
-        logger.info(
-            f"Availability Extractor: Status successfully extracted with Text Parser. Score: {score}"
-        )
-        return availability, selector, status, score
-
-    # Priority 5: General meta-tags
-    availability, selector, status, score = parse_meta_tags(soup_to_use)
-    if availability:
-        logger.info(
-            f"Availability Extractor: Status successfully extracted with Meta Parser. Score: {score}"
-        )
-        return availability, selector, status, score
-
-    # Priority 6: Page title (lowest reliability)
-    availability, selector, status, score = parse_title(soup_to_use)
-    if availability:
-        logger.info(
-            f"Availability Extractor: Status successfully extracted with Title Parser. Score: {score}"
-        )
-        return availability, selector, status, score
-
-    logger.info("Availability Extractor: No clear availability status found.")
-    return None, "NOT_FOUND", FieldExtractionStatus.NOT_FOUND, 0
+    # Parsers in order of priority; with adaptive ordering enabled, the parser
+    # that usually finds the availability on this domain is tried first.
+    result = run_first_match(
+        [
+            # JSON-LD (highest reliability structured data)
+            (parse_json_ld, ()),
+            # Open Graph (high reliability structured data)
+            (parse_open_graph, ()),
+            # Schema.org microdata (HTML fallback)
+            (parse_schema, (soup_to_use,)),
+            # Textual indicators in relevant DOM elements
+            (parse_textual_indicators, (soup_to_use,)),
+            # General meta-tags
+            (parse_meta_tags, (soup_to_use,)),
+            # Page title (lowest reliability)
+            (parse_title, (soup_to_use,)),
+        ]
+    )
+    if result[0] is None:
+        logger.info("Availability Extractor: No clear availability status found.")
+    return result
@@ -6,8 +6,10 @@ from bs4 import BeautifulSoup
 from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.modules.availability.utils import find_availability_status
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_meta_tags(
     soup: BeautifulSoup,
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -6,8 +6,11 @@ from bs4 import BeautifulSoup
 from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.modules.availability.utils import find_availability_status
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_schema(
     soup: BeautifulSoup,
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -45,7 +48,7 @@ def parse_schema(
     # Find other tags (span, div) with itemprop="availability"
     avail_tag = soup.find(re.compile(r"span|div|p"), itemprop="availability")
     if avail_tag:
-        text = avail_tag.get_text(strip=True)
+        text = current_memo().text(avail_tag)
         content = avail_tag.get("content", "")
 
         combined_text = f"{text} {content}".strip()
@@ -7,8 +7,11 @@ from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.modules.availability.utils import find_availability_status
 from app.utils.pattern_manager import pattern_manager
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_textual_indicators(
     soup: BeautifulSoup,
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -17,7 +20,8 @@ def parse_textual_indicators(
     """
     logger.debug("Text Parser: Searching for textual indicators in relevant sections.")
 
-    check_tags = soup.find_all(
+    check_tags = current_memo().find_all(
+        soup,
         re.compile(r"div|span|p|button|a"),
         # Use the dynamic regex from PatternManager instead of a hardcoded one
         class_=pattern_manager.get_compiled_regex("availability_class_regex"),
@@ -26,7 +30,7 @@ def parse_textual_indicators(
 
     for tag in check_tags:
         text = (
-            tag.get_text(strip=True).lower()
+            current_memo().text(tag).lower()
             or tag.get("title", "").lower()
             or tag.get("value", "").lower()
         )
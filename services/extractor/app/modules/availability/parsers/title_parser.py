@@ -5,8 +5,11 @@ from bs4 import BeautifulSoup
 from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.modules.availability.utils import find_availability_status
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_title(
     soup: BeautifulSoup,
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -17,7 +20,7 @@ def parse_title(
     title_tag = soup.find("title")
 
     if title_tag:
-        title_text = title_tag.get_text(strip=True).lower()
+        title_text = current_memo().text(title_tag).lower()
 
         status = find_availability_status(title_text)
 
@@ -4,6 +4,7 @@ from typing import Optional, Tuple, Any
 from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.core.context import shared_context
+from app.core.parser_chain import run_first_match
 
 from .parsers.json_ld_parser import parse_json_ld
 from .parsers.open_graph_parser import parse_open_graph
@@ -15,54 +16,41 @@ from .parsers.general_fallback_parser import parse_general_fallback
 
 FIELD_TYPE = Optional[str]
 REQUIRES = ["json_ld", "open_graph"]
+REQUIRES_VIEWS = ["raw_dom"]
 
 
 def extract() -> Tuple[Any, str, FieldExtractionStatus, int]:
     """
     The orchestrator function that extracts the brand name by calling a series of parsers.
     """
-    soup_to_use = shared_context.get("raw_soup")
-    nlp_model = shared_context.get("resources", {}).get("nlp_model")
+    soup_to_use = shared_context.current().raw_soup
+    nlp_model = shared_context.current().resources.get("nlp_model")
 
     logger.info("Brand Extractor (Main): Starting brand name extraction.")
     if not soup_to_use:
         logger.warning("Brand Extractor: No valid BeautifulSoup objects to work with.")
         return None, "NOT_FOUND", FieldExtractionStatus.NOT_FOUND, 0
 
-    # Priority 1: JSON-LD (highest reliability)
-    brand, selector, status, score = parse_json_ld(soup_to_use, nlp_model)
-    if brand:
-        return brand, selector, status, score
-
-    # Priority 2: Open Graph (high reliability)
-    brand, selector, status, score = parse_open_graph(soup_to_use, nlp_model)
-    if brand:
-        return brand, selector, status, score
-
-    # Priority 3: Meta tags and structured microdata (from HTML)
-    brand, selector, status, score = parse_meta_tags(soup_to_use, nlp_model)
-    if brand:
-        return brand, selector, status, score
-
-    # Priority 4: DOM-based heuristics
-    brand, selector, status, score = parse_with_dom_heuristics(soup_to_use, nlp_model)
-    if brand:
-        return brand, selector, status, score
-
-    # Priority 5: Pattern recognition in the title
-    brand, selector, status, score = parse_from_title(soup_to_use, nlp_model)
-    if brand:
-        return brand, selector, status, score
-
-    # Priority 6: NLP-based extraction (run after DOM/Title heuristics)
-    brand, selector, status, score = parse_with_nlp(soup_to_use, nlp_model)
-    if brand:
-        return brand, selector, status, score
-
-    # Priority 7: General fallback search
-    brand, selector, status, score = parse_general_fallback(soup_to_use, nlp_model)
-    if brand:
-        return brand, selector, status, score
-
-    logger.info("Brand Extractor: No brand name found via any method.")
-    return None, "NOT_FOUND", FieldExtractionStatus.NOT_FOUND, 0
+    # Parsers in order of priority; with adaptive ordering enabled, the parser
+    # that usually finds the brand on this domain is tried first.
+    result = run_first_match(
+        [
+            # JSON-LD (highest reliability)
+            (parse_json_ld, (soup_to_use, nlp_model)),
+            # Open Graph (high reliability)
+            (parse_open_graph, (soup_to_use, nlp_model)),
+            # Meta tags and structured microdata (from HTML)
+            (parse_meta_tags, (soup_to_use, nlp_model)),
+            # DOM-based heuristics
+            (parse_with_dom_heuristics, (soup_to_use, nlp_model)),
+            # Pattern recognition in the title
+            (parse_from_title, (soup_to_use, nlp_model)),
+            # NLP-based extraction (run after DOM/Title heuristics)
+            (parse_with_nlp, (soup_to_use, nlp_model)),
+            # General fallback search
+            (parse_general_fallback, (soup_to_use, nlp_model)),
+        ]
+    )
+    if result[0] is None:
+        logger.info("Brand Extractor: No brand name found via any method.")
+    return result
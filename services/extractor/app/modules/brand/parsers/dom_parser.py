@@ -7,8 +7,11 @@ from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.modules.brand.utils import is_plausible_brand, check_brand_in_main_title
 from app.utils.pattern_manager import pattern_manager
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_with_dom_heuristics(
     soup: BeautifulSoup, nlp_model: Any
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -20,6 +23,7 @@ def parse_with_dom_heuristics(
     # Proximity search based on keywords (Brand:, Manufacturer:, etc.)
     # Get the regex from the PatternManager
     brand_label_keywords_regex = pattern_manager.get_compiled_regex("brand_label_regex")
+    memo = current_memo()
 
     for label_tag in soup.find_all(
         lambda tag: tag.name in ["span", "div", "p", "dt", "th"]
@@ -27,12 +31,12 @@ def parse_with_dom_heuristics(
     ):
         next_sibling = label_tag.find_next_sibling()
         if next_sibling:
-            candidate_brand = next_sibling.get_text(strip=True)
+            candidate_brand = memo.text(next_sibling)
             if is_plausible_brand(
                 candidate_brand, nlp_model
             ) and check_brand_in_main_title(candidate_brand, soup):
                 logger.debug(
-                    f"DOM Parser: Found via sibling of label '{label_tag.get_text(strip=True)}': {candidate_brand}"
+                    f"DOM Parser: Found via sibling of label '{memo.text(label_tag)}': {candidate_brand}"
                 )
                 return (
                     candidate_brand,
@@ -43,12 +47,12 @@ def parse_with_dom_heuristics(
 
         child_elements = label_tag.find_all(re.compile(r"span|div|a|strong|b"), limit=2)
         for child_elem in child_elements:
-            candidate_brand = child_elem.get_text(strip=True)
+            candidate_brand = memo.text(child_elem)
             if is_plausible_brand(
                 candidate_brand, nlp_model
             ) and check_brand_in_main_title(candidate_brand, soup):
                 logger.debug(
-                    f"DOM Parser: Found via child of label '{label_tag.get_text(strip=True)}': {candidate_brand}"
+                    f"DOM Parser: Found via child of label '{memo.text(label_tag)}': {candidate_brand}"
                 )
                 return (
                     candidate_brand,
@@ -58,7 +62,8 @@ def parse_with_dom_heuristics(
                 )
 
     # Direct search based on classes and IDs
-    direct_brand_elements = soup.find_all(
+    direct_brand_elements = memo.find_all(
+        soup,
         re.compile(r"a|span|div|p|strong|h[1-6]"),
         # Get the class regex from the PatternManager
         class_=pattern_manager.get_compiled_regex("brand_class_regex"),
@@ -68,7 +73,7 @@ def parse_with_dom_heuristics(
     generic_text_regex = pattern_manager.get_compiled_regex("generic_brand_text_regex")
 
     for elem in direct_brand_elements:
-        text_content = elem.get_text(strip=True)
+        text_content = memo.text(elem)
         # Skip generic links (e.g., "All brands")
         if generic_text_regex.search(text_content):
             continue
@@ -7,8 +7,11 @@ from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.modules.brand.utils import is_plausible_brand, check_brand_in_main_title
 from app.utils.pattern_manager import pattern_manager
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser(low_priority=True)
 def parse_general_fallback(
     soup: BeautifulSoup, nlp_model: Any
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -17,7 +20,8 @@ def parse_general_fallback(
     """
     logger.debug("General Fallback Parser: Last resort search.")
 
-    brand_elements_fallback = soup.find_all(
+    brand_elements_fallback = current_memo().find_all(
+        soup,
         re.compile(r"a|span|div|p"),
         # Use the consistent name 'brand_class_regex'
         class_=pattern_manager.get_compiled_regex("brand_class_regex"),
@@ -28,7 +32,7 @@ def parse_general_fallback(
     generic_text_regex = pattern_manager.get_compiled_regex("generic_brand_text_regex")
 
     for elem in brand_elements_fallback:
-        brand_name_candidate = elem.get_text(strip=True)
+        brand_name_candidate = current_memo().text(elem)
         # Skip generic elements
         if generic_text_regex.search(brand_name_candidate) or re.search(
             r"filter|list|nav|menu|category",
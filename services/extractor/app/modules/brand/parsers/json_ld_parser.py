@@ -4,10 +4,12 @@ from typing import Optional, Tuple, Any
 from bs4 import BeautifulSoup
 from loguru import logger
 from app.core.models import FieldExtractionStatus
-from app.core.context import shared_context
+from app.modules.json_ld.index import get_json_ld_index
 from app.modules.brand.utils import is_plausible_brand, check_brand_in_main_title
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_json_ld(
     soup: BeautifulSoup, nlp_model: Any
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -16,17 +18,15 @@ def parse_json_ld(
     """
     logger.debug("JSON-LD Parser: Searching for brand in JSON-LD data.")
 
-    json_ld_data = shared_context.get("json_ld")
-    if not isinstance(json_ld_data, list):
+    json_ld_index = get_json_ld_index()
+    if json_ld_index is None:
         return None, "json_ld_parser", FieldExtractionStatus.NOT_FOUND, 0
 
-    for node in json_ld_data:
-        if not isinstance(node, dict):
-            continue
-
+    for key in ["brand", "manufacturer"]:
         # Check for brand info, which can be a string or an object
-        for key in ["brand", "manufacturer"]:
-            brand_node = node.get(key)
+        for _, brand_node in json_ld_index.values(key):
+            if isinstance(brand_node, list) and brand_node:
+                brand_node = brand_node[0]
             brand_name_candidate = None
 
             if isinstance(brand_node, str):
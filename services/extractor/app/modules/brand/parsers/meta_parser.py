@@ -6,8 +6,11 @@ from bs4 import BeautifulSoup
 from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.modules.brand.utils import is_plausible_brand, check_brand_in_main_title
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_meta_tags(
     soup: BeautifulSoup, nlp_model: Any
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -20,7 +23,7 @@ def parse_meta_tags(
     # Priority 1: Amazon-specific 'byline' link
     byline_link = soup.select_one("#bylineInfo, #brand")
     if byline_link:
-        brand_name_candidate = byline_link.get_text(strip=True)
+        brand_name_candidate = current_memo().text(byline_link)
         # Sometimes it says "Bezoek de XXXXX Store" (Visit the XXXXX Store)
         match_store = re.search(
             r"Bezoek de\s*(.*?)\s*Store", brand_name_candidate, re.IGNORECASE
@@ -62,8 +65,8 @@ def parse_meta_tags(
     brand_itemprop_tag = soup.find(
         re.compile(r"span|div|p|a|strong|b"), itemprop="brand"
     )
-    if brand_itemprop_tag and brand_itemprop_tag.get_text(strip=True):
-        brand_name_candidate = brand_itemprop_tag.get_text(strip=True)
+    if brand_itemprop_tag and current_memo().text(brand_itemprop_tag):
+        brand_name_candidate = current_memo().text(brand_itemprop_tag)
         if is_plausible_brand(
             brand_name_candidate, nlp_model
         ) and check_brand_in_main_title(brand_name_candidate, soup):
@@ -5,8 +5,10 @@ from bs4 import BeautifulSoup
 from loguru import logger
 from app.core.types import FieldExtractionStatus
 from app.modules.brand.utils import is_plausible_brand, get_main_title_content
+from app.core.timings import timed_parser
 
 
+@timed_parser(low_priority=True)
 def parse_with_nlp(
     soup: BeautifulSoup, nlp_model: Any
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -6,8 +6,10 @@ from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.core.context import shared_context
 from app.modules.brand.utils import is_plausible_brand, check_brand_in_main_title
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_open_graph(
     soup: BeautifulSoup, nlp_model: Any
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -16,7 +18,7 @@ def parse_open_graph(
     """
     logger.debug("Open Graph Parser: Searching for brand in OG data.")
 
-    og_data = shared_context.get("open_graph")
+    og_data = shared_context.current().open_graph
     if not isinstance(og_data, dict):
         return None, "open_graph_parser", FieldExtractionStatus.NOT_FOUND, 0
 
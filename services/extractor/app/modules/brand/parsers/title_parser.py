@@ -10,8 +10,10 @@ from app.modules.brand.utils import (
     get_main_title_content,
     find_explicit_brands,
 )
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_from_title(
     soup: BeautifulSoup, nlp_model: Any
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -4,6 +4,7 @@ import re
 from typing import Optional, Tuple, Any
 from bs4 import BeautifulSoup
 from loguru import logger
+from app.core.memo import current_memo
 
 GENERIC_STOP_WORDS = {
     "the",
@@ -118,30 +119,39 @@ def is_plausible_brand(candidate_brand: Optional[str], nlp_model: Any) -> bool:
     return True
 
 
-def get_main_title_content(soup: BeautifulSoup) -> Tuple[Optional[str], str]:
-    """
-    Finds the main title of the page (H1 or <title> tag).
-    """
+def _find_main_title(soup: BeautifulSoup) -> Tuple[Optional[str], str]:
+    memo = current_memo()
     title_selectors = [
         'h1[itemprop="name"]',
         "h1.product-title",
         "h1.item-name",
         "h1.product__title",
         "h1.pdp-title",
-        "h1",
     ]
     for selector in title_selectors:
         element = soup.select_one(selector)
         if element:
-            return element.get_text(strip=True), selector
+            return memo.text(element), selector
+
+    # Any <h1>: the first of the document's h1 list
+    h1s = memo.h1s(soup)
+    if h1s:
+        return memo.text(h1s[0]), "h1"
 
     # Fallback to the main <title> tag
     if soup.title and soup.title.string:
-        return soup.title.get_text(strip=True), "title"
+        return memo.text(soup.title), "title"
 
     return None, "NO_TITLE_FOUND"
 
 
+def get_main_title_content(soup: BeautifulSoup) -> Tuple[Optional[str], str]:
+    """
+    Finds the main title of the page (H1 or <title> tag), once per document.
+    """
+    return current_memo().cached("main_title", soup, lambda: _find_main_title(soup))
+
+
 def check_brand_in_main_title(candidate_brand: str, soup: BeautifulSoup) -> bool:
     """
     Checks if the candidate brand name (approximately) appears in the H1 or TITLE tag.
@@ -168,11 +178,12 @@ def find_explicit_brands(soup: BeautifulSoup) -> set[str]:
     Returns a set of cleaned, lowercased brand candidates.
     """
     explicit_brands = set()
+    memo = current_memo()
 
     # Search for elements with itemprop="brand"
-    brand_itemprop_tags = soup.find_all(itemprop="brand")
+    brand_itemprop_tags = memo.find_all(soup, itemprop="brand")
     for tag in brand_itemprop_tags:
-        text = tag.get("content") or tag.get_text(strip=True)
+        text = tag.get("content") or memo.text(tag)
         if text:
             explicit_brands.add(text.strip().lower())
 
@@ -180,9 +191,9 @@ def find_explicit_brands(soup: BeautifulSoup) -> set[str]:
     brand_class_regex = re.compile(
         r"brand|manufacturer|vendor|product-brand", re.IGNORECASE
     )
-    brand_elements = soup.find_all(class_=brand_class_regex)
+    brand_elements = memo.find_all(soup, class_=brand_class_regex)
     for element in brand_elements:
-        text = element.get_text(strip=True)
+        text = memo.text(element)
         if text:
             explicit_brands.add(text.strip().lower())
 
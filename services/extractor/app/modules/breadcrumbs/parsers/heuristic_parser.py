@@ -1,14 +1,15 @@
 # argus/services/extractor/app/modules/breadcrumbs/parsers/heuristic_parser.py
 
 from typing import Optional, Tuple, List
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.breadcrumbs.utils import clean_and_filter_breadcrumbs
 from app.utils.pattern_manager import pattern_manager
+from app.core.timings import timed_parser
 
 
-def is_breadcrumb_container(tag: Tag) -> bool:
+def is_breadcrumb_container(tag: DomNode) -> bool:
     """
     Checks if a tag is a likely breadcrumb container by
     scanning attributes for keywords or standard ARIA roles/labels.
@@ -39,7 +40,7 @@ def is_breadcrumb_container(tag: Tag) -> bool:
     return bool(container_regex.search(attributes_string))
 
 
-def _extract_text_from_li(item: Tag) -> Optional[str]:
+def _extract_text_from_li(item: DomNode) -> Optional[str]:
     """
     Smarter text extraction from an <li> item.
     It prioritizes <a> tags to avoid grabbing separators.
@@ -59,14 +60,15 @@ def _extract_text_from_li(item: Tag) -> Optional[str]:
     return item.get_text(strip=True)
 
 
+@timed_parser
 def parse_with_heuristics(
-    soup: BeautifulSoup,
+    dom: DomNode,
 ) -> Tuple[Optional[List[str]], str, FieldExtractionStatus, int]:
     """
     Extracts breadcrumbs using heuristics to find the container and the items,
     regardless of the specific HTML tags used.
     """
-    containers = soup.find_all(is_breadcrumb_container, limit=5)
+    containers = dom.find_all(is_breadcrumb_container, limit=5)
 
     for container in containers:
         found_breadcrumbs = []
@@ -94,7 +96,7 @@ def parse_with_heuristics(
 
         # Heuristic C: No <li> or <a>? Find direct children (e.g., <span>)
         if not found_breadcrumbs:
-            children = [child for child in container.children if isinstance(child, Tag)]
+            children = container.children
             if len(children) > 1:
                 for child in children:
                     text = child.get_text(strip=True)
@@ -2,19 +2,23 @@
 
 import re
 from typing import Optional, Tuple, List
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.breadcrumbs.utils import clean_and_filter_breadcrumbs
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
-def _find_breadcrumb_container(soup: BeautifulSoup) -> Optional[Tag]:
+def _find_breadcrumb_container(dom: DomNode) -> Optional[DomNode]:
     """
     Finds a breadcrumb container by checking both itemprop and itemtype attributes.
     """
     # Find tags with 'itemtype' containing 'BreadcrumbList'
     # This is a very reliable indicator.
-    itemtype_containers = soup.find_all(
+    memo = current_memo()
+    itemtype_containers = memo.find_all(
+        dom,
         re.compile(r"ol|ul|nav|div"),
         itemtype=re.compile(r"BreadcrumbList", re.IGNORECASE),
     )
@@ -23,7 +27,8 @@ def _find_breadcrumb_container(soup: BeautifulSoup) -> Optional[Tag]:
 
     # Fallback: Find tags with 'itemprop' containing 'breadcrumb'
     # This is less common for the list itself but still valid.
-    itemprop_containers = soup.find_all(
+    itemprop_containers = memo.find_all(
+        dom,
         re.compile(r"ol|ul|nav|div"),
         itemprop=re.compile(r"breadcrumb|itemList", re.IGNORECASE),
     )
@@ -33,14 +38,15 @@ def _find_breadcrumb_container(soup: BeautifulSoup) -> Optional[Tag]:
     return None
 
 
+@timed_parser
 def parse_itemprop_schema(
-    soup: BeautifulSoup,
+    dom: DomNode,
 ) -> Tuple[Optional[List[str]], str, FieldExtractionStatus, int]:
     """
     Extracts breadcrumbs from Schema.org (BreadcrumbList) microdata,
     checking both itemprop and itemtype.
     """
-    breadcrumb_list_container = _find_breadcrumb_container(soup)
+    breadcrumb_list_container = _find_breadcrumb_container(dom)
 
     if not breadcrumb_list_container:
         return None, "itemprop_parser", FieldExtractionStatus.NOT_FOUND, 0
@@ -48,7 +54,8 @@ def parse_itemprop_schema(
     found_breadcrumbs = []
 
     # Find all elements marked as 'itemListElement' or 'item'
-    list_items = breadcrumb_list_container.find_all(
+    list_items = current_memo().find_all(
+        breadcrumb_list_container,
         itemprop=re.compile(r"itemListElement|item", re.IGNORECASE)
     )
 
@@ -71,7 +78,7 @@ def parse_itemprop_schema(
                 elif item.get_text(strip=True):
                     # Try to get text only from the item, not nested tags
                     main_text = "".join(
-                        item.find_all(string=True, recursive=False)
+                        text for text, _ in item.text_nodes(recursive=False)
                     ).strip()
                     if main_text:
                         found_breadcrumbs.append(main_text)
@@ -2,29 +2,35 @@
 
 import re
 from typing import Optional, Tuple, List
-from bs4 import BeautifulSoup
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.breadcrumbs.utils import clean_and_filter_breadcrumbs, is_unwanted_text
+from app.core.timings import timed_parser
 
 # Expanded regex to include '|' and '\' as separators
 BREADCRUMB_SEP_REGEX = re.compile(r"\s*>\s*|\s*»\s*|\s*/\s*|\s*\|\s*|\\")
 
 
+@timed_parser
 def parse_with_regex(
-    soup: BeautifulSoup,
+    dom: DomNode,
 ) -> Tuple[Optional[List[str]], str, FieldExtractionStatus, int]:
     """
     Finds breadcrumbs using a regex pattern based on separators,
     while safely ignoring script and style content.
     """
 
+    body = dom.find("body")
+    if body is None:
+        return None, "regex_parser", FieldExtractionStatus.NOT_FOUND, 0
+
     # Search for text nodes containing any of the separators
-    all_text_nodes = soup.body.find_all(string=BREADCRUMB_SEP_REGEX)
+    all_text_nodes = body.text_nodes(string=BREADCRUMB_SEP_REGEX)
 
-    for text_node in all_text_nodes:
+    for text_node, parent in all_text_nodes:
         # Avoid extracting from noisy or irrelevant tags
-        if text_node.parent.name in ["script", "style", "title", "head", "a", "option"]:
+        if parent.name in ["script", "style", "title", "head", "a", "option"]:
             continue
 
         text = text_node.strip()
@@ -38,7 +44,7 @@ def parse_with_regex(
         cleaned_breadcrumbs = clean_and_filter_breadcrumbs(parts)
 
         if cleaned_breadcrumbs:
-            selector_used = f"{text_node.parent.name} (text pattern)"
+            selector_used = f"{parent.name} (text pattern)"
             logger.debug(f"Regex Parser: Found breadcrumbs: {cleaned_breadcrumbs}")
             return (
                 cleaned_breadcrumbs,
@@ -15,6 +15,7 @@ from .parsers.fallback_parser import parse_generic_fallback
 FIELD_TYPE = Optional[str]
 
 REQUIRES = ["json_ld", "open_graph"]
+REQUIRES_VIEWS = ["raw_dom"]
 
 
 def extract() -> Tuple[Any, str, FieldExtractionStatus, int]:
@@ -22,8 +23,8 @@ def extract() -> Tuple[Any, str, FieldExtractionStatus, int]:
     The orchestrator function that extracts the product description by calling a series
     of parsers, collecting all results, and returning the one with the highest score.
     """
-    soup_to_use = shared_context.get("raw_soup")
-    nlp_model = shared_context.get("resources", {}).get("nlp_model")
+    soup_to_use = shared_context.current().raw_soup
+    nlp_model = shared_context.current().resources.get("nlp_model")
 
     if not soup_to_use:
         logger.warning(
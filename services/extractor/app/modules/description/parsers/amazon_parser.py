@@ -5,8 +5,10 @@ from bs4 import BeautifulSoup
 from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.modules.description.utils import clean_and_validate_description
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_amazon_sections(
     soup: BeautifulSoup, nlp_model: Any = None
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -6,8 +6,10 @@ from loguru import logger
 from app.core.context import shared_context
 from app.core.models import FieldExtractionStatus
 from app.modules.description.utils import clean_and_validate_description
+from app.core.timings import timed_parser
 
 
+@timed_parser(low_priority=True)
 def parse_generic_fallback(
     soup: BeautifulSoup, nlp_model: Any = None
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -33,8 +35,8 @@ def parse_generic_fallback(
 
             # Prevent duplication of other extracted fields
             if cleaned_desc and cleaned_desc not in [
-                shared_context.get("title"),
-                shared_context.get("price"),
+                shared_context.current().result("title"),
+                shared_context.current().result("price"),
             ]:
                 logger.debug(
                     f"Fallback Parser: Found via general text block: {cleaned_desc[:100]}..."
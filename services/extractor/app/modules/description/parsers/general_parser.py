@@ -6,8 +6,11 @@ from bs4 import BeautifulSoup
 from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.modules.description.utils import clean_and_validate_description
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_general_sections(
     soup: BeautifulSoup, nlp_model: Any = None
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -16,7 +19,8 @@ def parse_general_sections(
     """
     logger.debug("General Parser: Searching for general description sections.")
 
-    general_desc_elements = soup.find_all(
+    general_desc_elements = current_memo().find_all(
+        soup,
         ["div", "p", "section", "span"],
         class_=re.compile(r"description|details|info|content|main-text", re.IGNORECASE),
         id=re.compile(r"description|details|info|content|main-text", re.IGNORECASE),
@@ -3,10 +3,12 @@
 from typing import Optional, Tuple, Any
 from loguru import logger
 from app.core.models import FieldExtractionStatus
-from app.core.context import shared_context
+from app.modules.json_ld.index import get_json_ld_index
 from app.modules.description.utils import clean_and_validate_description
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_json_ld(
     nlp_model: Any = None,
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -15,16 +17,12 @@ def parse_json_ld(
     """
     logger.debug("JSON-LD Parser: Searching for description in JSON-LD data.")
 
-    json_ld_data = shared_context.get("json_ld")
-    if not isinstance(json_ld_data, list):
+    json_ld_index = get_json_ld_index()
+    if json_ld_index is None:
         return None, "json_ld_parser", FieldExtractionStatus.NOT_FOUND, 0
 
-    for node in json_ld_data:
-        if not isinstance(node, dict):
-            continue
-
-        # The description can be at the top level of any node
-        desc_text = node.get("description")
+    # The description can be at the top level of any node
+    for _, desc_text in json_ld_index.values("description"):
         if isinstance(desc_text, str):
             cleaned_desc = clean_and_validate_description(desc_text, nlp_model)
             if cleaned_desc:
@@ -5,8 +5,10 @@ from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.core.context import shared_context
 from app.modules.description.utils import clean_and_validate_description
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_open_graph(
     nlp_model: Any = None,
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
@@ -15,7 +17,7 @@ def parse_open_graph(
     """
     logger.debug("Open Graph Parser: Searching for description in OG data.")
 
-    og_data = shared_context.get("open_graph")
+    og_data = shared_context.current().open_graph
     if not isinstance(og_data, dict):
         return None, "open_graph_parser", FieldExtractionStatus.NOT_FOUND, 0
 
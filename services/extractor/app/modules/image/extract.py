@@ -4,6 +4,7 @@ from typing import Optional, Tuple, Any
 from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.core.context import shared_context
+from app.core.parser_chain import run_first_match
 
 from .parsers.json_ld_parser import parse_json_ld
 from .parsers.open_graph_parser import parse_open_graph
@@ -15,75 +16,39 @@ from .parsers.fallback_parser import parse_largest_image_fallback
 FIELD_TYPE = Optional[str]
 
 REQUIRES = ["json_ld", "open_graph"]
+REQUIRES_VIEWS = ["dom"]
 
 
 def extract() -> Tuple[Any, str, FieldExtractionStatus, int]:
     """
     The orchestrator function that extracts the image URL by calling a series of parsers.
     """
-    soup_to_use = shared_context.get("raw_soup")
-    processed_elements = shared_context.get("processed_elements", set())
-    if not soup_to_use:
-        logger.warning("Image Extractor: No valid BeautifulSoup objects to work with.")
+    dom = shared_context.current().dom
+    processed_elements = shared_context.current().processed_elements
+    if not dom:
+        logger.warning("Image Extractor: No DOM to work with.")
         return None, "NOT_FOUND", FieldExtractionStatus.NOT_FOUND, 0
 
     logger.info("Image Extractor (Main): Starting image URL extraction.")
 
-    # Priority 1: JSON-LD (highest reliability)
-    image_url, selector, status, score = parse_json_ld()
-    if image_url:
-        logger.info(
-            f"Image Extractor: Image URL successfully extracted with JSON-LD Parser. Score: {score}"
-        )
-        return image_url, selector, status, score
-
-    # Priority 2: Open Graph (high reliability)
-    image_url, selector, status, score = parse_open_graph()
-    if image_url:
-        logger.info(
-            f"Image Extractor: Image URL successfully extracted with Open Graph Parser. Score: {score}"
-        )
-        return image_url, selector, status, score
-
-    # Priority 3: Schema.org Microdata (HTML)
-    image_url, selector, status, score = parse_meta_tags(
-        soup_to_use, processed_elements
+    # Parsers in order of priority; with adaptive ordering enabled, the parser
+    # that usually finds the image on this domain is tried first.
+    result = run_first_match(
+        [
+            # JSON-LD (highest reliability)
+            (parse_json_ld, ()),
+            # Open Graph (high reliability)
+            (parse_open_graph, ()),
+            # Schema.org Microdata (HTML)
+            (parse_meta_tags, (dom, processed_elements)),
+            # Amazon-specific selectors (HTML)
+            (parse_amazon_selectors, (dom, processed_elements)),
+            # Image in product context (HTML)
+            (parse_from_product_context, (dom, processed_elements)),
+            # Fallback (largest image, HTML)
+            (parse_largest_image_fallback, (dom, processed_elements)),
+        ]
     )
-    if image_url:
-        logger.info(
-            f"Image Extractor: Image URL successfully extracted with Meta Parser. Score: {score}"
-        )
-        return image_url, selector, status, score
-
-    # Priority 4: Amazon-specific selectors (HTML)
-    image_url, selector, status, score = parse_amazon_selectors(
-        soup_to_use, processed_elements
-    )
-    if image_url:
-        logger.info(
-            f"Image Extractor: Image URL successfully extracted with Amazon Parser. Score: {score}"
-        )
-        return image_url, selector, status, score
-
-    # Priority 5: Image in product context (HTML)
-    image_url, selector, status, score = parse_from_product_context(
-        soup_to_use, processed_elements
-    )
-    if image_url:
-        logger.info(
-            f"Image Extractor: Image URL successfully extracted with Context Parser. Score: {score}"
-        )
-        return image_url, selector, status, score
-
-    # Priority 6: Fallback (largest image, HTML)
-    image_url, selector, status, score = parse_largest_image_fallback(
-        soup_to_use, processed_elements
-    )
-    if image_url:
-        logger.info(
-            f"Image Extractor: Image URL successfully extracted with Fallback Parser. Score: {score}"
-        )
-        return image_url, selector, status, score
-
-    logger.info("Image Extractor: No suitable image URL found.")
-    return None, "NOT_FOUND", FieldExtractionStatus.NOT_FOUND, 0
+    if result[0] is None:
+        logger.info("Image Extractor: No suitable image URL found.")
+    return result
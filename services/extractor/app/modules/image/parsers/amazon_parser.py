@@ -1,14 +1,16 @@
 # argus/services/extractor/app/modules/image/parsers/amazon_parser.py
 
 from typing import Optional, Tuple, Set
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.image.utils import is_valid_image_url
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_amazon_selectors(
-    soup: BeautifulSoup, processed_elements: Set[Tag]
+    dom: DomNode, processed_elements: Set[DomNode]
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
     """
     Extracts the image from Amazon-specific HTML elements.
@@ -25,7 +27,7 @@ def parse_amazon_selectors(
     ]
 
     for selector_str in amazon_image_selectors:
-        img_element = soup.select_one(selector_str)
+        img_element = dom.select_one(selector_str)
         if img_element and img_element.get("src"):
             if img_element in processed_elements:
                 continue
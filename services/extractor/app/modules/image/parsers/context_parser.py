@@ -2,29 +2,38 @@
 
 import re
 from typing import Optional, Tuple, Set
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.image.utils import is_valid_image_url
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
+# 'div[id*="product"], div[class*="product"], main, article' as token index lookups
+PRODUCT_SECTIONS = [
+    ("div", {"id": re.compile("product")}),
+    ("div", {"class_": re.compile("product")}),
+    (["main", "article"], {}),
+]
 
+
+@timed_parser
 def parse_from_product_context(
-    soup: BeautifulSoup, processed_elements: Set[Tag]
+    dom: DomNode, processed_elements: Set[DomNode]
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
     """
     Extracts the first reasonable image from product-related sections.
     """
     logger.debug("Context Parser: Searching in general product-related sections.")
 
-    product_section_elements = soup.select(
-        'div[id*="product"], div[class*="product"], main, article'
-    )
+    memo = current_memo()
+    product_section_elements = memo.find_any(dom, PRODUCT_SECTIONS)
     for section in product_section_elements:
         if section in processed_elements:
             continue
 
         # We search for all images, not just the first one, to have a better chance
-        image_tags = section.find_all("img", src=re.compile(r"https?://"))
+        image_tags = memo.images(section)
         for img_tag in image_tags:
             img_src = img_tag.get("src")
             if not img_src or not is_valid_image_url(img_src):
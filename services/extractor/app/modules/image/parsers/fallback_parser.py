@@ -1,22 +1,24 @@
 # argus/services/extractor/app/modules/image/parsers/fallback_parser.py
 
-import re
 from typing import Optional, Tuple, Set
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.image.utils import is_valid_image_url
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser(low_priority=True)
 def parse_largest_image_fallback(
-    soup: BeautifulSoup, processed_elements: Set[Tag]
+    dom: DomNode, processed_elements: Set[DomNode]
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
     """
     Searches for the largest image in the body as a last resort.
     """
     logger.debug("Fallback Parser: Searching for largest image in body.")
 
-    all_images = soup.find_all("img", src=re.compile(r"https?://"))
+    all_images = current_memo().images(dom)
     best_image_url = None
     max_area = 0
 
@@ -3,25 +3,23 @@
 from typing import Optional, Tuple
 from loguru import logger
 from app.core.models import FieldExtractionStatus
-from app.core.context import shared_context
+from app.modules.json_ld.index import get_json_ld_index
 from app.modules.image.utils import is_valid_image_url
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_json_ld() -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
     """
     Extracts the image URL from the 'json_ld' data in shared_context.
     """
     logger.debug("JSON-LD Parser: Searching for image in JSON-LD data.")
 
-    json_ld_data = shared_context.get("json_ld")
-    if not isinstance(json_ld_data, list):
+    json_ld_index = get_json_ld_index()
+    if json_ld_index is None:
         return None, "json_ld_parser", FieldExtractionStatus.NOT_FOUND, 0
 
-    for node in json_ld_data:
-        if not isinstance(node, dict):
-            continue
-
-        image_data = node.get("image")
+    for _, image_data in json_ld_index.values("image"):
         image_url = None
 
         if isinstance(image_data, str):
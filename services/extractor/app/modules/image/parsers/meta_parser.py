@@ -1,14 +1,16 @@
 # argus/services/extractor/app/modules/image/parsers/meta_parser.py
 
 from typing import Optional, Tuple, Set
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.image.utils import is_valid_image_url
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_meta_tags(
-    soup: BeautifulSoup, processed_elements: Set[Tag]
+    dom: DomNode, processed_elements: Set[DomNode]
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
     """
     Extracts the image from Schema.org microdata meta-tags.
@@ -17,7 +19,7 @@ def parse_meta_tags(
     logger.debug("Meta Parser: Searching in Schema.org meta tags.")
 
     # Look for Schema.org microdata tag
-    schema_image = soup.find("meta", itemprop="image")
+    schema_image = dom.find("meta", itemprop="image")
     if (
         schema_image
         and schema_image.get("content")
@@ -5,15 +5,17 @@ from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.core.context import shared_context
 from app.modules.image.utils import is_valid_image_url
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_open_graph() -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
     """
     Extracts the image URL from the 'open_graph' data in shared_context.
     """
     logger.debug("Open Graph Parser: Searching for image in OG data.")
 
-    og_data = shared_context.get("open_graph")
+    og_data = shared_context.current().open_graph
     if not isinstance(og_data, dict):
         return None, "open_graph_parser", FieldExtractionStatus.NOT_FOUND, 0
 
@@ -4,9 +4,11 @@ from typing import Dict, Any, Optional, Tuple, List
 from loguru import logger
 from app.core.context import shared_context
 from app.core.models import FieldExtractionStatus
+from app.modules.json_ld.index import JsonLdIndex
 from app.modules.json_ld.utils import parse_json_ld_scripts
 
 REQUIRES = []
+REQUIRES_VIEWS = ["dom"]
 FIELD_TYPE = Optional[List[Dict[str, Any]]]
 
 
@@ -15,17 +17,17 @@ def extract() -> Tuple[Optional[List[Dict[str, Any]]], str, FieldExtractionStatu
     Extracts all raw JSON-LD data from the page.
     This module acts as a data provider. Other modules (like 'price',
     'title', 'reviews') will depend on this module and consume this
-    raw data from the shared_context.
+    data from the shared_context, through its JsonLdIndex.
     """
-    soup_to_use = shared_context.get("raw_soup")
+    dom = shared_context.current().dom
     selector = "script[type='application/ld+json']"
 
-    if not soup_to_use:
-        logger.warning("JSON_LD Extractor: No raw_soup found in context.")
+    if not dom:
+        logger.warning("JSON_LD Extractor: No DOM found in context.")
         return None, selector, FieldExtractionStatus.NOT_FOUND, 0
 
     # Use the utility to find and parse all scripts
-    all_parsed_json_data = parse_json_ld_scripts(soup_to_use)
+    all_parsed_json_data = parse_json_ld_scripts(dom)
 
     if not all_parsed_json_data:
         logger.info("JSON_LD Extractor: No valid JSON-LD data found on page.")
@@ -35,7 +37,7 @@ def extract() -> Tuple[Optional[List[Dict[str, Any]]], str, FieldExtractionStatu
         f"JSON_LD Extractor: Found {len(all_parsed_json_data)} raw JSON-LD nodes."
     )
 
-    # Return the raw list.
-    # The Analyzer will place this list on the shared_context['json_ld']
+    # Return the raw list, indexed once for all consumers (see JsonLdIndex).
+    # The Analyzer will place this list on the context as its 'json_ld' result
     # AND add it to the final 'json_ld' key in the API response.
-    return all_parsed_json_data, selector, FieldExtractionStatus.JSON_LD, 200
+    return JsonLdIndex(all_parsed_json_data), selector, FieldExtractionStatus.JSON_LD, 200
@@ -0,0 +1,200 @@
+# argus/services/extractor/app/modules/json_ld/index.py
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from app.core.context import shared_context
+
+# The @type values that describe the product of a product page
+PRODUCT_TYPES = ("product", "productgroup", "individualproduct", "productmodel")
+
+
+def _types(node: Dict[str, Any]) -> List[str]:
+    node_type = node.get("@type")
+    if isinstance(node_type, str):
+        return [node_type.lower()]
+    if isinstance(node_type, list):
+        return [item.lower() for item in node_type if isinstance(item, str)]
+    return []
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+class JsonLdIndex(list):
+    """
+    The JSON-LD of a page, normalized once for every module that reads it.
+
+    The list itself holds the raw top-level nodes, exactly as the scripts
+    declared them; that is what the 'json_ld' field of the response shows.
+    On top of it:
+
+    - 'nodes': the entities in document order, with '@graph' containers and
+      nested arrays flattened into their members.
+    - 'by_id' and 'by_type': every entity with an '@id' (its fullest
+      definition) and every entity by lowercase '@type', nested ones included.
+    - 'product' and 'offers': the primary Product (the first one with offers,
+      else the first one) and its offers, followed by the offers of the other
+      nodes in document order. '@id' references are resolved.
+    - values(key): the resolved values of a key over 'nodes', the primary
+      Product first; computed once per key.
+    """
+
+    __slots__ = ("nodes", "product", "offers", "_top_types", "_by_id", "_by_type", "_values")
+
+    def __init__(self, raw_nodes: Iterable[Any] = ()):
+        super().__init__(raw_nodes)
+        self.nodes: List[Dict[str, Any]] = []
+        # The full index is built on first use: flat pages without references never need it
+        self._by_id: Optional[Dict[str, Dict[str, Any]]] = None
+        self._by_type: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._values: Dict[str, List[Tuple[Dict[str, Any], Any]]] = {}
+
+        for item in self:
+            self._flatten(item)
+        self._top_types: Dict[str, List[Dict[str, Any]]] = {}
+        for node in self.nodes:
+            for node_type in _types(node):
+                self._top_types.setdefault(node_type, []).append(node)
+        self.product: Optional[Dict[str, Any]] = self._find_product()
+        self.offers: List[Dict[str, Any]] = self._collect_offers()
+
+    @classmethod
+    def of(cls, json_ld: Any) -> Optional["JsonLdIndex"]:
+        """The index of a 'json_ld' result: as is, built from a raw list, or None."""
+        if isinstance(json_ld, JsonLdIndex):
+            return json_ld
+        if isinstance(json_ld, list):
+            return cls(json_ld)
+        return None
+
+    def _flatten(self, item: Any):
+        if isinstance(item, list):
+            for member in item:
+                self._flatten(member)
+        elif isinstance(item, dict):
+            graph = item.get("@graph")
+            if graph is None:
+                self.nodes.append(item)
+                return
+            # A container that is an entity of its own stays one
+            if "@type" in item:
+                self.nodes.append(item)
+            self._flatten(graph)
+
+    def _build_index(self):
+        """Indexes every entity, nested ones included, by '@id' and by '@type'."""
+        by_id: Dict[str, Dict[str, Any]] = {}
+        by_type: Dict[str, List[Dict[str, Any]]] = {}
+        # Decoded JSON is a tree, so no entity is visited twice
+        stack: List[Any] = list(reversed(self.nodes))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(item for item in reversed(node) if isinstance(item, (dict, list)))
+                continue
+            node_id = node.get("@id")
+            if isinstance(node_id, str) and len(node) > 1:
+                known = by_id.get(node_id)
+                if known is None or len(node) > len(known):
+                    by_id[node_id] = node
+            for node_type in _types(node):
+                by_type.setdefault(node_type, []).append(node)
+            children = [
+                value
+                for key, value in node.items()
+                if isinstance(value, (dict, list)) and key != "@context"
+            ]
+            stack.extend(reversed(children))
+        self._by_id, self._by_type = by_id, by_type
+
+    @property
+    def by_id(self) -> Dict[str, Dict[str, Any]]:
+        if self._by_id is None:
+            self._build_index()
+        return self._by_id
+
+    @property
+    def by_type(self) -> Dict[str, List[Dict[str, Any]]]:
+        if self._by_type is None:
+            self._build_index()
+        return self._by_type
+
+    def resolve(self, value: Any) -> Any:
+        """Replaces an '@id' reference (or a list of them) by the referenced entity."""
+        if isinstance(value, list):
+            return [self.resolve(item) for item in value]
+        if isinstance(value, dict):
+            node_id = value.get("@id")
+            if isinstance(node_id, str) and set(value) <= {"@id", "@type"}:
+                return self.by_id.get(node_id, value)
+        return value
+
+    def of_type(self, *node_types: str) -> List[Dict[str, Any]]:
+        """
+        The entities of the given types (lowercase): the top-level ones, or the
+        nested ones (e.g. a WebPage's mainEntity) when there are none at the top.
+        """
+        nodes = [node for node_type in node_types for node in self._top_types.get(node_type, [])]
+        if nodes:
+            return nodes
+        return [node for node_type in node_types for node in self.by_type.get(node_type, [])]
+
+    def first(self, node_type: str) -> Optional[Dict[str, Any]]:
+        """The first entity of a type (case-insensitive), or None."""
+        nodes = self.of_type(node_type.lower())
+        return nodes[0] if nodes else None
+
+    def _find_product(self) -> Optional[Dict[str, Any]]:
+        products = self.of_type(*PRODUCT_TYPES)
+        for product in products:
+            if product.get("offers"):
+                return product
+        return products[0] if products else None
+
+    def offers_of(self, node: Dict[str, Any], _seen: Optional[set] = None) -> List[Dict[str, Any]]:
+        """The offers of a node, with references resolved (an AggregateOffer before its offers)."""
+        seen = _seen if _seen is not None else {id(node)}
+        offers: List[Dict[str, Any]] = []
+        for offer in _as_list(self.resolve(node.get("offers"))):
+            offer = self.resolve(offer)
+            if isinstance(offer, dict) and id(offer) not in seen:
+                seen.add(id(offer))
+                offers.append(offer)
+                if "offers" in offer:
+                    offers.extend(self.offers_of(offer, seen))
+        return offers
+
+    def _owners(self) -> List[Dict[str, Any]]:
+        """The nodes in the order consumers read them: the primary Product first."""
+        owners = [self.product] if self.product is not None else []
+        return owners + [node for node in self.nodes if node is not self.product]
+
+    def _collect_offers(self) -> List[Dict[str, Any]]:
+        offers: List[Dict[str, Any]] = []
+        seen = set()
+        for owner in self._owners():
+            for offer in self.offers_of(owner):
+                if id(offer) not in seen:
+                    seen.add(id(offer))
+                    offers.append(offer)
+        return offers
+
+    def values(self, key: str) -> List[Tuple[Dict[str, Any], Any]]:
+        """(node, resolved value) for every node that has the key, the primary Product first."""
+        values = self._values.get(key)
+        if values is None:
+            values = [
+                (node, self.resolve(node[key]))
+                for node in self._owners()
+                if node.get(key) is not None
+            ]
+            self._values[key] = values
+        return values
+
+
+def get_json_ld_index() -> Optional[JsonLdIndex]:
+    """The JSON-LD index of the current page, or None if it has no JSON-LD."""
+    context = shared_context.current()
+    return JsonLdIndex.of(context.json_ld) if context is not None else None
@@ -1,19 +1,112 @@
 # argus/services/extractor/app/modules/json_ld/utils.py
 
+import html
 import json
 import re
-from bs4 import BeautifulSoup
 from typing import Dict, Any, Optional, List
 from loguru import logger
-
-
-def parse_json_ld_scripts(soup: BeautifulSoup) -> List[Dict[str, Any]]:
+from app.core.dom import DomNode
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library decoder is used without it
+    orjson = None
+
+# Wrappers that CMSs put around the JSON inside the script tag
+_WRAPPER_START = re.compile(r"^\s*(?:<!--|(?://\s*)?<!\[CDATA\[)\s*")
+_WRAPPER_END = re.compile(r"\s*(?:-->|(?://\s*)?\]\]>)?\s*;?\s*$")
+_DECODER = json.JSONDecoder(strict=False)
+
+
+def _strip_commas_and_comments(text: str) -> str:
+    """Drops trailing commas and // or /* */ comments outside of strings."""
+    output: List[str] = []
+    index, length = 0, len(text)
+    in_string = False
+    while index < length:
+        char = text[index]
+        if in_string:
+            output.append(char)
+            if char == "\\":
+                output.append(text[index + 1:index + 2])
+                index += 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+            output.append(char)
+        elif text.startswith("//", index):
+            newline = text.find("\n", index)
+            index = length if newline == -1 else newline
+            continue
+        elif text.startswith("/*", index):
+            end = text.find("*/", index + 2)
+            index = length if end == -1 else end + 2
+            continue
+        elif char == ",":
+            following = index + 1
+            while following < length and text[following].isspace():
+                following += 1
+            if following < length and text[following] in "}]":
+                index += 1
+                continue
+            output.append(char)
+        else:
+            output.append(char)
+        index += 1
+    return "".join(output)
+
+
+def _decode_values(text: str) -> Any:
+    """Decodes one JSON value, or several concatenated ones (returned as a list)."""
+    values: List[Any] = []
+    index, length = 0, len(text)
+    while index < length:
+        value, index = _DECODER.raw_decode(text, index)
+        values.append(value)
+        while index < length and (text[index].isspace() or text[index] in ",;"):
+            index += 1
+    if not values:
+        raise ValueError("No JSON value found.")
+    return values[0] if len(values) == 1 else values
+
+
+def decode_json_ld(text: str) -> Any:
+    """
+    Decodes the content of a JSON-LD script. Valid JSON takes the fast path
+    (orjson when it is installed). Otherwise the common defects are repaired
+    before giving up: HTML comment or CDATA wrappers, a trailing semicolon,
+    entity-escaped quotes, raw control characters in strings, trailing commas,
+    JavaScript comments and several objects in one script.
+    Raises ValueError when the content cannot be recovered.
+    """
+    # orjson only accepts exact str instances, not bs4's NavigableString
+    text = str(text)
+    try:
+        return orjson.loads(text) if orjson is not None else json.loads(text)
+    except ValueError:
+        pass
+
+    repaired = _WRAPPER_END.sub("", _WRAPPER_START.sub("", text, count=1), count=1).strip()
+    if "&quot;" in repaired and '"' not in repaired:
+        repaired = html.unescape(repaired)
+    try:
+        return _decode_values(repaired)
+    except ValueError:
+        pass
+    # A leading comment leaves whitespace that raw_decode does not skip
+    value = _decode_values(_strip_commas_and_comments(repaired).strip())
+    logger.debug("JSON_LD Utils: Recovered a malformed JSON-LD script.")
+    return value
+
+
+def parse_json_ld_scripts(dom: DomNode) -> List[Dict[str, Any]]:
     """
     Finds and parses all JSON-LD scripts on the page.
     Returns a list of all parsed dictionaries.
     """
     all_parsed_json_data: List[Dict[str, Any]] = []
-    json_ld_scripts = soup.find_all("script", type="application/ld+json")
+    json_ld_scripts = dom.find_all("script", type="application/ld+json")
 
     if not json_ld_scripts:
         logger.debug("JSON_LD Utils: No JSON-LD scripts found.")
@@ -24,13 +117,13 @@ def parse_json_ld_scripts(soup: BeautifulSoup) -> List[Dict[str, Any]]:
         json_string_content: Optional[str] = None
         try:
             json_string_content = script.string
-            if json_string_content:
-                json_content = json.loads(json_string_content)
+            if json_string_content and json_string_content.strip():
+                json_content = decode_json_ld(json_string_content)
                 if isinstance(json_content, list):
                     all_parsed_json_data.extend(json_content)
                 elif isinstance(json_content, dict):
                     all_parsed_json_data.append(json_content)
-        except (json.JSONDecodeError, TypeError) as e:
+        except (ValueError, TypeError) as e:
             logger.warning(f"JSON_LD Utils: Error parsing JSON-LD script: {e}")
 
     return all_parsed_json_data
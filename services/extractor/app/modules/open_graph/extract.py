@@ -8,6 +8,7 @@ from app.core.types import FieldExtractionStatus
 from .utils import find_og_tags
 
 REQUIRES = []
+REQUIRES_VIEWS = ["dom"]
 FIELD_TYPE = Optional[Dict[str, Any]]
 
 
@@ -19,15 +20,15 @@ def extract() -> Tuple[Optional[Dict[str, Any]], str, FieldExtractionStatus, int
     'title', 'image') will depend on this module and consume this
     raw dictionary from the shared_context.
     """
-    raw_soup = shared_context.get("raw_soup")
+    dom = shared_context.current().dom
     selector_used = "meta[property^='og:']"
 
-    if not raw_soup:
-        logger.warning("Open Graph Extractor: No raw_soup found in context.")
+    if not dom:
+        logger.warning("Open Graph Extractor: No DOM found in context.")
         return None, selector_used, FieldExtractionStatus.NOT_FOUND, 0
 
     # Call the utility function to find all tags
-    og_tags = find_og_tags(raw_soup)
+    og_tags = find_og_tags(dom)
 
     if not og_tags:
         logger.info("Open Graph Extractor: No Open Graph tags found.")
@@ -36,6 +37,6 @@ def extract() -> Tuple[Optional[Dict[str, Any]], str, FieldExtractionStatus, int
     logger.info(f"Open Graph Extractor: Found {len(og_tags)} raw OG tags.")
 
     # Return the raw dictionary.
-    # The Analyzer will place this dict on the shared_context['open_graph']
+    # The Analyzer will place this dict on the context as its 'open_graph' result
     # AND add it to the final 'open_graph' key in the API response.
     return og_tags, selector_used, FieldExtractionStatus.OPEN_GRAPH, 200
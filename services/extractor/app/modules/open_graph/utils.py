@@ -1,16 +1,16 @@
 # argus/services/extractor/app/modules/open_graph/utils.py
 
 from typing import Dict, Any
-from bs4 import BeautifulSoup
+from app.core.dom import DomNode
 
 
-def find_og_tags(soup: BeautifulSoup) -> Dict[str, Any]:
+def find_og_tags(dom: DomNode) -> Dict[str, Any]:
     """
     Finds all Open Graph meta-tags and returns them as a dictionary.
     The 'og:' prefix is removed from the keys.
     """
     og_tags: Dict[str, Any] = {}
-    for tag in soup.find_all("meta", property=True):
+    for tag in dom.find_all("meta", property=True):
         prop = tag.get("property")
         content = tag.get("content")
         if prop and content and prop.startswith("og:"):
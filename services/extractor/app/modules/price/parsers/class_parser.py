@@ -2,19 +2,21 @@
 
 import re
 from typing import Optional, Tuple, Set
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.price.utils import clean_price_text
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
-def _reconstruct_price_from_fragments(tag: BeautifulSoup) -> Optional[str]:
+def _reconstruct_price_from_fragments(tag: DomNode) -> Optional[str]:
     """
     Finds all text fragments within a tag, validates them, and combines them
     into a correct decimal number. Only accepts digits and currency symbols.
     """
     # Find all text nodes, including in nested tags
-    all_strings = tag.find_all(string=True)
+    all_strings = [text for text, _ in tag.text_nodes()]
 
     number_parts = []
     for s in all_strings:
@@ -50,15 +52,16 @@ def _reconstruct_price_from_fragments(tag: BeautifulSoup) -> Optional[str]:
         return number_parts[0]
 
 
+@timed_parser
 def parse_price_classes(
-    soup: BeautifulSoup, processed_elements: Set[Tag]
+    dom: DomNode, processed_elements: Set[DomNode]
 ) -> Tuple[Optional[float], str, FieldExtractionStatus, int]:
     """
     Extracts the price based on relevant CSS classes and IDs,
     with special logic for split prices.
     """
-    price_tags = soup.find_all(
-        re.compile(r"div|span|p|b|section"), class_=re.compile(r"price", re.IGNORECASE)
+    price_tags = current_memo().find_all(
+        dom, re.compile(r"div|span|p|b|section"), class_=re.compile(r"price", re.IGNORECASE)
     )
 
     for tag in price_tags:
@@ -70,7 +73,7 @@ def parse_price_classes(
 
         # If that fails, fall back to the old, simple method
         if text is None:
-            text = tag.get_text(strip=True)
+            text = current_memo().text(tag)
 
         if not text:
             continue
@@ -2,20 +2,23 @@
 
 import re
 from typing import Optional, Tuple, Set
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.price.utils import clean_price_text
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_itemprop(
-    soup: BeautifulSoup, processed_elements: Set[Tag]
+    dom: DomNode, processed_elements: Set[DomNode]
 ) -> Tuple[Optional[float], str, FieldExtractionStatus, int]:
     """
     Extracts the price using itemprop="price" microdata.
     """
     # Priority 1a: meta tag
-    price_meta = soup.find("meta", itemprop="price")
+    price_meta = dom.find("meta", itemprop="price")
     if price_meta and price_meta.get("content"):
         price_val = clean_price_text(price_meta["content"].strip())
         if price_val is not None:
@@ -31,9 +34,9 @@ def parse_itemprop(
             )
 
     # Priority 1b: other tags
-    price_tag = soup.find(re.compile(r"span|div|b|p"), itemprop="price")
-    if price_tag and price_tag.get_text(strip=True):
-        price_val = clean_price_text(price_tag.get_text(strip=True))
+    price_tag = dom.find(re.compile(r"span|div|b|p"), itemprop="price")
+    if price_tag and current_memo().text(price_tag):
+        price_val = clean_price_text(current_memo().text(price_tag))
         if price_val is not None:
             logger.debug(
                 f"Itemprop Parser: Found via span/div[itemprop='price'] (text): {price_val}"
@@ -5,15 +5,17 @@ from loguru import logger
 from app.core.models import FieldExtractionStatus
 from app.core.context import shared_context
 from app.modules.price.utils import clean_price_text
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_open_graph() -> Tuple[Optional[float], str, FieldExtractionStatus, int]:
     """
     Extracts price from the 'open_graph' data in shared_context.
     """
     logger.debug("Open Graph Parser: Searching for price in OG data.")
 
-    og_data = shared_context.get("open_graph")
+    og_data = shared_context.current().open_graph
     if not isinstance(og_data, dict):
         return None, "open_graph_parser", FieldExtractionStatus.NOT_FOUND, 0
 
@@ -2,21 +2,24 @@
 
 import re
 from typing import Optional, Tuple, Set
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.price.utils import clean_price_text
 from app.utils.pattern_manager import pattern_manager
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser(low_priority=True)
 def parse_regex_in_body(
-    soup: BeautifulSoup,
-    processed_elements: Set[Tag],
+    dom: DomNode,
+    processed_elements: Set[DomNode],
 ) -> Tuple[Optional[float], str, FieldExtractionStatus, int]:
     """
     Searches for price formats with regex in the entire body of the page.
     """
-    body_text = soup.body.get_text(strip=True) if soup.body else ""
+    body_text = current_memo().body_text(dom)
     if len(body_text) > 10000:
         body_text = body_text[:10000]
 
@@ -2,20 +2,24 @@
 
 import re
 from typing import Optional, Tuple, Set
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.price.utils import clean_price_text
 from app.utils.pattern_manager import pattern_manager
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_regex_in_sections(
-    soup: BeautifulSoup, processed_elements: Set[Tag]
+    dom: DomNode, processed_elements: Set[DomNode]
 ) -> Tuple[Optional[float], str, FieldExtractionStatus, int]:
     """
     Searches for price formats with regex in specific sections of the page.
     """
-    potential_price_sections = soup.find_all(
+    potential_price_sections = current_memo().find_all(
+        dom,
         ["div", "span", "section"],
         # Use dynamic regex for classes
         class_=pattern_manager.get_compiled_regex("price_section_class_regex"),
@@ -14,6 +14,7 @@ from .parsers.fallback_parser import parse_generic_fallback
 
 FIELD_TYPE = Optional[str]
 REQUIRES = ["json_ld", "open_graph"]
+REQUIRES_VIEWS = ["dom"]
 
 
 def extract() -> Tuple[Any, str, FieldExtractionStatus, int]:
@@ -21,13 +22,13 @@ def extract() -> Tuple[Any, str, FieldExtractionStatus, int]:
     The main extractor function that extracts the title by calling a series of parsers,
     collects all results, and returns the one with the highest score.
     """
-    soup_to_use = shared_context.get("raw_soup")
-    processed_elements = shared_context.get("processed_elements", set())
+    dom = shared_context.current().dom
+    processed_elements = shared_context.current().processed_elements
 
     logger.info("Title Extractor (Main): Starting product title extraction.")
 
-    if not soup_to_use:
-        logger.warning("Title Extractor: No valid BeautifulSoup objects to work with.")
+    if not dom:
+        logger.warning("Title Extractor: No DOM to work with.")
         return None, "NOT_FOUND", FieldExtractionStatus.NOT_FOUND, 0
 
     # Step 1: Initialize a list to store all found results.
@@ -46,23 +47,23 @@ def extract() -> Tuple[Any, str, FieldExtractionStatus, int]:
         results.append((title, selector, status, score))
 
     # Parser 3: H1 tags
-    title, selector, status, score = parse_h1_tags(soup_to_use, processed_elements)
+    title, selector, status, score = parse_h1_tags(dom, processed_elements)
     if title:
         results.append((title, selector, status, score))
 
     # Parser 4: <title> tag
-    title, selector, status, score = parse_title_tag(soup_to_use, processed_elements)
+    title, selector, status, score = parse_title_tag(dom, processed_elements)
     if title:
         results.append((title, selector, status, score))
 
     # Parser 5: Meta tags (itemprop='name')
-    title, selector, status, score = parse_meta_tags(soup_to_use, processed_elements)
+    title, selector, status, score = parse_meta_tags(dom, processed_elements)
     if title:
         results.append((title, selector, status, score))
 
     # Parser 6: Generic fallback
     title, selector, status, score = parse_generic_fallback(
-        soup_to_use, processed_elements
+        dom, processed_elements
     )
     if title:
         results.append((title, selector, status, score))
@@ -1,19 +1,22 @@
 # argus/services/extractor/app/modules/title/parsers/fallback_parser.py
 
 from typing import Optional, Tuple, Set
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.title.utils import clean_title
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser(low_priority=True)
 def parse_generic_fallback(
-    soup: BeautifulSoup, processed_elements: Set[Tag]
+    dom: DomNode, processed_elements: Set[DomNode]
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
     """
     Searches for the title in general elements as a last resort.
     """
-    potential_title_elements = soup.select(
+    potential_title_elements = dom.select(
         'span[id*="title"], div[id*="title"], strong[id*="title"], h2.title, p.title'
     )
 
@@ -21,7 +24,7 @@ def parse_generic_fallback(
         if elem in processed_elements:
             continue
 
-        extracted_title = elem.get_text(strip=True)
+        extracted_title = current_memo().text(elem)
         cleaned_title = clean_title(extracted_title)
 
         if cleaned_title and 10 < len(cleaned_title) < 200:
@@ -2,22 +2,26 @@
 
 import re
 from typing import Optional, Tuple, Set
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.title.utils import clean_title
+from app.core.memo import current_memo
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_h1_tags(
-    soup: BeautifulSoup, processed_elements: Set[Tag]
+    dom: DomNode, processed_elements: Set[DomNode]
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
     """
     Extracts the title from <h1> tags, including specific patterns and a generic fallback.
     """
+    memo = current_memo()
     # Priority 1a: Specific Amazon H1 tag
-    amazon_title_h1 = soup.select_one("#productTitle")
+    amazon_title_h1 = dom.select_one("#productTitle")
     if amazon_title_h1:
-        extracted_title = amazon_title_h1.get_text(strip=True)
+        extracted_title = memo.text(amazon_title_h1)
         cleaned_title = clean_title(extracted_title)
         if cleaned_title:
             logger.debug(f"H1 Parser: Found via Amazon #productTitle: {cleaned_title}")
@@ -30,14 +34,17 @@ def parse_h1_tags(
             )
 
     # Priority 1b: General H1 tags with specific attributes
-    h1_with_attrs = soup.find("h1", itemprop="name") or soup.find(
+    h1_candidates = memo.find_all(dom, "h1", itemprop="name", limit=1) or memo.find_all(
+        dom,
         "h1",
         class_=re.compile(
             r"product-title|item-name|title|product__title", re.IGNORECASE
         ),
+        limit=1,
     )
+    h1_with_attrs = h1_candidates[0] if h1_candidates else None
     if h1_with_attrs and h1_with_attrs not in processed_elements:
-        extracted_title = h1_with_attrs.get_text(strip=True)
+        extracted_title = memo.text(h1_with_attrs)
         cleaned_title = clean_title(extracted_title)
         if cleaned_title and len(cleaned_title) > 5:
             logger.debug(
@@ -54,14 +61,14 @@ def parse_h1_tags(
     # Priority 1c: Generic <h1> tag fallback
     all_h1s = [
         h
-        for h in soup.find_all("h1")
-        if h not in processed_elements and h.get_text(strip=True)
+        for h in memo.h1s(dom)
+        if h not in processed_elements and memo.text(h)
     ]
 
     if len(all_h1s) == 1:
         # High confidence if there's only one H1 on the page
         h1_tag = all_h1s[0]
-        cleaned_title = clean_title(h1_tag.get_text(strip=True))
+        cleaned_title = clean_title(memo.text(h1_tag))
         if cleaned_title:
             logger.debug(f"H1 Parser: Found single, unambiguous H1: {cleaned_title}")
             processed_elements.add(h1_tag)
@@ -75,7 +82,7 @@ def parse_h1_tags(
     elif len(all_h1s) > 1:
         # Lower confidence if there are multiple H1s; we take the first one.
         h1_tag = all_h1s[0]
-        cleaned_title = clean_title(h1_tag.get_text(strip=True))
+        cleaned_title = clean_title(memo.text(h1_tag))
         if cleaned_title:
             logger.debug(
                 f"H1 Parser: Found multiple H1s, taking first one: {cleaned_title}"
@@ -3,27 +3,24 @@
 from typing import Optional, Tuple
 from loguru import logger
 from app.core.models import FieldExtractionStatus
-from app.core.context import shared_context
+from app.modules.json_ld.index import get_json_ld_index
 from app.modules.title.utils import clean_title
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_json_ld() -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
     """
     Extracts the title (name) from the 'json_ld' data in shared_context.
     """
     logger.debug("JSON-LD Parser: Searching for title (name) in JSON-LD data.")
 
-    json_ld_data = shared_context.get("json_ld")
-    if not isinstance(json_ld_data, list):
+    json_ld_index = get_json_ld_index()
+    if json_ld_index is None:
         return None, "json_ld_parser", FieldExtractionStatus.NOT_FOUND, 0
 
-    for node in json_ld_data:
-        if not isinstance(node, dict):
-            continue
-
-        # The 'name' key is used for title in Product, Offer, etc.
-        title_text = node.get("name")
-
+    # The 'name' key is used for title in Product, Offer, etc.
+    for _, title_text in json_ld_index.values("name"):
         if isinstance(title_text, str):
             cleaned_title = clean_title(title_text)
             if cleaned_title and len(cleaned_title) > 5:
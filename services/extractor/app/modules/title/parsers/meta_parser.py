@@ -1,21 +1,23 @@
 # argus/services/extractor/app/modules/title/parsers/meta_parser.py
 
 from typing import Optional, Tuple, Set
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
 from app.core.models import FieldExtractionStatus
+from app.core.dom import DomNode
 from app.modules.title.utils import clean_title
+from app.core.timings import timed_parser
 
 
+@timed_parser
 def parse_meta_tags(
-    soup: BeautifulSoup, processed_elements: Set[Tag]
+    dom: DomNode, processed_elements: Set[DomNode]
 ) -> Tuple[Optional[str], str, FieldExtractionStatus, int]:
     """
     Extracts the title from Schema.org microdata meta-tags.
     (Open Graph logic is now handled by open_graph_parser.py)
     """
     # Look for Schema.org microdata tag
-    schema_name = soup.find("meta", itemprop="name")
+    schema_name = dom.find("meta", itemprop="name")
     if (
         schema_name
         and schema_name.get("content")
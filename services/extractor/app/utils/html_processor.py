@@ -1,10 +1,27 @@
 # argus/services/extractor/app/utils/html_processor.py
 
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup, CData, Comment, Tag, NavigableString, PageElement
 from loguru import logger
-from app.config import settings
+from typing import FrozenSet, List, Set
+from app.utils.noise_matcher import get_noise_matcher
 
-import re
+# Tags that never contain product data and are always removed
+NOISE_TAGS = [
+    "script",
+    "style",
+    "noscript",
+    "link",
+    "template",
+    "svg",
+    "iframe",
+    "button",
+]
+
+# Tags that are kept even though they have no text content
+PRESERVED_EMPTY_TAGS = ["img", "br", "hr", "input", "meta"]
+
+# The strings get_text() reads from tags without a string container of their own
+_MAIN_TEXT_TYPES = (NavigableString, CData)
 
 
 def clean_html_for_extraction(raw_html_content: str) -> BeautifulSoup:
@@ -16,77 +33,195 @@ def clean_html_for_extraction(raw_html_content: str) -> BeautifulSoup:
         logger.warning("HTML Processor: Received empty HTML content.")
         return BeautifulSoup("", "lxml")
 
-    soup = BeautifulSoup(raw_html_content, "lxml")
+    return clean_soup_for_extraction(BeautifulSoup(raw_html_content, "lxml"))
 
-    logger.info("HTML Processor: Starting HTML cleanup.")
 
-    # Step 1: Remove known noise tags
-    for tag_name in [
-        "script",
-        "style",
-        "noscript",
-        "link",
-        "template",
-        "svg",
-        "iframe",
-        "button",
-    ]:
-        for element in soup.find_all(tag_name):
-            element.decompose()
+def clean_soup_for_extraction(soup: BeautifulSoup) -> BeautifulSoup:
+    """
+    Removes noise from an already parsed document, in place.
+    Use this when the page has been parsed before, to avoid parsing it twice.
 
-    # Step 2: Remove HTML comments
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        comment.extract()
-    logger.debug("HTML Processor: All HTML comments removed.")
-
-    # Step 3: Remove noise sections based on selectors, including the function selector
-    for selector in settings.html_preprocessing.noise_selectors:
-        try:
-            if isinstance(selector, str):
-                for element in soup.select(selector):
-                    logger.debug(
-                        f"HTML Processor: Removing element by selector '{selector}'."
-                    )
-                    element.decompose()
-            elif callable(selector):
-                # If it's a function, call it to find the elements
-                for element in soup.find_all(selector):
-                    logger.debug(
-                        f"HTML Processor: Removing element by function '{selector}'."
-                    )
-                    element.decompose()
-            else:
-                logger.warning(
-                    f"HTML Processor: Skipping invalid selector type: {type(selector)}."
-                )
-        except Exception as e:
-            logger.error(
-                f"HTML Processor: Error during removal with selector '{selector}': {e}",
-                exc_info=True,
-            )
+    One bottom-up traversal decides what to remove: noise tags and elements
+    matching the noise selectors (whole subtrees), comments, tags in the body
+    without visible text, and tags left without any content. Whether a tag has
+    text is accounted from its children, so nested markup is not re-scanned.
+    Selectors are matched (see NoiseMatcher) before anything is removed, which
+    is the same as matching them one after the other for selectors that do not
+    depend on siblings or position (tag, id, class and attribute selectors).
+    """
+    logger.info("HTML Processor: Starting HTML cleanup.")
 
-    # Step 4: Normalize whitespace and remove empty tags
-    if soup.body:
-        # Loop through the tags in reverse order, from inside out
-        for tag in soup.body.find_all(True, reverse=False):
-            if tag.name in ["img", "br", "hr", "input", "meta"]:
-                continue
+    is_noise = get_noise_matcher().bind(soup)
+    noise_tags = set(NOISE_TAGS)
+    preserved_tags = set(PRESERVED_EMPTY_TAGS)
+    no_types: FrozenSet[type] = frozenset()
+    body = None
+    # Elements to remove; never nested, as a removed tag drops its entries
+    doomed: List[PageElement] = []
 
-            # Use get_text() to get all nested text
-            raw_text = tag.get_text(strip=True)
+    # Per open tag: [tag, children, in body, types of its non-blank strings,
+    #                number of children it keeps, len(doomed) when it was entered]
+    stack: List[list] = [[soup, iter(soup.contents), False, no_types, 0, 0]]
+    while stack:
+        frame = stack[-1]
+        child = next(frame[1], None)
 
-            # Remove all whitespace (spaces, newlines, tabs) and check if anything remains
-            if not re.sub(r"\s+", "", raw_text):
-                # The tag is empty, remove it unless it's an excluded tag
-                tag.decompose()
+        if child is None:
+            stack.pop()
+            if not stack:
+                break
+            tag, _, in_body, text_types, kept_children, entered_at = frame
+            parent = stack[-1]
+            removed = False
+            if tag.name not in preserved_tags:
+                if in_body and not _has_text_of_types(tag, text_types):
+                    # Empty in the body: removed with everything in it
+                    del doomed[entered_at:]
+                    doomed.append(tag)
+                    removed = True
+                elif not kept_children:
+                    # Left without content; its parent still counts it as content
+                    del doomed[entered_at:]
+                    doomed.append(tag)
+            if not removed:
+                parent[4] += 1
+            # The parent's text is judged on its own subtree, removed tags included
+            if not text_types <= parent[3]:
+                parent[3] = parent[3] | text_types
+            continue
 
-    for tag in soup.find_all():
-        if (
-            not tag.contents
-            and not tag.get_text(strip=True)
-            and tag.name not in ["img", "br", "hr", "meta", "input"]
-        ):
-            tag.decompose()
+        if isinstance(child, Tag):
+            if child.name in noise_tags or is_noise(child):
+                doomed.append(child)
+                continue
+            tag = frame[0]
+            children_in_body = frame[2] or (tag is body)
+            if body is None and child.name == "body":
+                body = child
+            stack.append(
+                [child, iter(child.contents), children_in_body, no_types, 0, len(doomed)]
+            )
+        elif isinstance(child, Comment):
+            doomed.append(child)
+        else:
+            frame[4] += 1
+            if child.strip():
+                string_type = type(child)
+                if string_type not in frame[3]:
+                    frame[3] = frame[3] | {string_type}
+
+    for element in doomed:
+        if isinstance(element, Tag):
+            element.decompose()
+        else:
+            element.extract()
+    logger.debug(f"HTML Processor: Removed {len(doomed)} elements and comments.")
 
     logger.info("HTML Processor: Cleanup complete.")
     return soup
+
+
+def _has_text_of_types(tag: Tag, text_types: FrozenSet[type]) -> bool:
+    """Whether the tag's get_text(strip=True) would be non-empty, given the
+    types of the non-blank strings in its subtree."""
+    if not text_types:
+        return False
+    types = tag.interesting_string_types
+    if types is None:
+        types = _MAIN_TEXT_TYPES
+    if isinstance(types, type):
+        return types in text_types
+    return not text_types.isdisjoint(types)
+
+
+def _find_noise_elements(soup: BeautifulSoup) -> Set[int]:
+    """Returns the ids of all elements the cleaner would remove as a whole subtree."""
+    noise_tags = set(NOISE_TAGS)
+    is_noise = get_noise_matcher().bind(soup)
+    return {
+        id(element)
+        for element in soup.find_all(True)
+        if element.name in noise_tags or is_noise(element)
+    }
+
+
+def extract_clean_text(soup: BeautifulSoup) -> str:
+    """
+    Returns the text that clean_soup_for_extraction() would leave in the document,
+    without copying or modifying the tree.
+    """
+    noise_ids = _find_noise_elements(soup)
+    text_types = soup.interesting_string_types
+    body = soup.body
+
+    # Pass 1 (bottom-up): find the tags that contain visible text once noise is gone.
+    # Whitespace inside tags without such text is dropped by the cleaner.
+    tags_with_text: Set[int] = set()
+    stack: List[tuple] = [(soup, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            for child in node.contents:
+                if id(child) in tags_with_text or (
+                    type(child) in text_types and child.strip()
+                ):
+                    tags_with_text.add(id(node))
+                    break
+            continue
+        stack.append((node, True))
+        for child in node.contents:
+            if isinstance(child, Tag) and id(child) not in noise_ids:
+                stack.append((child, False))
+
+    # Pass 2 (document order): collect the strings the cleaner would keep.
+    parts: List[str] = []
+    body_tags = (
+        {id(tag) for tag in body.find_all(True)} if isinstance(body, Tag) else set()
+    )
+    stack = [iter(soup.contents)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            continue
+        if isinstance(child, Tag):
+            if id(child) in noise_ids:
+                continue
+            if (
+                id(child) in body_tags
+                and id(child) not in tags_with_text
+                and child.name not in PRESERVED_EMPTY_TAGS
+            ):
+                continue
+            stack.append(iter(child.contents))
+        elif isinstance(child, NavigableString) and type(child) in text_types:
+            parts.append(str(child))
+
+    return "".join(parts)
+
+
+def sample_visible_text(soup: BeautifulSoup, max_chars: int) -> str:
+    """
+    Returns up to 'max_chars' characters of visible text from the start of the
+    page body, skipping NOISE_TAGS. Stops walking the tree once the sample is
+    full, so the cost does not grow with the page size.
+    """
+    root = soup.body if isinstance(soup.body, Tag) else soup
+    noise_tags = set(NOISE_TAGS)
+    text_types = soup.interesting_string_types
+    parts: List[str] = []
+    length = 0
+    stack = [iter(root.contents)]
+    while stack and length < max_chars:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+        elif isinstance(child, Tag):
+            if child.name not in noise_tags:
+                stack.append(iter(child.contents))
+        elif type(child) in text_types:
+            text = child.strip()
+            if text:
+                parts.append(text)
+                length += len(text) + 1
+    return " ".join(parts)[:max_chars]
@@ -1,8 +1,9 @@
 # argus/services/extractor/app/utils/html_utils.py
 
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup, Comment, PageElement, Tag
 from loguru import logger
 from typing import List
+from app.utils.noise_matcher import get_noise_matcher
 
 
 def preprocess_html_for_extraction(
@@ -17,19 +18,29 @@ def preprocess_html_for_extraction(
 
     soup = BeautifulSoup(html_content, "lxml")
 
-    # Remove tags that cause noise
-    for selector in ["script", "style", "noscript", "meta", "link", "template"]:
-        for element in soup.find_all(selector):
-            element.decompose()
-
-    # Remove HTML comments
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        comment.extract()
+    # Remove the tags that cause noise, comments and the hidden elements
+    # (matched with the compiled selector list) in one traversal
+    noise_tags = {"script", "style", "noscript", "meta", "link", "template"}
+    is_hidden = get_noise_matcher(hidden_selectors).bind(soup)
+    doomed: List[PageElement] = []
+    stack = [iter(soup.contents)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+        elif isinstance(child, Tag):
+            if child.name in noise_tags or is_hidden(child):
+                doomed.append(child)
+            else:
+                stack.append(iter(child.contents))
+        elif isinstance(child, Comment):
+            doomed.append(child)
 
-    # Remove hidden elements based on CSS classes or attributes
-    for selector in hidden_selectors:
-        for element in soup.select(selector):
+    for element in doomed:
+        if isinstance(element, Tag):
             element.decompose()
+        else:
+            element.extract()
 
     logger.debug("HTML Utils: HTML successfully preprocessed for extraction.")
     return soup
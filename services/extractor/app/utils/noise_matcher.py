@@ -0,0 +1,230 @@
+# argus/services/extractor/app/utils/noise_matcher.py
+
+import functools
+import re
+import string
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+from loguru import logger
+from app.config import settings
+
+# CSS matches tag and attribute names case-insensitively in HTML, for ASCII only
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+_CLASS_TOKEN = re.compile(r"[^ \t\r\n\f]+")
+
+
+def _attribute(tag: Tag, name: str, default: Any = None) -> Any:
+    """The value of an attribute, looked up case-insensitively like soupsieve does."""
+    for key, value in tag.attrs.items():
+        if key.translate(_ASCII_LOWER) == name:
+            return "" if value is None else value
+    return default
+
+
+def _is_simple(selector: Any) -> bool:
+    """Whether a parsed soupsieve selector is one compound of tag, ids, classes and attributes."""
+    return (
+        not selector.nth
+        and not selector.selectors
+        and not selector.relation
+        and selector.rel_type is None
+        and not selector.contains
+        and not selector.lang
+        and not selector.flags
+        and (selector.tag is None or selector.tag.prefix is None)
+        and all(not attribute.prefix for attribute in selector.attributes)
+    )
+
+
+class _Compound:
+    """One compound selector such as 'div.card#main[role="banner"]'."""
+
+    __slots__ = ("tag_name", "ids", "classes", "attributes")
+
+    def __init__(self, selector: Any):
+        name = selector.tag.name if selector.tag is not None else None
+        self.tag_name = None if name in (None, "*") else name.translate(_ASCII_LOWER)
+        self.ids: Tuple[str, ...] = selector.ids
+        self.classes: Tuple[str, ...] = selector.classes
+        # (lowercase name, compiled value pattern or None, inverse)
+        self.attributes = tuple(
+            (attribute.attribute.translate(_ASCII_LOWER), attribute.pattern, attribute.inverse)
+            for attribute in selector.attributes
+        )
+
+    def matches(self, tag: Tag, name: str, element_id: Any, classes: Sequence[str]) -> bool:
+        if self.tag_name is not None and self.tag_name != name:
+            return False
+        for wanted_id in self.ids:
+            if wanted_id != element_id:
+                return False
+        for wanted_class in self.classes:
+            if wanted_class not in classes:
+                return False
+        for attribute_name, pattern, inverse in self.attributes:
+            value = _attribute(tag, attribute_name)
+            if value is None:
+                if inverse:
+                    continue
+                return False
+            if pattern is None:
+                continue
+            if not isinstance(value, str):
+                value = " ".join(value)
+            if pattern.match(value) is None:
+                return False
+        return True
+
+
+class NoiseMatcher:
+    """
+    Matches elements against a list of noise selectors in one traversal.
+
+    The selectors are parsed by soupsieve, so the grammar is exactly that of
+    soup.select. Compound selectors of a tag, ids, classes and attributes (the
+    usual noise selectors) go into dispatch tables keyed by id, class, tag name
+    or attribute name, so an element is only checked against the selectors
+    that can match it. Selectors with combinators or pseudo-classes are
+    combined and matched by soupsieve in a single select per document.
+    Functions are called with each tag, like soup.find_all(function).
+    """
+
+    def __init__(self, selectors: Sequence[Any]):
+        self.selectors = tuple(selectors)
+        self._by_id: Dict[str, List[_Compound]] = {}
+        self._by_class: Dict[str, List[_Compound]] = {}
+        self._by_tag: Dict[str, List[_Compound]] = {}
+        self._by_attribute: Dict[str, List[_Compound]] = {}
+        self._unindexed: List[_Compound] = []
+        self._functions: List[Callable[[Tag], Any]] = []
+        css_selectors: List[str] = []
+        fallback_selectors: List[str] = []
+
+        for selector in self.selectors:
+            if isinstance(selector, str):
+                try:
+                    compiled = soupsieve.compile(selector)
+                except Exception as e:
+                    logger.error(
+                        f"Noise Matcher: Skipping invalid selector '{selector}': {e}"
+                    )
+                    continue
+                css_selectors.append(selector)
+                parsed = compiled.selectors
+                if parsed.is_not or parsed.is_html or not all(map(_is_simple, parsed)):
+                    fallback_selectors.append(selector)
+                    continue
+                for compound_selector in parsed:
+                    self._index(_Compound(compound_selector))
+            elif callable(selector):
+                self._functions.append(selector)
+            else:
+                logger.warning(
+                    f"Noise Matcher: Skipping invalid selector type: {type(selector)}."
+                )
+
+        self.indexed_count = len(css_selectors) - len(fallback_selectors)
+        self.fallback_selectors = fallback_selectors
+        self._fallback = (
+            soupsieve.compile(", ".join(fallback_selectors)) if fallback_selectors else None
+        )
+        # XML documents are left to soupsieve entirely (case-sensitive names)
+        self._all_css = soupsieve.compile(", ".join(css_selectors)) if css_selectors else None
+
+    def _index(self, compound: _Compound):
+        if compound.ids:
+            self._by_id.setdefault(compound.ids[0], []).append(compound)
+        elif compound.classes:
+            self._by_class.setdefault(compound.classes[0], []).append(compound)
+        elif compound.tag_name is not None:
+            self._by_tag.setdefault(compound.tag_name, []).append(compound)
+        else:
+            attribute = next(
+                (name for name, _, inverse in compound.attributes if not inverse), None
+            )
+            if attribute is not None:
+                self._by_attribute.setdefault(attribute, []).append(compound)
+            else:
+                self._unindexed.append(compound)
+
+    def matches(self, tag: Tag) -> bool:
+        """Whether the tag matches one of the compound selectors or functions."""
+        name = tag.name.translate(_ASCII_LOWER)
+        element_id = _attribute(tag, "id", "")
+        classes = _attribute(tag, "class", [])
+        if isinstance(classes, str):
+            classes = _CLASS_TOKEN.findall(classes)
+
+        candidates: List[List[_Compound]] = []
+        if self._by_id and isinstance(element_id, str) and element_id in self._by_id:
+            candidates.append(self._by_id[element_id])
+        if self._by_class:
+            for token in classes:
+                if token in self._by_class:
+                    candidates.append(self._by_class[token])
+        if name in self._by_tag:
+            candidates.append(self._by_tag[name])
+        if self._by_attribute:
+            for key in tag.attrs:
+                key = key.translate(_ASCII_LOWER)
+                if key in self._by_attribute:
+                    candidates.append(self._by_attribute[key])
+        if self._unindexed:
+            candidates.append(self._unindexed)
+
+        for compounds in candidates:
+            for compound in compounds:
+                if compound.matches(tag, name, element_id, classes):
+                    return True
+        return any(function(tag) for function in self._functions)
+
+    def bind(self, soup: BeautifulSoup) -> Callable[[Tag], bool]:
+        """
+        Returns the noise test for the tags of one document. Selectors that are
+        not indexed are matched here, with one select over the document.
+        """
+        if soup.is_xml:
+            matched = (
+                {id(element) for element in self._all_css.select(soup)}
+                if self._all_css is not None
+                else set()
+            )
+            functions = self._functions
+            return lambda tag: id(tag) in matched or any(f(tag) for f in functions)
+
+        if self._fallback is None:
+            return self.matches
+        matched = {id(element) for element in self._fallback.select(soup)}
+        return lambda tag: id(tag) in matched or self.matches(tag)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "selectors": len(self.selectors),
+            "indexed": self.indexed_count,
+            "fallback": list(self.fallback_selectors),
+            "functions": len(self._functions),
+        }
+
+
+@functools.lru_cache(maxsize=16)
+def _compile(selectors: Tuple[Any, ...]) -> NoiseMatcher:
+    matcher = NoiseMatcher(selectors)
+    logger.info(f"Noise Matcher: Compiled {matcher.describe()}")
+    return matcher
+
+
+def get_noise_matcher(selectors: Optional[Sequence[Any]] = None) -> NoiseMatcher:
+    """
+    Returns the compiled matcher of a selector list, by default the configured
+    'html_preprocessing.noise_selectors'. Matchers are compiled once per list;
+    when the configured list changes, the next call compiles the new one.
+    """
+    if selectors is None:
+        selectors = settings.html_preprocessing.noise_selectors
+    return _compile(tuple(selectors))
+
+
+def reload_noise_matchers():
+    """Drops all compiled matchers, so they are compiled again on next use."""
+    _compile.cache_clear()
@@ -1,5 +1,7 @@
 import yaml
 import re
+import json
+import hashlib
 from pathlib import Path
 from typing import Dict, Pattern, List, Any
 from loguru import logger
@@ -16,6 +18,8 @@ class PatternManager:
         self._all_patterns: Dict[str, Dict[str, Any]] = {}
         self._compiled_regex_cache: Dict[tuple, Pattern] = {}
         self._compiled_list_cache: Dict[tuple, List[str]] = {}
+        # A hash of the merged patterns; changes whenever a pattern file changes
+        self.version: str = ""
 
         self._load_and_merge(config_path, custom_config_path)
 
@@ -70,6 +74,9 @@ class PatternManager:
 
         # Perform the deep merge
         self._all_patterns = self._deep_merge_dict(base_patterns, custom_patterns)
+        self.version = hashlib.sha256(
+            json.dumps(self._all_patterns, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
         logger.info(
             f"PatternManager initialized with {len(self._all_patterns)} language(s)."
         )
@@ -79,7 +86,12 @@ class PatternManager:
         Gets the detected lang for the current request and the default fallback lang.
         Returns an ordered, unique list, e.g., ['nl', 'en'] or just ['en'].
         """
-        lang_code = shared_context.get("lang_code", default=settings.language.default)
+        context = shared_context.current()
+        lang_code = (
+            context.lang_code
+            if context is not None and context.lang_code
+            else settings.language.default
+        )
 
         # Use dict.fromkeys to get a unique, ordered list
         langs_to_check = [lang_code]
@@ -88,12 +100,47 @@ class PatternManager:
 
         return langs_to_check
 
+    @property
+    def languages(self) -> List[str]:
+        """The languages that have a pattern bundle."""
+        return list(self._all_patterns)
+
+    def warm_up(self) -> int:
+        """
+        Compiles every pattern bundle up front, for every language combined with
+        the default language (the combinations requests use). Returns the number
+        of regexes and keyword lists that were built.
+        """
+        default_lang = settings.language.default
+        compiled = 0
+        for lang in dict.fromkeys(self.languages + [default_lang]):
+            langs = list(dict.fromkeys([lang, default_lang]))
+            pattern_names = set()
+            for bundle_lang in langs:
+                pattern_names.update(self._all_patterns.get(bundle_lang, {}))
+            for pattern_name in sorted(pattern_names):
+                values = [
+                    self._all_patterns.get(bundle_lang, {}).get(pattern_name)
+                    for bundle_lang in langs
+                ]
+                if any(isinstance(value, list) for value in values):
+                    self._get_keyword_list_for(langs, pattern_name)
+                else:
+                    self._get_compiled_regex_for(langs, pattern_name)
+                compiled += 1
+        logger.info(
+            f"PatternManager: Compiled {compiled} patterns for languages {self.languages}."
+        )
+        return compiled
+
     def get_keyword_list(self, pattern_name: str) -> List[str]:
         """
         Gets a combined list of keywords for all active languages (request-specific).
         e.g., for 'availability_in_stock', returns Dutch AND English keywords.
         """
-        langs = self._get_active_languages()
+        return self._get_keyword_list_for(self._get_active_languages(), pattern_name)
+
+    def _get_keyword_list_for(self, langs: List[str], pattern_name: str) -> List[str]:
         cache_key = (tuple(sorted(langs)), pattern_name)
 
         if cache_key in self._compiled_list_cache:
@@ -120,7 +167,9 @@ class PatternManager:
         Gets a combined, compiled regex pattern for all active languages (request-specific).
         e.g., for 'brand_class_regex', returns (nl_pattern|en_pattern)
         """
-        langs = self._get_active_languages()
+        return self._get_compiled_regex_for(self._get_active_languages(), pattern_name)
+
+    def _get_compiled_regex_for(self, langs: List[str], pattern_name: str) -> Pattern:
         # Use a tuple of sorted langs as the cache key
         cache_key = (tuple(sorted(langs)), pattern_name)
 
@@ -0,0 +1,149 @@
+# argus/services/extractor/benchmarks/bench_dom.py
+"""
+Benchmark of the DOM backends: the ported parsers (price, title, image,
+breadcrumbs, open_graph, json_ld) on the native lxml.html tree against the
+same parsers on the BeautifulSoup tree, both through the DOM abstraction of
+app.core.dom, on the test corpus and a large shop page. The timings include
+building the DOM: the bs4 parse or the lxml parse.
+
+Run from the service directory:
+
+    python -m benchmarks.bench_dom [--products N] [--number N]
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+from typing import Callable, List, Tuple
+from loguru import logger
+from app.config import settings
+from app.core.context import ExtractionContext, shared_context
+from app.core.document import PageDocument
+from app.core.dom import BACKEND_BS4, BACKEND_LXML, DomNode
+from app.modules.breadcrumbs.parsers.heuristic_parser import parse_with_heuristics
+from app.modules.breadcrumbs.parsers.itemprop_parser import parse_itemprop_schema
+from app.modules.breadcrumbs.parsers.regex_parser import parse_with_regex
+from app.modules.image.parsers.amazon_parser import parse_amazon_selectors
+from app.modules.image.parsers.context_parser import parse_from_product_context
+from app.modules.image.parsers.fallback_parser import parse_largest_image_fallback
+from app.modules.image.parsers.meta_parser import parse_meta_tags as parse_image_meta
+from app.modules.json_ld.utils import parse_json_ld_scripts
+from app.modules.open_graph.utils import find_og_tags
+from app.modules.price.parsers.class_parser import parse_price_classes
+from app.modules.price.parsers.itemprop_parser import parse_itemprop
+from app.modules.price.parsers.regex_body_parser import parse_regex_in_body
+from app.modules.price.parsers.regex_section_parser import parse_regex_in_sections
+from app.modules.title.parsers.fallback_parser import parse_generic_fallback
+from app.modules.title.parsers.h1_parser import parse_h1_tags
+from app.modules.title.parsers.meta_parser import parse_meta_tags as parse_title_meta
+from app.modules.title.parsers.title_tag_parser import parse_title_tag
+from benchmarks.bench_ingestion import build_oversized_page
+
+TEST_CASES_DIR = Path(__file__).resolve().parent.parent / "tests" / "test_cases"
+
+# The ported parsers, and whether they take the processed elements
+PARSERS: List[Tuple[Callable, bool]] = [
+    (parse_itemprop, True),
+    (parse_price_classes, True),
+    (parse_regex_in_sections, True),
+    (parse_regex_in_body, True),
+    (parse_h1_tags, True),
+    (parse_title_tag, True),
+    (parse_title_meta, True),
+    (parse_generic_fallback, True),
+    (parse_image_meta, True),
+    (parse_amazon_selectors, True),
+    (parse_from_product_context, True),
+    (parse_largest_image_fallback, True),
+    (parse_itemprop_schema, False),
+    (parse_with_heuristics, False),
+    (parse_with_regex, False),
+    (find_og_tags, False),
+    (parse_json_ld_scripts, False),
+]
+
+
+def build_document(html: str, backend: str) -> PageDocument:
+    settings.dom.backend = backend
+    document = PageDocument(html)
+    document.dom
+    return document
+
+
+def extraction_context(document: PageDocument) -> ExtractionContext:
+    return ExtractionContext(
+        document=document,
+        current_url="https://bench.example/product",
+        lang_code="en",
+        use_llm=False,
+        resources={},
+        processed_elements=None,
+    )
+
+
+def run_parsers(dom: DomNode):
+    processed_elements: set = set()
+    for parser, takes_processed in PARSERS:
+        try:
+            if takes_processed:
+                parser(dom, processed_elements)
+            else:
+                parser(dom)
+        except Exception:
+            # In the service a failing parser fails its module; time the others
+            pass
+
+
+def time_backend(html: str, backend: str, number: int) -> Tuple[float, float]:
+    """The ms per run of building the DOM plus the parsers, and of the parsers alone."""
+
+    def build_and_run():
+        document = build_document(html, backend)
+        with shared_context.activate(extraction_context(document)):
+            run_parsers(document.dom)
+        document.release()
+
+    document = build_document(html, backend)
+
+    def run_only():
+        # A fresh memo per run: the cached texts and the token index are part of the work
+        document.memo.clear()
+        with shared_context.activate(extraction_context(document)):
+            run_parsers(document.dom)
+
+    total_ms = timeit.timeit(build_and_run, number=number) / number * 1000
+    parsers_ms = timeit.timeit(run_only, number=number) / number * 1000
+    document.release()
+    return total_ms, parsers_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--products", type=int, default=500, help="product cards on the timed shop page")
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+    logger.remove()
+    configured_backend = settings.dom.backend
+
+    pages = {
+        case.name: (case / "input.html").read_text(encoding="utf-8")
+        for case in sorted(TEST_CASES_DIR.iterdir())
+        if (case / "input.html").exists()
+    }
+    pages[f"shop page ({args.products} cards)"] = build_oversized_page(args.products)
+
+    print(f"{'page':<28}{'KB':>7}{'bs4 ms':>9}{'lxml ms':>9}{'speed-up':>10}{'parsers: bs4':>14}{'lxml':>8}{'speed-up':>10}")
+    try:
+        for name, html in pages.items():
+            bs4_total, bs4_parsers = time_backend(html, BACKEND_BS4, args.number)
+            lxml_total, lxml_parsers = time_backend(html, BACKEND_LXML, args.number)
+            print(
+                f"{name:<28}{len(html) / 1024:>7.0f}{bs4_total:>9.2f}{lxml_total:>9.2f}{bs4_total / lxml_total:>9.1f}x"
+                f"{bs4_parsers:>14.2f}{lxml_parsers:>8.2f}{bs4_parsers / lxml_parsers:>9.1f}x"
+            )
+    finally:
+        settings.dom.backend = configured_backend
+
+
+if __name__ == "__main__":
+    main()
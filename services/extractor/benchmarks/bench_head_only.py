@@ -0,0 +1,94 @@
+# argus/services/extractor/benchmarks/bench_head_only.py
+"""
+Benchmark of the head-only mode: the analysis time per page with the mode off
+(full analysis) and on (regex scan of the JSON-LD and head tags, then the
+modules on a synthetic document, or the full analysis as fallback).
+
+Every page is listed with the outcome of the mode and whether its results are
+identical to the full analysis. Besides the test corpus, a large shop page with
+complete Product JSON-LD and Open Graph tags shows the case the mode is for.
+
+Run from the service directory:
+
+    python -m benchmarks.bench_head_only [--number N] [--products N]
+"""
+
+import argparse
+import json
+import timeit
+from pathlib import Path
+from loguru import logger
+from app.config import settings
+from app.core.analyzer import ProductPageAnalyzer
+from benchmarks.bench_ingestion import build_oversized_page
+
+TEST_CASES_DIR = Path(__file__).resolve().parent.parent / "tests" / "test_cases"
+
+
+def build_structured_page(products: int) -> str:
+    """A large listing-style page whose product is fully described in its head."""
+    product = {
+        "@context": "https://schema.org",
+        "@type": "Product",
+        "name": "Structured Widget",
+        "image": "https://shop.example/img/widget.jpg",
+        "brand": {"@type": "Brand", "name": "BrandCo"},
+        "description": "A widget described entirely by its structured data.",
+        "offers": {
+            "@type": "Offer",
+            "price": "49.95",
+            "priceCurrency": "EUR",
+            "availability": "https://schema.org/InStock",
+        },
+    }
+    head = (
+        "<head><title>Structured Widget | Shop</title>"
+        '<meta property="og:title" content="Structured Widget">'
+        '<meta property="og:image" content="https://shop.example/img/widget.jpg">'
+        '<meta property="product:price:amount" content="49.95">'
+        f'<script type="application/ld+json">{json.dumps(product)}</script>'
+    )
+    return build_oversized_page(products).replace("<head>", head, 1)
+
+
+def analyze(analyzer: ProductPageAnalyzer, html: str, url: str, head_only: bool):
+    settings.head_only.enabled = head_only
+    return analyzer.analyze_with_timings(html, url, False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--products", type=int, default=500)
+    args = parser.parse_args()
+    logger.remove()
+    analyzer = ProductPageAnalyzer()
+    logger.remove()
+
+    pages = {
+        case.name: (case / "input.html").read_text(encoding="utf-8")
+        for case in sorted(TEST_CASES_DIR.iterdir())
+        if (case / "input.html").exists()
+    }
+    pages[f"structured ({args.products} products)"] = build_structured_page(args.products)
+
+    print(f"{'page':<32}{'outcome':>10}{'same':>6}{'full ms':>10}{'head ms':>10}{'speed-up':>10}")
+    total_full = total_head = 0.0
+    for name, html in pages.items():
+        url = f"https://shop.example/{name}"
+        full_results, _ = analyze(analyzer, html, url, head_only=False)
+        head_results, head_timings = analyze(analyzer, html, url, head_only=True)
+        number = max(1, args.number // 10) if len(html) > 1024 * 1024 else args.number
+        full_ms = timeit.timeit(lambda: analyze(analyzer, html, url, False), number=number) / number * 1000
+        head_ms = timeit.timeit(lambda: analyze(analyzer, html, url, True), number=number) / number * 1000
+        total_full += full_ms
+        total_head += head_ms
+        print(
+            f"{name:<32}{head_timings['head_only']:>10}{'yes' if head_results == full_results else 'no':>6}"
+            f"{full_ms:>10.2f}{head_ms:>10.2f}{full_ms / head_ms:>9.1f}x"
+        )
+    print(f"{'total':<48}{total_full:>10.2f}{total_head:>10.2f}{total_full / total_head:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
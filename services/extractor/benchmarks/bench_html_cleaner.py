@@ -0,0 +1,85 @@
+# argus/services/extractor/benchmarks/bench_html_cleaner.py
+"""
+Benchmark of the HTML cleaner: the single bottom-up traversal of
+clean_soup_for_extraction on the test corpus, a large product listing and
+deeply nested wrappers (which made a per-tag get_text quadratic), next to the
+lxml parse of the same page for scale.
+
+Run from the service directory:
+
+    python -m benchmarks.bench_html_cleaner [--products N] [--depth N] [--number N]
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+from typing import List
+from bs4 import BeautifulSoup
+from loguru import logger
+from app.utils.html_processor import clean_soup_for_extraction
+
+TEST_CASES_DIR = Path(__file__).resolve().parent.parent / "tests" / "test_cases"
+
+
+def build_product_listing(products: int) -> str:
+    """A large shop page: a header, a grid of product cards and a footer."""
+    cards = "".join(
+        f'<div class="card" id="p{n}"><a href="/p/{n}"><img src="/img/{n}.jpg" alt=""></a>'
+        f'<div class="card-body"><h3 class="name">Product {n}</h3>'
+        f'<span class="price">&euro; {n},99</span><span class="badge"></span>'
+        f'<div class="rating"><i class="star"></i><i class="star"></i></div><!-- card {n} -->'
+        f'<button class="add">Add</button><svg><path d="M0 0"/></svg></div>'
+        f'<div class="related-products"><a href="/r/{n}">Related</a></div></div>\n'
+        for n in range(products)
+    )
+    return (
+        "<html><head><title>Listing</title><style>.card{}</style></head><body>"
+        '<header><nav><a href="/">Home</a></nav></header>'
+        f'<main><div class="grid">{cards}</div></main>'
+        "<footer><p>&copy; Shop</p></footer></body></html>"
+    )
+
+
+def build_nested_page(depth: int) -> str:
+    """Deeply nested wrappers, each with an empty span."""
+    opening = "".join(f'<div class="level-{level}"><span></span>' for level in range(depth))
+    return f"<html><body>{opening}<p>Deep text</p>{'</div>' * depth}<div><div></div></div></body></html>"
+
+
+def time_parse(html: str, number: int) -> float:
+    return timeit.timeit(lambda: BeautifulSoup(html, "lxml"), number=number) / number * 1000
+
+
+def time_cleaner(html: str, number: int) -> float:
+    """Milliseconds per call, without the parse (each run cleans a fresh copy)."""
+    soups: List[BeautifulSoup] = [BeautifulSoup(html, "lxml") for _ in range(number)]
+    iterator = iter(soups)
+    seconds = timeit.timeit(lambda: clean_soup_for_extraction(next(iterator)), number=number)
+    return seconds / number * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--depth", type=int, default=400)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+    logger.remove()
+
+    pages = {
+        case.name: (case / "input.html").read_text(encoding="utf-8")
+        for case in sorted(TEST_CASES_DIR.iterdir())
+        if (case / "input.html").exists()
+    }
+    pages[f"listing ({args.products} products)"] = build_product_listing(args.products)
+    pages[f"nested (depth {args.depth})"] = build_nested_page(args.depth)
+
+    print(f"{'page':<36}{'size':>10}{'parse ms':>10}{'clean ms':>10}{'clean/parse':>13}")
+    for name, html in pages.items():
+        parse_ms = time_parse(html, args.number)
+        clean_ms = time_cleaner(html, args.number)
+        print(f"{name:<36}{len(html) // 1024:>8}kB{parse_ms:>10.2f}{clean_ms:>10.2f}{clean_ms / parse_ms:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
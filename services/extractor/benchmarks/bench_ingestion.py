@@ -0,0 +1,99 @@
+# argus/services/extractor/benchmarks/bench_ingestion.py
+"""
+Benchmark of the streaming ingestion of oversized pages: parse time and peak
+memory of the streaming tree builder against the plain lxml parse, on pages
+made mostly of inline SVG, JSON state blobs and giant menus.
+
+Run from the service directory:
+
+    python -m benchmarks.bench_ingestion [--products N] [--number N]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Callable, Tuple
+from bs4 import BeautifulSoup
+from loguru import logger
+from app.core.ingestion import StreamingTreeBuilder
+
+ICON = (
+    '<svg viewBox="0 0 24 24" class="icon">'
+    + "".join(f'<path d="M{n} {n}L{n + 1} {n + 2}Z" fill="#{n:06x}"/>' for n in range(40))
+    + "</svg>"
+)
+
+
+def build_oversized_page(products: int) -> str:
+    """A shop page with a mega menu, an icon per card and a large state blob."""
+    menu = "".join(
+        f'<li class="menu-item"><a href="/c/{n}">{ICON}Category {n}</a></li>' for n in range(products // 2)
+    )
+    cards = "".join(
+        f'<div class="card"><a href="/p/{n}">{ICON}<h3>Product {n}</h3></a>'
+        f'<span class="price">{n},99</span><template><p>Quick view {n}</p></template></div>'
+        for n in range(products)
+    )
+    state = json.dumps({"products": [{"id": n, "name": f"Product {n}", "tags": ["a"] * 20} for n in range(products)]})
+    json_ld = json.dumps({"@context": "https://schema.org", "@type": "Product", "name": "Product 0"})
+    return (
+        "<html><head><title>Shop</title><style>" + ".card{}" * products + "</style>"
+        f'<script type="application/ld+json">{json_ld}</script></head><body>'
+        f'<nav><ul class="mega-menu">{menu}</ul></nav><main>{cards}</main>'
+        f'<script id="__STATE__">window.__STATE__ = {state}</script></body></html>'
+    )
+
+
+def parse_default(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, "lxml")
+
+
+def parse_streaming(html: str) -> BeautifulSoup:
+    builder = StreamingTreeBuilder(max_nodes=10**9, max_bytes=10**12, chunk_size=64 * 1024)
+    return BeautifulSoup(html, builder=builder)
+
+
+def measure(parse: Callable[[str], BeautifulSoup], html: str, number: int) -> Tuple[float, float, int]:
+    """Milliseconds per parse, the peak memory of one parse in MB, and the elements it built."""
+    started_at = time.perf_counter()
+    for _ in range(number):
+        parse(html)
+    elapsed_ms = (time.perf_counter() - started_at) / number * 1000
+
+    tracemalloc.start()
+    soup = parse(html)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    elements = len(soup.find_all(True))
+    del soup
+    return elapsed_ms, peak / 1024 / 1024, elements
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--products", type=int, default=4000)
+    parser.add_argument("--number", type=int, default=1)
+    args = parser.parse_args()
+    logger.remove()
+
+    pages = {
+        f"oversized ({args.products // 4} products)": build_oversized_page(args.products // 4),
+        f"oversized ({args.products} products)": build_oversized_page(args.products),
+    }
+
+    print(
+        f"{'page':<30}{'size':>9}{'lxml ms':>10}{'stream ms':>11}{'lxml MB':>10}{'stream MB':>11}"
+        f"{'lxml tags':>11}{'stream tags':>13}"
+    )
+    for name, html in pages.items():
+        default_ms, default_mb, default_tags = measure(parse_default, html, args.number)
+        streaming_ms, streaming_mb, streaming_tags = measure(parse_streaming, html, args.number)
+        print(
+            f"{name:<30}{len(html) / 1024 / 1024:>7.1f}MB{default_ms:>10.0f}{streaming_ms:>11.0f}"
+            f"{default_mb:>10.0f}{streaming_mb:>11.0f}{default_tags:>11}{streaming_tags:>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
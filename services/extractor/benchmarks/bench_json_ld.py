@@ -0,0 +1,155 @@
+# argus/services/extractor/benchmarks/bench_json_ld.py
+"""
+Benchmark of the JSON-LD index: decoding the scripts of a page and reading the
+fields the modules take from JSON-LD (price, availability, image, title,
+description, brand, breadcrumbs) through one JsonLdIndex per page.
+
+The same product pages are timed as flat scripts, as one '@graph' with '@id'
+references and with common defects (trailing commas, comment wrappers,
+JavaScript comments, several objects in one script), and the counts show how
+many fields the index reads from each form.
+
+Run from the service directory:
+
+    python -m benchmarks.bench_json_ld [--documents N] [--items N] [--number N]
+"""
+
+import argparse
+import json
+import random
+import timeit
+from typing import Any, Dict, List
+from loguru import logger
+from app.modules.json_ld.index import JsonLdIndex
+from app.modules.json_ld.utils import decode_json_ld
+
+FIELDS = ("price", "availability", "image", "title", "description", "brand", "breadcrumbs")
+
+
+def build_document(rng: random.Random, index: int, items: int) -> Dict[str, Any]:
+    """A product page's entities: the Product, its breadcrumbs and the shop."""
+    product = {
+        "@type": "Product",
+        "name": f"Product {index}",
+        "image": [f"https://shop.example/img/{index}.jpg"],
+        "description": f"Description of product {index}.",
+        "brand": {"@type": "Brand", "name": rng.choice(["Acme", "Globex", "Initech"])},
+        "offers": {
+            "@type": "Offer",
+            "price": f"{rng.randint(1, 500)}.{rng.randint(0, 99):02d}",
+            "priceCurrency": "EUR",
+            "availability": rng.choice(["https://schema.org/InStock", "https://schema.org/OutOfStock"]),
+        },
+        "review": [{"@type": "Review", "reviewBody": "x" * 40, "author": {"name": f"r{n}"}} for n in range(items)],
+    }
+    breadcrumbs = {
+        "@type": "BreadcrumbList",
+        "itemListElement": [
+            {"@type": "ListItem", "position": position, "item": {"@id": f"/c/{position}", "name": f"Level {position}"}}
+            for position in (2, 1, 3)
+        ],
+    }
+    shop = {"@type": "Organization", "name": "The Shop", "logo": "https://shop.example/logo.png"}
+    return {"product": product, "breadcrumbs": breadcrumbs, "shop": shop}
+
+
+def flat_scripts(document: Dict[str, Any]) -> List[str]:
+    return [json.dumps({"@context": "https://schema.org", **document[key]}) for key in ("product", "breadcrumbs", "shop")]
+
+
+def graph_scripts(document: Dict[str, Any]) -> List[str]:
+    """One '@graph' with the shop first and the brand and offer as '@id' references."""
+    product = dict(document["product"])
+    brand = {"@id": "#brand", **product.pop("brand")}
+    offer = {"@id": "#offer", **product.pop("offers")}
+    product.update({"@id": "#product", "brand": {"@id": "#brand"}, "offers": [{"@id": "#offer"}]})
+    graph = [document["shop"], document["breadcrumbs"], brand, offer, product]
+    return [json.dumps({"@context": "https://schema.org", "@graph": graph})]
+
+
+def malformed_scripts(rng: random.Random, document: Dict[str, Any]) -> List[str]:
+    """The flat scripts with one common defect each."""
+    product, breadcrumbs, shop = flat_scripts(document)
+    defects = [
+        lambda text: text[:-1] + ",}",
+        lambda text: f"<!--\n{text}\n-->",
+        lambda text: text.replace("{", "{ // generated\n", 1),
+        lambda text: text + ";",
+    ]
+    return [rng.choice(defects)(product), f"{breadcrumbs}\n{shop}"]
+
+
+def decode(scripts: List[str]) -> JsonLdIndex:
+    nodes: List[Any] = []
+    for script in scripts:
+        try:
+            data = decode_json_ld(script)
+        except ValueError:
+            continue
+        nodes.extend(data if isinstance(data, list) else [data])
+    return JsonLdIndex(nodes)
+
+
+def read(index: JsonLdIndex) -> Dict[str, Any]:
+    """The values the modules read from the page's JSON-LD."""
+    values: Dict[str, Any] = {}
+    for offer in index.offers:
+        if offer.get("price") is not None:
+            values["price"] = str(offer["price"])
+        if isinstance(offer.get("availability"), str):
+            values["availability"] = offer["availability"].split("/")[-1]
+        break
+    for _, image in index.values("image"):
+        if isinstance(image, list) and image:
+            image = index.resolve(image[0])
+        if isinstance(image, str):
+            values["image"] = image
+            break
+    for key, field in (("name", "title"), ("description", "description")):
+        for _, value in index.values(key):
+            if isinstance(value, str):
+                values[field] = value
+                break
+    for _, brand in index.values("brand"):
+        brand = index.resolve(brand)
+        brand = brand.get("name") if isinstance(brand, dict) else brand
+        if isinstance(brand, str):
+            values["brand"] = brand
+            break
+    breadcrumb_list = index.first("BreadcrumbList")
+    if breadcrumb_list is not None:
+        items = sorted(index.resolve(breadcrumb_list.get("itemListElement", [])), key=lambda item: item.get("position", 99))
+        values["breadcrumbs"] = [index.resolve(item["item"])["name"] for item in items]
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=300)
+    parser.add_argument("--items", type=int, default=20, help="reviews per product")
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+    logger.remove()
+
+    rng = random.Random(11)
+    documents = [build_document(rng, index, args.items) for index in range(args.documents)]
+    forms = {
+        "flat": [flat_scripts(document) for document in documents],
+        "@graph with @id": [graph_scripts(document) for document in documents],
+        "malformed": [malformed_scripts(rng, document) for document in documents],
+    }
+
+    print(f"{'form':<18}{'fields read':>14}{'ms':>10}")
+    for form, pages in forms.items():
+        fields = sum(len(read(decode(scripts))) for scripts in pages)
+
+        def run():
+            for scripts in pages:
+                read(decode(scripts))
+
+        elapsed_ms = timeit.timeit(run, number=args.number) / args.number * 1000
+        print(f"{form:<18}{fields:>7}/{len(pages) * len(FIELDS):<6}{elapsed_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# argus/services/extractor/benchmarks/bench_scoreboard.py
+"""
+Micro-benchmark of the per-request scoreboard: the slotted Scoreboard against
+the former pydantic implementation (one ExtractionResult model per candidate
+and a model_dump of the dynamic product model at the end).
+
+Run from the service directory:
+
+    python -m benchmarks.bench_scoreboard [--requests N]
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from typing import Any, Dict, List
+from loguru import logger
+from pydantic import BaseModel, Field, create_model
+from app.core.models import Scoreboard, _BaseProductData
+from app.core.module_loader import discover_and_load_modules
+from app.core.types import ExtractionResult, FieldExtractionStatus
+
+
+# --- The former implementation, kept here as the reference ---
+
+
+class LegacyExtractionResult(BaseModel):
+    value: Any
+    source: str
+    score: int
+    status: FieldExtractionStatus
+
+
+class LegacyProductData(BaseModel):
+    all_results: Dict[str, List[LegacyExtractionResult]] = Field(
+        default_factory=dict, exclude=True
+    )
+    field_status: Dict[str, FieldExtractionStatus] = Field(
+        default_factory=dict, exclude=True
+    )
+    selectors_used: Dict[str, str] = Field(default_factory=dict, exclude=True)
+
+
+# --- A synthetic request: a few candidates per field, as a product page yields ---
+
+
+def _candidates(field_names: List[str]) -> List[tuple]:
+    candidates = []
+    for index, field_name in enumerate(field_names):
+        for attempt in range(4):
+            candidates.append(
+                (
+                    field_name,
+                    f"{field_name} value {attempt}",
+                    f"{field_name}_parser_{attempt}",
+                    50 * attempt + index,
+                    FieldExtractionStatus.MODULE_HEURISTIC,
+                )
+            )
+    return candidates
+
+
+def run_legacy(model, candidates) -> Dict[str, Any]:
+    product_data = model()
+    for field_name, value, source, score, status in candidates:
+        result = LegacyExtractionResult(
+            value=value, source=source, score=score, status=status
+        )
+        product_data.all_results.setdefault(field_name, []).append(result)
+    for field_name, results in product_data.all_results.items():
+        best = max(results, key=lambda r: r.score)
+        if hasattr(product_data, field_name):
+            setattr(product_data, field_name, best.value)
+            product_data.field_status[field_name] = best.status
+            product_data.selectors_used[field_name] = best.source
+    return product_data.model_dump(
+        exclude={"all_results", "field_status", "selectors_used"}
+    )
+
+
+def run_scoreboard(model, field_names, candidates) -> Dict[str, Any]:
+    scoreboard = Scoreboard(field_names)
+    for field_name, value, source, score, status in candidates:
+        scoreboard.add_result(
+            field_name,
+            ExtractionResult(value=value, source=source, score=score, status=status),
+        )
+    for field_name, results in scoreboard.all_results.items():
+        if scoreboard.has_field(field_name):
+            scoreboard.set_winner(field_name, max(results, key=lambda r: r.score))
+    return scoreboard.get_final_results(model)
+
+
+def _allocated_bytes(func) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    logger.remove()
+
+    # The synthetic values are strings, so both models declare every field as Any
+    fields = {name: (Any, None) for name in discover_and_load_modules("app.modules")}
+    legacy_model = create_model(
+        "LegacyProductDataModel", __base__=LegacyProductData, **fields
+    )
+    model = create_model("ProductDataModel", __base__=_BaseProductData, **fields)
+    field_names = frozenset(model.model_fields)
+    candidates = _candidates(sorted(field_names))
+
+    legacy = lambda: run_legacy(legacy_model, candidates)  # noqa: E731
+    current = lambda: run_scoreboard(model, field_names, candidates)  # noqa: E731
+    assert legacy() == current(), "The scoreboards disagree on the final results."
+
+    print(f"{len(field_names)} fields, {len(candidates)} candidates per request")
+    for name, func in (("pydantic (legacy)", legacy), ("slotted scoreboard", current)):
+        seconds = timeit.timeit(func, number=args.requests)
+        print(
+            f"{name:>20}: {seconds / args.requests * 1e6:8.1f} µs/request, "
+            f"{_allocated_bytes(func):>7} bytes peak allocation"
+        )
+
+
+if __name__ == "__main__":
+    main()
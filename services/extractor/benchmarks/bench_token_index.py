@@ -0,0 +1,87 @@
+# argus/services/extractor/benchmarks/bench_token_index.py
+"""
+Benchmark of the token index: the class/id/itemprop lookups of the parsers
+with bs4's find_all(), which tests every element of the page on every call,
+against one TokenIndex per page (its build included), on the test corpus and
+a large product listing.
+
+Run from the service directory:
+
+    python -m benchmarks.bench_token_index [--cards N] [--number N]
+"""
+
+import argparse
+import re
+import timeit
+from pathlib import Path
+from bs4 import BeautifulSoup
+from loguru import logger
+from app.core.token_index import TokenIndex
+from app.utils.pattern_manager import pattern_manager
+
+TEST_CASES_DIR = Path(__file__).resolve().parent.parent / "tests" / "test_cases"
+
+
+def parser_queries():
+    """The (name, keyword arguments) of the parsers' find_all() lookups."""
+    return [
+        (re.compile(r"div|span|p|b|section"), {"class_": re.compile(r"price", re.IGNORECASE)}),
+        (["div", "span", "section"], {"class_": pattern_manager.get_compiled_regex("price_section_class_regex"), "limit": 5}),
+        (re.compile(r"div|span|p|button|a"), {"class_": pattern_manager.get_compiled_regex("availability_class_regex"), "limit": 10}),
+        (re.compile(r"a|span|div|p|strong|h[1-6]"), {"class_": pattern_manager.get_compiled_regex("brand_class_regex")}),
+        (re.compile(r"a|span|div|p"), {"class_": pattern_manager.get_compiled_regex("brand_class_regex"), "limit": 5}),
+        (None, {"class_": re.compile(r"brand|manufacturer|vendor|product-brand", re.IGNORECASE)}),
+        (None, {"itemprop": "brand"}),
+        ("h1", {"itemprop": "name"}),
+        ("h1", {"class_": re.compile(r"product-title|item-name|title|product__title", re.IGNORECASE)}),
+        (
+            ["div", "p", "section", "span"],
+            {
+                "class_": re.compile(r"description|details|info|content|main-text", re.IGNORECASE),
+                "id": re.compile(r"description|details|info|content|main-text", re.IGNORECASE),
+            },
+        ),
+        (re.compile(r"ol|ul|nav|div"), {"itemtype": re.compile(r"BreadcrumbList", re.IGNORECASE)}),
+        (re.compile(r"ol|ul|nav|div"), {"itemprop": re.compile(r"breadcrumb|itemList", re.IGNORECASE)}),
+        (None, {"itemprop": re.compile(r"itemListElement|item", re.IGNORECASE)}),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cards", type=int, default=2000, help="product cards on the timed listing page")
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+    logger.remove()
+
+    queries = parser_queries()
+    pages = {
+        case.name: BeautifulSoup((case / "input.html").read_text(encoding="utf-8"), "lxml")
+        for case in sorted(TEST_CASES_DIR.iterdir())
+        if (case / "input.html").exists()
+    }
+    cards = "".join(
+        f'<div class="card product-card"><a class="card__link" href="/p/{n}"><h3 class="card__name">Product {n}</h3></a>'
+        f'<div class="card__body"><span class="price">{n},99</span><span class="stock in-stock">In stock</span></div></div>'
+        for n in range(args.cards)
+    )
+    pages[f"listing ({args.cards} cards)"] = BeautifulSoup(f"<html><body><main>{cards}</main></body></html>", "lxml")
+
+    print(f"{'page':<32}{'elements':>9}{'bs4 ms':>9}{'index ms':>10}{'speed-up':>10}")
+    for name, soup in pages.items():
+        def run_bs4():
+            for tag_name, arguments in queries:
+                soup.find_all(tag_name, **arguments)
+
+        def run_index():
+            index = TokenIndex(soup)
+            for tag_name, arguments in queries:
+                index.find_all(None, tag_name, **dict(arguments))
+
+        bs4_ms = timeit.timeit(run_bs4, number=args.number) / args.number * 1000
+        index_ms = timeit.timeit(run_index, number=args.number) / args.number * 1000
+        print(f"{name:<32}{len(soup.find_all(True)):>9}{bs4_ms:>9.2f}{index_ms:>10.2f}{bs4_ms / index_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# extractor/tests/__init__.py
@@ -3,6 +3,7 @@
 import pytest
 import httpx
 import json
+import uuid
 from pathlib import Path
 from deepdiff import DeepDiff
 
@@ -110,4 +111,808 @@ def test_extract_fails_with_bad_auth(headers):
     assert response.status_code == 401, f"Expected 401, got {response.status_code}"
     
     # Check that the error message is correct
-    assert "Invalid or missing API Key" in response.text
\ No newline at end of file
+    assert "Invalid or missing API Key" in response.text
+
+def test_debug_plan_lists_dependency_levels():
+    """
+    Tests that the precompiled execution plan is exposed and that every module
+    only depends on modules from an earlier level.
+    """
+    plan_url = SERVICE_URL.replace("/extract", "/debug/plan")
+    response = httpx.get(plan_url, headers=HEADERS)
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+    plan = response.json()["plan"]
+    seen = set()
+    for level in plan["levels"]:
+        for module_name in level:
+            requires = set(plan["modules"][module_name]["requires"])
+            assert requires & set(plan["modules"]) <= seen, f"'{module_name}' runs before its dependencies"
+        seen.update(level)
+    assert seen == set(plan["modules"])
+
+    # Unknown fields are rejected instead of silently compiling an empty plan
+    response = httpx.get(plan_url, params={"fields": "no_such_field"}, headers=HEADERS)
+    assert response.status_code == 400
+
+
+def test_sequential_modules_see_the_claims_of_their_level(monkeypatch):
+    """
+    Tests that in sequential mode a module sees the elements claimed by the
+    modules that ran before it in the same level, as with one shared set, and
+    that in parallel mode those claims only become visible in the next level.
+    """
+    from types import SimpleNamespace
+    from app.config import settings
+    from app.core.analyzer import ProductPageAnalyzer
+    from app.core.context import shared_context
+    from app.core.document import PageDocument
+    from app.core.execution_plan import ExecutionPlan
+    from app.core.models import Scoreboard
+    from app.core.types import FieldExtractionStatus
+
+    element = object()
+    seen = {}
+
+    def claim():
+        shared_context.current().processed_elements.add(element)
+        return None, "NOT_FOUND", FieldExtractionStatus.NOT_FOUND, 0
+
+    def check(name):
+        seen[name] = element in shared_context.current().processed_elements
+        return None, "NOT_FOUND", FieldExtractionStatus.NOT_FOUND, 0
+
+    modules = {
+        "claimer": SimpleNamespace(REQUIRES_VIEWS=[], extract=claim),
+        "same_level": SimpleNamespace(REQUIRES_VIEWS=[], extract=lambda: check("same_level")),
+        "next_level": SimpleNamespace(REQUIRES_VIEWS=[], extract=lambda: check("next_level")),
+    }
+    plan = ExecutionPlan("free", None, (("claimer", "same_level"), ("next_level",)), modules)
+    analyzer = ProductPageAnalyzer()
+
+    for mode, visible_in_level in [("sequential", True), ("parallel", False)]:
+        monkeypatch.setattr(settings.execution, "mode", mode)
+        seen.clear()
+        context = analyzer._create_initial_context(PageDocument("<p></p>"), "https://x.example/p", False)
+        with shared_context.scope(context):
+            analyzer._run_modules(Scoreboard(analyzer.product_fields), plan, context)
+        assert seen == {"same_level": visible_in_level, "next_level": True}, mode
+    analyzer.shutdown()
+
+
+def test_batch_streams_one_line_per_item():
+    """
+    Tests that /extract/batch streams one NDJSON line per item, and that a
+    failing item is reported on its own line without failing the batch.
+    """
+    test_cases = find_test_cases()
+    items = [
+        {
+            "html_content": (case / "input.html").read_text(encoding="utf-8"),
+            "url": f"http://example.com/{case.name}",
+        }
+        for case in test_cases
+    ]
+    # No html_content and an unreachable URL: this item must fail on its own
+    items.append({"url": "http://127.0.0.1:9/unreachable"})
+
+    batch_url = SERVICE_URL + "/batch"
+    with httpx.stream("POST", batch_url, json={"items": items}, headers=HEADERS, timeout=120.0) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert sorted(line["index"] for line in lines) == list(range(len(items)))
+    for line in lines:
+        if line["index"] < len(test_cases):
+            assert line["status_code"] == 200, line
+            assert line["data"]
+        else:
+            assert line["status_code"] != 200
+            assert line["error"]
+
+
+def test_timings_block_is_opt_in():
+    """
+    Tests that the 'timings' block is only returned when requested, and that the
+    analysis shows up in the Prometheus metrics.
+    """
+    payload = {"url": "http://example.com/timings", "html_content": "<html><head><title>A product</title></head><body><h1>A product</h1></body></html>"}
+
+    response = httpx.post(SERVICE_URL, json=payload, headers=HEADERS, timeout=30.0)
+    assert response.status_code == 200
+    assert "timings" not in response.json()
+
+    response = httpx.post(SERVICE_URL, json={**payload, "include_timings": True}, headers=HEADERS, timeout=30.0)
+    assert response.status_code == 200
+    timings = response.json()["timings"]
+    assert "title" in timings["modules"]
+    assert timings["winners"]["title"] in timings["parsers"]["title"]
+
+    metrics_url = SERVICE_URL.replace("/api/v1/extract", "/metrics")
+    metrics = httpx.get(metrics_url).text
+    assert 'argus_module_duration_seconds_count{module="title"}' in metrics
+    assert "argus_parser_wins_total" in metrics
+
+
+def test_identical_pages_are_served_from_the_result_cache():
+    """
+    Tests that a page that only differs in volatile tokens (here a script nonce)
+    is answered from the result cache with the same data.
+    """
+    html = "<html><head><script nonce='{}'></script><title>Cached product</title></head><body><h1>Cached product</h1><span class='price'>12,95</span></body></html>"
+    payload = {"url": "http://example.com/cached", "include_timings": True}
+
+    first = httpx.post(SERVICE_URL, json={**payload, "html_content": html.replace("'{}'", '"abc123"')}, headers=HEADERS, timeout=30.0).json()
+    second = httpx.post(SERVICE_URL, json={**payload, "html_content": html.replace("'{}'", '"def456"')}, headers=HEADERS, timeout=30.0).json()
+
+    assert second["timings"]["cache_hit"] is True
+    assert second["data"] == first["data"]
+
+    stats = httpx.get(SERVICE_URL.replace("/extract", "/debug/cache"), headers=HEADERS).json()
+    assert stats["memory_hits"] >= 1
+
+
+def test_result_affecting_settings_change_the_module_set_version(monkeypatch):
+    """
+    Tests that every settings section that can change the extracted data
+    changes the version cached results are keyed by, and that the sections
+    about how the service runs do not.
+    """
+    from app.config import settings
+    from app.core.analyzer import _settings_version
+
+    version = _settings_version()
+    monkeypatch.setattr(settings.analysis_pool, "workers", 3)
+    monkeypatch.setattr(settings.result_cache, "max_entries", 7)
+    monkeypatch.setattr(settings.memory_report, "enabled", True)
+    assert _settings_version() == version
+
+    for section, name, value in [
+        ("dom", "backend", "lxml"),
+        ("ingestion", "streaming_threshold_bytes", 1024),
+        ("wrappers", "enabled", True),
+        ("adaptive_parsers", "enabled", True),
+        ("time_budget", "default_ms", 50),
+        ("execution", "mode", "parallel"),
+    ]:
+        with monkeypatch.context() as patch:
+            patch.setattr(getattr(settings, section), name, value)
+            assert _settings_version() != version, section
+    assert _settings_version() == version
+
+
+def test_field_subset_only_runs_the_needed_modules():
+    """
+    Tests that 'fields' limits the response to those fields, only runs the
+    modules they depend on, and rejects unknown fields.
+    """
+    test_case_dir = find_test_cases()[0]
+    html_content = (test_case_dir / "input.html").read_text(encoding="utf-8")
+    payload = {
+        "html_content": html_content,
+        "url": f"http://example.com/{test_case_dir.name}",
+        "fields": ["price", "availability"],
+        "include_timings": True,
+    }
+
+    response = httpx.post(SERVICE_URL, json=payload, headers=HEADERS, timeout=30.0)
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body["data"]) == {"price", "availability"}
+    if not body["timings"]["cache_hit"]:
+        assert "brand" not in body["timings"]["modules"]
+
+    response = httpx.post(SERVICE_URL, json={**payload, "fields": ["no_such_field"]}, headers=HEADERS, timeout=30.0)
+    assert response.status_code == 422
+
+
+def test_exhausted_time_budget_skips_low_priority_parsers():
+    """
+    Tests that with a (practically) exhausted time budget the low-priority
+    parsers are skipped and reported, while the response still succeeds.
+    """
+    test_case_dir = find_test_cases()[0]
+    # A unique comment makes sure the page is analyzed instead of served from the cache
+    html_content = (test_case_dir / "input.html").read_text(encoding="utf-8") + f"<!-- {uuid.uuid4()} -->"
+    payload = {
+        "html_content": html_content,
+        "url": f"http://example.com/{test_case_dir.name}",
+        "time_budget_ms": 1,
+    }
+
+    response = httpx.post(SERVICE_URL, json=payload, headers=HEADERS, timeout=30.0)
+    assert response.status_code == 200
+    skipped_parsers = response.json()["skipped_parsers"]
+    assert skipped_parsers
+    assert all("fallback" in name or "nlp" in name or "regex_body" in name for name in skipped_parsers)
+
+
+def test_memory_probe_stops_the_tracing_it_started():
+    """
+    Tests that a memory probe reports the allocations of its analysis and only
+    leaves tracemalloc running if it was already tracing before the probe.
+    """
+    import tracemalloc
+    from app.core.timings import MemoryProbe
+
+    assert not tracemalloc.is_tracing()
+    probe = MemoryProbe()
+    allocation = bytearray(100_000)
+    report = probe.report()
+    assert report["peak_bytes"] >= 100_000 and report["retained_bytes"] >= 100_000
+    probe.stop()
+    probe.stop()
+    assert not tracemalloc.is_tracing()
+    del allocation
+
+    tracemalloc.start()
+    try:
+        MemoryProbe().stop()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_ready_reports_the_warm_up():
+    """
+    Tests that the readiness endpoint is green once the warm-up has run and
+    reports how long the startup steps took.
+    """
+    response = httpx.get(SERVICE_URL.replace("/api/v1/extract", "/ready"), timeout=30.0)
+    assert response.status_code == 200
+    startup = response.json()["startup"]
+    assert startup["total_ms"] > 0
+    assert startup["workers"]
+    assert all("resources_ms" in report for report in startup["workers"].values())
+
+
+def test_pool_shut_down_during_warm_up_does_not_start_workers(monkeypatch):
+    """
+    Tests that an analysis pool shut down while its start is still warming up
+    gives up instead of installing workers that nothing would stop.
+    """
+    import asyncio
+    from app.core import analysis_pool, warm_up
+    from app.core.analysis_pool import AnalysisPool, PoolUnavailableError
+
+    pool = AnalysisPool(analyzer=object())
+    pool.use_processes = False
+    monkeypatch.setattr(analysis_pool, "_worker_analyzer", None)
+    # The service shuts down while the analyzer is being warmed up
+    monkeypatch.setattr(warm_up, "warm_up_analyzer", lambda analyzer: pool.shutdown() or {})
+
+    with pytest.raises(PoolUnavailableError):
+        pool.start()
+    assert pool._executor is None
+    with pytest.raises(PoolUnavailableError):
+        asyncio.run(pool.analyze("<html></html>", "https://x.example/p", False))
+
+
+def test_language_resolver_prefers_declarations_then_the_domain_cache(monkeypatch):
+    """
+    Tests the order in which the page language is resolved: <html lang>, then
+    og:locale, then content-language, then the language recently resolved for
+    the domain (until it expires, and not at all with a TTL of 0), then
+    detection, and the configured default when detection finds nothing.
+    """
+    from types import SimpleNamespace
+    from app.core import language
+    from app.core.document import PageDocument
+    from app.core.language import LanguageResolver
+
+    og_locale = '<meta property="og:locale" content="fr_FR">'
+    content_language = '<meta http-equiv="Content-Language" content="de-DE, en">'
+    dutch_text = "<p>" + "Dit is een pagina met een lange Nederlandse tekst over fietsen en kaas. " * 5 + "</p>"
+
+    def page(html_attributes="", head="", body=""):
+        return PageDocument(f"<html{html_attributes}><head>{head}</head><body>{body}</body></html>")
+
+    clock = SimpleNamespace(monotonic=lambda: 1000.0)
+    monkeypatch.setattr(language, "time", clock)
+    resolver = LanguageResolver()
+    resolver.ttl_seconds = 60
+
+    head = og_locale + content_language
+    assert resolver.resolve(page(' lang="nl-BE"', head), "https://a.example/1") == ("nl", "html_lang")
+    assert resolver.resolve(page("", head), "https://a.example/2") == ("fr", "og_locale")
+    assert resolver.resolve(page("", content_language), "https://a.example/3") == ("de", "content_language")
+
+    # A page without a declaration reuses the domain's last language until it expires
+    assert resolver.resolve(page(), "https://a.example/4") == ("de", "domain_cache")
+    clock.monotonic = lambda: 1061.0
+    assert resolver.resolve(page(body=dutch_text), "https://a.example/5") == ("nl", "detected")
+    # ...and nothing is left to detect from: the configured default
+    assert resolver.resolve(page(), "https://b.example/1") == (resolver.default, "default")
+
+    resolver = LanguageResolver()
+    resolver.ttl_seconds = 0
+    assert resolver.resolve(page(' lang="nl"'), "https://a.example/1") == ("nl", "html_lang")
+    assert resolver.resolve(page(), "https://a.example/2") == (resolver.default, "default")
+    assert not resolver._domains
+
+
+def test_adaptive_parser_order_tries_the_domain_winner_first():
+    """
+    Tests that a parser chain runs in its static order until the domain has
+    enough observations, then starts with the parser that has been producing
+    the field there, and that the result is the same as with the static order.
+    """
+    from app.config import settings
+    from app.core.context import ExtractionContext, shared_context
+    from app.core.document import PageDocument
+    from app.core.parser_chain import run_first_match
+    from app.core.parser_stats import ParserStatsStore
+    from app.core.types import FieldExtractionStatus
+
+    calls = []
+
+    def parse_missing(name):
+        calls.append(name)
+        return None, "NOT_FOUND", FieldExtractionStatus.NOT_FOUND, 0
+
+    def parse_found(name):
+        calls.append(name)
+        return "9,99", name, FieldExtractionStatus.MODULE_HEURISTIC, 80
+
+    def parse_found_too(name):
+        calls.append(name)
+        return "9.99", name, FieldExtractionStatus.MODULE_REGEX, 60
+
+    parsers = [(parse_missing, ("meta",)), (parse_found, ("itemprop",)), (parse_found_too, ("regex",))]
+    names = ["test_extractor.parse_missing", "test_extractor.parse_found", "test_extractor.parse_found_too"]
+
+    persist = settings.adaptive_parsers.persist
+    try:
+        settings.adaptive_parsers.persist = False
+        store = ParserStatsStore()
+    finally:
+        settings.adaptive_parsers.persist = persist
+
+    def run_chain(url):
+        calls.clear()
+        context = ExtractionContext(PageDocument("<p>9,99</p>"), url, "en", False, {}, set(), parser_stats=store)
+        context.current_module = "price"
+        with shared_context.scope(context):
+            return run_first_match(parsers)
+
+    static_result = run_chain("https://static.example/p")
+    assert calls == ["meta", "itemprop"]
+    # Below the minimum (decayed) number of observations the static order is kept
+    runs = 0
+    while runs == 0 or store._stats[("shop.example", "price")].observations < store.min_observations:
+        assert run_chain("https://shop.example/p") == static_result and calls == ["meta", "itemprop"]
+        runs += 1
+    assert runs > 1
+    for _ in range(3):
+        assert run_chain("https://shop.example/p") == static_result and calls == ["itemprop"]
+
+    # The most frequent winner goes first only when it wins often enough
+    for winner in ["test_extractor.parse_found_too"] * 9 + ["test_extractor.parse_found"]:
+        store.record("mixed.example", "price", names, winner)
+    assert store.plan("mixed.example", "price", names) == [2, 0, 1]
+    for winner in names[1:] * 5:
+        store.record("split.example", "price", names, winner)
+    assert store.plan("split.example", "price", names) == [0, 1, 2]
+
+
+def test_wrapper_induction_handles_prefixed_tags(monkeypatch, tmp_path):
+    """
+    Tests that rules are induced for values inside prefixed tags such as
+    <o:p> (Word paste) or <fb:like>, which XPath would otherwise read as an
+    undefined namespace prefix, and that a failure to learn never fails the
+    analysis it learns from.
+    """
+    from app.config import settings
+    from app.core import wrappers
+    from app.core.wrappers import OUTCOME_MISS, PageTree, WrapperRun, WrapperStore, induce_rules
+
+    html = (
+        '<html><body><h1><o:p>Super Widget</o:p></h1>'
+        '<div><fb:like id="like"><o:p>12,99</o:p></fb:like></div></body></html>'
+    )
+    page = PageTree.parse(html)
+    rules, missing = induce_rules(page, {"title": "Super Widget", "price": 12.99, "brand": None})
+    assert missing == []
+    assert rules["title"].expression == '/html/body/h1/*[name()="o:p"]'
+    assert rules["price"].expression == '//*[name()="fb:like"][@id="like"]'
+    assert rules["brand"].kind == "absent"
+
+    monkeypatch.setattr(settings.wrappers, "path", str(tmp_path / "wrappers.sqlite3"))
+    store = WrapperStore()
+    wrapper_run = WrapperRun("word.example", html, None, None, OUTCOME_MISS)
+    assert store.learn(wrapper_run, {"title": "Super Widget"}) == OUTCOME_MISS
+    assert store.describe("word.example")[0]["candidate"]["support"] == 1
+
+    def fail(page, results):
+        raise ValueError("induction failed")
+
+    monkeypatch.setattr(wrappers, "induce_rules", fail)
+    assert store.learn(wrapper_run, {"title": "Super Widget"}) == OUTCOME_MISS
+    store.close()
+
+
+def test_admin_wrappers_need_a_key():
+    """
+    Tests that the wrapper admin API is behind the API key, and answers with
+    the wrappers (or 404 when wrapper induction is disabled) for a valid key.
+    """
+    admin_url = SERVICE_URL.replace("/extract", "/admin/wrappers")
+    response = httpx.get(admin_url, timeout=30.0)
+    assert response.status_code in (401, 403)
+
+    response = httpx.get(admin_url, headers=HEADERS, timeout=30.0)
+    assert response.status_code in (200, 404)
+    if response.status_code == 200:
+        assert isinstance(response.json()["wrappers"], list)
+
+
+def test_html_cleaner_removes_noise_in_one_pass():
+    """
+    Tests that the single-pass HTML cleaner removes the noise tags, the noise
+    selectors' subtrees, comments and tags without visible text, keeps the
+    preserved empty tags and ruby text, and stays linear on deeply nested
+    wrappers.
+    """
+    from bs4 import BeautifulSoup
+    from app.utils.html_processor import clean_soup_for_extraction
+
+    html = (
+        '<html><head><title>Shop</title><style>.x{}</style></head><body><header>Top</header><!-- note -->'
+        '<div class="card"><span></span><p> <b>\xa0</b> </p><img src="a.jpg"><br><h1>Name</h1>'
+        "<script>x = 1</script><button>Buy</button><svg><text>icon</text></svg></div>"
+        '<div class="sidebar">Ads</div><div><div> </div></div><ruby>漢<rt>kan</rt></ruby></body></html>'
+    )
+    assert str(clean_soup_for_extraction(BeautifulSoup(html, "lxml")).body) == (
+        '<body><div class="card"><img src="a.jpg"/><br/><h1>Name</h1></div><ruby>漢<rt>kan</rt></ruby></body>'
+    )
+    html = (
+        '<html><body><div class="pager x">Page <a href="/2">2</a></div>'
+        '<div class="breadcrumb-trail"><a href="/">Home</a></div><ul><li>\xa0</li><li><b>Bold</b> <!-- hidden --></li></ul>'
+        "<template><p>Quick</p></template><section><p>Kept</p><p>\n</p></section><p><i></i>x</p></body></html>"
+    )
+    assert str(clean_soup_for_extraction(BeautifulSoup(html, "lxml")).body) == (
+        "<body><ul><li><b>Bold</b> </li></ul><section><p>Kept</p></section><p>x</p></body>"
+    )
+
+    opening = "".join(f'<div class="level-{level}"><span></span>' for level in range(300))
+    nested_html = f"<html><body>{opening}<p>Deep text</p>{'</div>' * 300}<div><div></div></div></body></html>"
+    nested = clean_soup_for_extraction(BeautifulSoup(nested_html, "lxml"))
+    assert nested.body.get_text(strip=True) == "Deep text"
+    assert not nested.find("span")
+    assert len(nested.find_all("div")) == 300
+
+
+def test_noise_matcher_indexes_simple_selectors_and_matches_soupsieve():
+    """
+    Tests that the noise matcher indexes the tag, id, class and attribute
+    selectors, leaves the others to one soupsieve select, is compiled once per
+    selector list, and finds exactly the elements soup.select finds.
+    """
+    from bs4 import BeautifulSoup
+    from app.utils.noise_matcher import NoiseMatcher, get_noise_matcher, reload_noise_matchers
+
+    selectors = [
+        "header", "DIV.card", "#main", ".pager.x", '[class*="breadcrumb"]', "[class~=x]",
+        "[class|=pager]", '[class^=""]', "[TYPE=Text]", "[data-id]", "[class!=ad]",
+        "span, .hidden", "ul > li", "li:first-child", ".sidebar :not(b)", "*:empty",
+    ]
+    matcher = NoiseMatcher(selectors + ["div[", lambda tag: tag.name == "aside"])
+    assert matcher.describe() == {
+        "selectors": 18,
+        "indexed": 12,
+        "fallback": ["ul > li", "li:first-child", ".sidebar :not(b)", "*:empty"],
+        "functions": 1,
+    }
+
+    reload_noise_matchers()
+    assert get_noise_matcher(["header"]) is get_noise_matcher(["header"])
+    assert get_noise_matcher(["header"]) is not get_noise_matcher(["footer"])
+
+    soup = BeautifulSoup(
+        '<html><body><header id="h">Top</header><div id="d1" class="card">'
+        '<span id="s1" class="pager x">1</span><input id="i1" type="text"><p id="p1" class="pager-next" data-id="7"></p></div>'
+        '<div id="main" class="ad"><ul id="u1"><li id="l1">a</li><li id="l2" class="hidden">b</li></ul></div>'
+        '<div id="d2" class="sidebar x"><b id="b1">c</b><i id="e1">d</i></div><nav id="n1" class="breadcrumb-trail"></nav></body></html>',
+        "lxml",
+    )
+    expected = {
+        "header": ["h"],
+        "DIV.card": ["d1"],
+        "#main": ["main"],
+        ".pager.x": ["s1"],
+        '[class*="breadcrumb"]': ["n1"],
+        "[class~=x]": ["s1", "d2"],
+        "[class|=pager]": ["p1"],
+        '[class^=""]': [],
+        "[TYPE=Text]": ["i1"],
+        "[data-id]": ["p1"],
+        "[class!=ad]": ["html", "body", "h", "d1", "s1", "i1", "p1", "u1", "l1", "l2", "d2", "b1", "e1", "n1"],
+        "span, .hidden": ["s1", "l2"],
+        "ul > li": ["l1", "l2"],
+        "li:first-child": ["l1"],
+        ".sidebar :not(b)": ["e1"],
+        "*:empty": ["i1", "p1", "n1"],
+    }
+    for selector in selectors:
+        is_noise = NoiseMatcher([selector]).bind(soup)
+        matched = [element.get("id", element.name) for element in soup.find_all(True) if is_noise(element)]
+        assert matched == expected[selector], selector
+        assert [element.get("id", element.name) for element in soup.select(selector)] == matched, selector
+
+
+def test_streaming_ingestion_drops_noise_and_bounds_the_tree(monkeypatch):
+    """
+    Tests that the streaming builder never builds the noise subtrees (but keeps
+    JSON-LD), truncates at its node and byte ceilings, and that the document
+    streams pages from the threshold on.
+    """
+    from bs4 import BeautifulSoup
+    from app.config import settings
+    from app.core.document import PageDocument
+    from app.core.ingestion import StreamingTreeBuilder
+    from app.utils.html_processor import clean_soup_for_extraction
+
+    html = (
+        "<html><head><style>p{}</style></head><body><svg><path d=\"M0\"/></svg><script>x = 1</script>"
+        '<script type="application/ld+json">{"@type": "Product"}</script>'
+        "<template><p>Quick view</p></template><p>Keep</p></body></html>"
+    )
+    builder = StreamingTreeBuilder(max_nodes=10**6, max_bytes=10**9, chunk_size=16)
+    soup = BeautifulSoup(html, builder=builder)
+    assert [tag.name for tag in soup.find_all(True)] == ["html", "head", "body", "script", "p"]
+    assert soup.script["type"] == "application/ld+json" and soup.p.string == "Keep"
+    assert builder.stats == {"kept_nodes": 5, "dropped_nodes": 6, "fed_bytes": len(html), "truncated": False}
+    assert str(clean_soup_for_extraction(soup)) == "<html><body><p>Keep</p></body></html>"
+
+    icon = "<svg>" + '<path d="M0 0"/>' * 20 + "</svg>"
+    html = "<html><body>" + "".join(
+        f'<div class="card">{icon}<h3>Product {n}</h3><span class="price">{n},99</span></div>' for n in range(50)
+    ) + "</body></html>"
+    builder = StreamingTreeBuilder(max_nodes=100, max_bytes=10**9, chunk_size=1024)
+    soup = BeautifulSoup(html, builder=builder)
+    assert builder.stats["truncated"] and builder.stats["kept_nodes"] == 100
+    assert len(soup.find_all(True)) == 100
+
+    builder = StreamingTreeBuilder(max_nodes=10**6, max_bytes=4096, chunk_size=1024)
+    BeautifulSoup(html, builder=builder)
+    assert builder.stats["truncated"] and builder.stats["fed_bytes"] == 4096
+
+    monkeypatch.setattr(settings.ingestion, "streaming_threshold_bytes", len(html))
+    document = PageDocument(html)
+    assert document.raw_dom.find("svg") is None and len(document.raw_dom.find_all("h3")) == 50
+    assert document.stats["streamed"] and document.stats["dropped_nodes"] == 50 * 21
+    assert PageDocument(html[:-1]).raw_dom.find("svg") is not None
+    # The threshold counts encoded bytes, not characters
+    accented = "<p>" + "é" * (len(html) // 2) + "</p>"
+    document = PageDocument(accented)
+    assert len(accented) < len(html) and document.raw_dom.p and document.stats["streamed"]
+
+
+def test_head_scan_collects_structured_data_without_parsing():
+    """
+    Tests that the head-only scan keeps the JSON-LD scripts (also from the body),
+    the html tag, the title and the head meta tags, and skips comments and the
+    content of other scripts.
+    """
+    from bs4 import BeautifulSoup
+    from app.core.head_only import scan_head
+
+    html = (
+        '<!DOCTYPE html><html lang="nl"><head><!-- <meta property="og:title" content="old"> -->'
+        "<title>Widget &amp; Co</title>"
+        '<script>document.write(\'<meta property="og:title" content="js">\')</script>'
+        '<meta property="og:title" content="Widget">'
+        '<meta name="description" content="A widget">'
+        '<script type="application/ld+json">{"@type": "Product", "name": "Widget"}</script>'
+        '</head><body><meta property="og:image" content="body.jpg"><h1>Widget</h1>'
+        '<script type="application/ld+json">{"@type": "BreadcrumbList"}</script></body></html>'
+    )
+    scan = scan_head(html)
+    assert scan.describe() == {"json_ld_scripts": 2, "metas": 2, "structured_metas": 1, "title": True}
+
+    soup = BeautifulSoup(scan.html, "lxml")
+    assert soup.html["lang"] == "nl"
+    assert soup.title.string == "Widget & Co"
+    assert [meta["content"] for meta in soup.find_all("meta")] == ["Widget", "A widget"]
+    assert len(soup.find_all("script", type="application/ld+json")) == 2
+    assert not soup.body.contents
+    assert not scan_head("<html><head><title>Plain</title></head><body></body></html>").has_structured_data
+
+
+def test_json_ld_index_resolves_graphs_and_recovers_malformed_scripts():
+    """
+    Tests that malformed JSON-LD scripts are recovered, that the index flattens
+    an '@graph' and resolves its '@id' references, and that it reads the same
+    values from the flat, malformed scripts of that '@graph'.
+    """
+    from app.modules.json_ld.index import JsonLdIndex
+    from app.modules.json_ld.utils import decode_json_ld
+
+    product = {"@type": "Product", "name": "A", "offers": [1, 2]}
+    for text in (
+        '{"@type": "Product", "name": "A", "offers": [1, 2,],}',
+        '<!--\n{"@type": "Product", "name": "A", "offers": [1, 2]}\n-->',
+        '<![CDATA[{"@type": "Product", "name": "A", "offers": [1, 2]}]]>',
+        '/* generated */ {"@type": "Product", // the page\n"name": "A", "offers": [1, 2]};',
+        "{&quot;@type&quot;: &quot;Product&quot;, &quot;name&quot;: &quot;A&quot;, &quot;offers&quot;: [1, 2]}",
+    ):
+        assert decode_json_ld(text) == product, text
+    assert decode_json_ld('{"name": "A\nB"}\n{"name": "C"}') == [{"name": "A\nB"}, {"name": "C"}]
+    with pytest.raises(ValueError):
+        decode_json_ld('{"name": ')
+
+    graph = {
+        "@context": "https://schema.org",
+        "@graph": [
+            {"@type": "Organization", "name": "Shop"},
+            {"@id": "#brand", "@type": "Brand", "name": "Acme"},
+            {"@id": "#offer", "@type": "Offer", "price": "9.99"},
+            {"@id": "#product", "@type": ["Product", "Thing"], "name": "Widget",
+             "brand": {"@id": "#brand"}, "offers": [{"@id": "#offer"}]},
+        ],
+    }
+    json_ld_index = JsonLdIndex([graph])
+    assert len(json_ld_index) == 1 and json_ld_index[0] is graph
+    assert json_ld_index.product["name"] == "Widget"
+    assert json_ld_index.offers == [{"@id": "#offer", "@type": "Offer", "price": "9.99"}]
+    assert json_ld_index.resolve(json_ld_index.product["brand"])["name"] == "Acme"
+    assert json_ld_index.first("Organization")["name"] == "Shop"
+
+    scripts = [
+        '<!--\n{"@context": "https://schema.org", "@type": "Organization", "name": "Shop"}\n-->',
+        '{"@context": "https://schema.org", "@type": "Product", "name": "Widget",'
+        ' "brand": {"@type": "Brand", "name": "Acme"}, "offers": {"@type": "Offer", "price": "9.99"},}',
+    ]
+    json_ld_index = JsonLdIndex([decode_json_ld(script) for script in scripts])
+    assert json_ld_index.product["name"] == "Widget"
+    assert json_ld_index.offers == [{"@type": "Offer", "price": "9.99"}]
+    assert json_ld_index.resolve(json_ld_index.product["brand"])["name"] == "Acme"
+    assert json_ld_index.first("Organization")["name"] == "Shop"
+
+
+def test_document_memo_computes_each_fact_once_per_node():
+    """
+    Tests that the document memo returns the same facts as computing them
+    directly, computes each one once per node, and keeps the views apart.
+    """
+    from app.core.context import ExtractionContext, shared_context
+    from app.core.document import PageDocument
+    from app.modules.brand.utils import check_brand_in_main_title, get_main_title_content
+
+    html = (
+        "<html><head><title>Shop title</title></head><body>"
+        "<h1> Acme  Widget </h1><h1>Other</h1>"
+        '<div class="product"><img src="https://x.example/a.jpg"><img src="/relative.jpg"></div>'
+        "<p>Only 9,99</p></body></html>"
+    )
+    document = PageDocument(html)
+    document.memo.count_hits = True
+    context = ExtractionContext(document, "https://x.example/p", "en", False, {}, set())
+    with shared_context.scope(context):
+        soup = document.raw_dom
+        assert get_main_title_content(soup) == ("Acme  Widget", "h1")
+        for candidate in ("Acme", "Widget", "Globex"):
+            check_brand_in_main_title(candidate, soup)
+        assert document.memo.describe()["misses"]["main_title"] == 1
+        assert document.memo.describe()["hits"]["main_title"] == 3
+
+        memo = document.memo
+        assert memo.body_text(soup) == soup.body.get_text(strip=True)
+        assert memo.h1s(soup) == soup.find_all("h1")
+        assert [img["src"] for img in memo.images(soup)] == ["https://x.example/a.jpg"]
+        assert memo.text(soup.h1) is memo.text(soup.h1)
+
+        # The cleaned view is a different tree: its facts are its own
+        assert memo.h1s(document.clean_dom)[0] is not memo.h1s(soup)[0]
+
+    document.release()
+    assert not document.memo._entries
+
+
+def test_token_index_matches_bs4_find_all():
+    """
+    Tests that the token index answers lookups by tag name, class, id and
+    itemprop the way bs4's find_all() does: class rules match a token or the
+    joined class string, name regexes search inside names, limits keep the
+    first matches and scoped lookups only see descendants.
+    """
+    import re
+    from bs4 import BeautifulSoup
+    from app.core.token_index import TokenIndex
+
+    soup = BeautifulSoup(
+        '<html><body><div class="card price">a</div><span class="price old" id="s1">b</span>'
+        '<table><tbody><tr><td id="x1">c</td></tr></tbody></table><b class="">d</b>'
+        '<p itemprop="brand">e</p></body></html>',
+        "lxml",
+    )
+    index = TokenIndex(soup)
+
+    def names(elements):
+        return [element.name for element in elements]
+
+    assert names(index.find_all(None, class_="price")) == ["div", "span"]
+    assert names(index.find_all(None, class_="card price")) == ["div"]
+    assert names(index.find_all(None, class_=re.compile("price old"))) == ["span"]
+    assert names(index.find_all(None, re.compile("b"))) == ["body", "table", "tbody", "b"]
+    assert names(index.find_all(soup.table, re.compile("t"))) == ["tbody", "tr", "td"]
+    assert names(index.find_all(None, True, limit=3)) == ["html", "body", "div"]
+    assert names(index.find_all(None, id=re.compile(r"\d"))) == ["span", "td"]
+    assert names(index.find_all(None, itemprop="brand")) == ["p"]
+    # An empty class attribute still counts as present, and matches the empty string
+    assert names(index.find_all(None, "b", class_=True)) == ["b"]
+    assert names(index.find_all(None, class_=re.compile("^$"))) == ["b"]
+    assert names(index.find_all(None, class_=["card", re.compile("old")], limit=1)) == ["div"]
+    assert names(index.find_all(None, ["td", "p"])) == ["td", "p"]
+    # A lookup the index cannot evaluate is run by bs4
+    assert names(index.find_all(None, lambda tag: tag.name == "td")) == ["td"]
+
+
+def test_lxml_dom_reads_pages_like_bs4(monkeypatch):
+    """
+    Tests that the lxml backend of the DOM abstraction, when configured,
+    answers like bs4 (multi-valued attributes, text without comments or
+    scripts, collapsed whitespace, element-only navigation, selectors scoped
+    to descendants), and that bs4 takes over where lxml cannot serve.
+    """
+    import re
+    from app.config import settings
+    from app.core.document import PageDocument
+    from app.core.dom import DomNode
+
+    # A backend that leaves out part of the interface cannot be instantiated
+    assert {"find_all", "select", "get_text", "string", "text_nodes"} <= DomNode.__abstractmethods__
+    with pytest.raises(TypeError):
+        type("IncompleteNode", (DomNode,), {"find_all": lambda self, *args, **kwargs: []})()
+
+    html = (
+        '<!DOCTYPE html><html><body><div class="product  main" id="p"><h1> Widget </h1><!-- note -->'
+        "<p>9,<b>99</b></p><pre>  </pre><script>var x = 1</script>\n<ul><li>a</li> <li>b</li></ul></div></body></html>"
+    )
+    assert settings.dom.backend == "bs4" and PageDocument(html).dom.tree.backend == "bs4"
+    monkeypatch.setattr(settings.dom, "backend", "lxml")
+    document = PageDocument(html)
+    dom = document.dom
+    assert document.stats["dom_backend"] == "lxml" and document.stats["parse_count"] == 1
+    div = dom.find("div", class_="main")
+    assert div["class"] == ["product", "main"] and div.get("id") == "p"
+    assert div.get_text("|", strip=True) == "Widget|9,|99|a|b"
+    assert [text for text, _ in div.text_nodes()] == [" Widget ", " note ", "9,", "99", "  ", "var x = 1", "\n", "a", " ", "b"]
+    assert dom.find("script").string == "var x = 1"
+    first_item = dom.find("li")
+    assert first_item.next_sibling.get_text() == "b" and first_item.parent.name == "ul"
+    assert dom.find("h1").previous_sibling is None and dom.find("h1") is dom.find("h1")
+    assert [child.name for child in div.children] == ["h1", "p", "pre", "script", "ul"]
+    assert len(dom.select("div li")) == 2 and first_item.select("li") == []
+    assert dom.find("b").find_parent("div") is div
+    assert div.find_all("li", recursive=False) == []
+    assert [node.name for node in dom.find_all(re.compile("^(h|p)"))] == ["html", "h1", "p", "pre"]
+    assert [node.name for node in dom.select("h1, li")] == ["h1", "li", "li"]
+    assert [node.get_text() for node in dom.find_all(["b", "li"], limit=2)] == ["99", "a"]
+    assert dom.find("ul").get_text("|") == "a| |b" and dom.find("p").string is None
+
+    assert PageDocument("").dom.tree.backend == "bs4"
+    monkeypatch.setattr(settings.ingestion, "streaming_threshold_bytes", 1024)
+    streamed = PageDocument("<html><body>" + "<p>Product</p>" * 100 + "</body></html>")
+    assert streamed.dom.tree.backend == "bs4" and streamed.stats["streamed"]
+    assert streamed.stats["parse_count"] == 1
+
+
+def test_a_full_analysis_parses_the_page_once(test_case_dir: Path):
+    """
+    Tests that with the default configuration a full analysis (all fields)
+    parses the page once: the DOM view of the ported modules shares the tree
+    of the modules that still read the BeautifulSoup raw DOM.
+    """
+    # A unique comment makes sure the page is analyzed instead of served from the cache
+    html_content = (test_case_dir / "input.html").read_text(encoding="utf-8") + f"<!-- {uuid.uuid4()} -->"
+    payload = {
+        "html_content": html_content,
+        "url": f"http://example.com/{test_case_dir.name}",
+        "include_timings": True,
+    }
+    response = httpx.post(SERVICE_URL, json=payload, headers=HEADERS, timeout=30.0)
+    assert response.status_code == 200
+    document = response.json()["timings"]["document"]
+    assert document["parse_count"] == 1 and document["dom_backend"] == "bs4"